@@ -13,11 +13,19 @@ import logging
 __version__ = "3.10.0"
 
 
-from bailo.core.agent import Agent, PkiAgent, TokenAgent
+from bailo.core.agent import Agent, PkiAgent, RetryPolicy, TokenAgent
+from bailo.core.async_agent import AsyncAgent, AsyncPkiAgent, AsyncTokenAgent
+from bailo.core.async_client import AsyncClient
 from bailo.core.client import Client
 from bailo.core.enums import EntryKind, ModelVisibility, Role, SchemaKind
+from bailo.core.identity_map import IdentityMap
+from bailo.core.instrumentation import LatencyHistogram, RequestObserver
+from bailo.core.json_codec import JsonCodec
+from bailo.core.rate_limit import RateLimiter
+from bailo.core.response_cache import ResponseCache
 from bailo.helper.access_request import AccessRequest
 from bailo.helper.datacard import Datacard
+from bailo.helper.download_cache import DownloadCache
 from bailo.helper.mirroredModel import MirroredModel
 from bailo.helper.model import Experiment, Model
 from bailo.helper.release import Release
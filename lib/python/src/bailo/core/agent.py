@@ -1,19 +1,172 @@
 from __future__ import annotations
 
+import contextlib
 import getpass
 import logging
 import os
+import random
+import time
+from email.utils import parsedate_to_datetime
 from json import JSONDecodeError
+from typing import Any, NoReturn
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 # isort: split
 
 from bailo.core.exceptions import BailoException, ResponseException
+from bailo.core.instrumentation import RequestEvent, RequestObserver
+from bailo.core.json_codec import JsonCodec, get_codec
+from bailo.core.rate_limit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# methods which can safely be repeated, as defined by RFC 9110
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# connections kept open per host, matching the requests default
+POOL_MAXSIZE = 10
+
+
+def _raise_for_response(method: str, res: Any) -> NoReturn:
+    """Map an error response (status code of 400 or above) to a Python Bailo error.
+
+    Shared by the synchronous and asynchronous agents, so `res` only needs `status_code`, `json()` and `request.url`.
+
+    :param method: HTTP method name (e.g. 'GET', 'POST' etc.).
+    :param res: Response object with an error status code.
+    :raises BailoException: If Bailo instance returns an error.
+    :raises ResponseException: Non-JSON error responses.
+    """
+    try:
+        payload = res.json()
+        error_body = payload.get("error", {})
+        message = error_body.get("message", "Unknown API error")
+        context = error_body.get("context")
+        raise BailoException(message=message, status_code=res.status_code, context=context)
+    except JSONDecodeError as e:
+        raise ResponseException(f"{res.status_code} Cannot {method} to {res.request.url}") from e
+
+
+def _resolve_key(key: str | None, name: str, env_var: str) -> str:
+    """Resolve an API token key, falling back to an environment variable and then user input.
+
+    :param key: Key provided by the caller, or None to look it up.
+    :param name: Human-readable key name used in logs and prompts (e.g. 'Access key').
+    :param env_var: Environment variable to try before prompting.
+    :return: The resolved key.
+    """
+    if key is not None:
+        return key
+
+    logger.info("%s not provided. Trying other sources...", name)
+    try:
+        key = os.environ[env_var]
+        logger.info("%s acquired from %s environment variable.", name, env_var)
+    except KeyError:
+        logger.info("%s not found in %s environment variable. Requires user input.", name, env_var)
+        key = getpass.getpass(f"BAILO {name.upper()}:")
+        logger.info("%s acquired from user input.", name)
+
+    return key
+
+
+def _body_position(body: Any) -> int | None:
+    """Private function. Get the current position of a streamed request body, so it can be rewound for a retry.
+
+    :param body: The `data` argument of a request
+    :return: Position in bytes, or None if the body is not a seekable stream
+    """
+    if not (hasattr(body, "seek") and hasattr(body, "tell")):
+        return None
+    try:
+        return body.tell()
+    except (OSError, ValueError):
+        return None
+
+
+def _rewind(body: Any, position: int | None) -> bool:
+    """Private function. Prepare a request body to be sent again.
+
+    :param body: The `data` argument of a request
+    :param position: Position of the body before the first attempt, from :func:`_body_position`
+    :return: True if the body can be sent again, otherwise False (e.g. for generators and unseekable streams)
+    """
+    if body is None or isinstance(body, (bytes, bytearray, str, dict, list, tuple)):
+        return True
+    if position is None:
+        return False
+    body.seek(position)
+    return True
+
+
+class RetryPolicy:
+    """Policy for retrying requests which fail with a transient error, used by :class:`Agent`.
+
+    Connection errors, timeouts and responses with one of `status_codes` are retried, for `methods` only, with
+    exponential backoff and full jitter. A `Retry-After` header sent with the response is honoured instead. Requests
+    with a streamed body (e.g. a file) are rewound before being sent again, or are not retried if the body cannot be
+    rewound.
+
+    >>> agent = Agent(retry=RetryPolicy(max_attempts=5, backoff=1.0))
+
+    :param max_attempts: Maximum number of attempts per request, including the first, defaults to 3. Set to 1 to
+        disable retries
+    :param backoff: Upper bound in seconds of the delay before the first retry, doubling for each further retry,
+        defaults to 0.5
+    :param max_backoff: Maximum upper bound in seconds of the backoff delay, defaults to 30.0
+    :param methods: HTTP methods which may be retried, defaults to IDEMPOTENT_METHODS
+    :param status_codes: Response status codes which are retried, defaults to RETRY_STATUS_CODES (429 and 5xx)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        methods: frozenset[str] = IDEMPOTENT_METHODS,
+        status_codes: frozenset[int] = RETRY_STATUS_CODES,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = methods
+        self.status_codes = status_codes
+
+    def should_retry(self, method: str, attempt: int, res: Any = None) -> bool:
+        """Decide whether a failed attempt should be retried.
+
+        :param method: HTTP method name (e.g. 'GET', 'POST' etc.).
+        :param attempt: Number of the attempt which failed, starting from 1.
+        :param res: Error response, or None if the attempt raised a connection error or timeout.
+        :return: True if the request should be retried.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        return res is None or res.status_code in self.status_codes
+
+    def delay(self, attempt: int, res: Any = None) -> float:
+        """Get the delay before the next attempt.
+
+        :param attempt: Number of the attempt which failed, starting from 1.
+        :param res: Error response, or None if the attempt raised a connection error or timeout.
+        :return: Delay in seconds, from the response's `Retry-After` header if sent, otherwise randomised backoff.
+        """
+        retry_after = res.headers.get("Retry-After") if res is not None else None
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
 
 class Agent:
     """Base API Agent for talking with Bailo.
@@ -26,17 +179,81 @@ class Agent:
     def __init__(
         self,
         verify: str | bool = True,
+        retry: RetryPolicy | None = None,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = False,
+        pool_connections: int = 10,
+        keep_alive: bool = True,
+        host_pool_maxsize: dict[str, int] | None = None,
+        observers: list[RequestObserver] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        json_codec: JsonCodec | str | None = None,
     ):
         """Initiate a standard agent.
 
         :param verify: Path to certificate authority file, or bool for SSL verification.
+        :param retry: Policy for retrying transient failures, defaults to RetryPolicy() (up to 3 attempts of
+            idempotent requests)
+        :param pool_maxsize: Maximum number of connections kept open to each host, defaults to 10. Set this to at
+            least the number of threads sharing the agent, so concurrent requests reuse warm connections
+        :param pool_block: Wait for a pooled connection once `pool_maxsize` are in use, rather than opening (and then
+            discarding) an extra one, defaults to False
+        :param pool_connections: Number of hosts to keep connection pools for, defaults to 10
+        :param keep_alive: Keep connections open for reuse between requests, defaults to True
+        :param host_pool_maxsize: Per-host overrides of `pool_maxsize`, keyed by URL prefix (e.g.
+            {"https://bailo.example.com": 32}), defaults to None
+        :param observers: Observers notified at the start and end of every request, e.g. a
+            :class:`~bailo.core.instrumentation.LatencyHistogram`, defaults to None
+        :param rate_limiter: Limiter waited on before each attempt of a request, which may be shared with other
+            agents, threads or processes, defaults to None
+        :param json_codec: Codec (or name of a built-in codec) encoding `json=` request bodies and decoding responses,
+            defaults to the fastest installed of orjson, msgspec and the standard library
         """
         self.verify = verify
+        self.json_codec = json_codec if isinstance(json_codec, JsonCodec) else get_codec(json_codec)
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.observers = list(observers or [])
+        self.rate_limiter = rate_limiter
         # reuse session for performance improvement
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        for prefix, maxsize in (host_pool_maxsize or {}).items():
+            self.session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=maxsize, pool_block=pool_block))
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def pool_metrics(self) -> list[dict[str, Any]]:
+        """Get the utilisation of each open connection pool.
+
+        :return: One dictionary per host pool, with its `scheme`, `host`, `port`, `maxsize`, connections `in_use`
+            and `idle` (open and ready for reuse), and the total `connections_opened` and `requests` made through it
+        """
+        metrics = []
+        for adapter in dict.fromkeys(self.session.adapters.values()):
+            for key in adapter.poolmanager.pools.keys():
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+                # the queue holds idle connections, and None for each slot a connection has not been opened in
+                queue = pool.pool
+                metrics.append(
+                    {
+                        "scheme": pool.scheme,
+                        "host": pool.host,
+                        "port": pool.port,
+                        "maxsize": queue.maxsize,
+                        "in_use": queue.maxsize - queue.qsize(),
+                        "idle": sum(conn is not None for conn in list(queue.queue)),
+                        "connections_opened": pool.num_connections,
+                        "requests": pool.num_requests,
+                    }
+                )
+        return metrics
 
     def __request(self, method, *args, **kwargs):
-        """Private method. Make an HTTP request with error handling.
+        """Private method. Make an HTTP request with error handling, retrying transient failures.
 
         :param method: HTTP method name (e.g. 'GET', 'POST' etc.).
         :param *args: Positional arguments to requests.request.
@@ -46,21 +263,84 @@ class Agent:
         :return: Response object.
         """
         kwargs["verify"] = self.verify
-
-        res = self.session.request(method, *args, **kwargs)
+        if kwargs.get("json") is not None:
+            # encode once up front, so retries resend the same bytes
+            kwargs["data"] = self.json_codec.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+
+        event = RequestEvent(method, args[0] if args else kwargs["url"])
+        self.__notify("on_request_start", event)
+        start = time.perf_counter()
+        try:
+            res = self.__send(method, event, *args, **kwargs)
+            event.record_response(res)
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            event.latency = time.perf_counter() - start
+            self.__notify("on_request_end", event)
 
         # Check response for a valid range
         if res.status_code < 400:
             return res
 
-        try:
-            payload = res.json()
-            error_body = payload.get("error", {})
-            message = error_body.get("message", "Unknown API error")
-            context = error_body.get("context")
-            raise BailoException(message=message, status_code=res.status_code, context=context)
-        except JSONDecodeError as e:
-            raise ResponseException(f"{res.status_code} Cannot {method} to {res.request.url}") from e
+        _raise_for_response(method, res)
+
+    def __send(self, method, event, *args, **kwargs):
+        """Private method. Send an HTTP request, retrying transient failures according to the retry policy.
+
+        :param method: HTTP method name (e.g. 'GET', 'POST' etc.).
+        :param event: Event of the request, whose retry count is updated.
+        :param *args: Positional arguments to requests.request.
+        :param **kwargs: Keyword arguments to requests.request.
+        :return: Response object of the last attempt, which may have an error status code.
+        """
+        body = kwargs.get("data")
+        position = _body_position(body)
+
+        attempt = 1
+        while True:
+            try:
+                # in-flight slots are held until the response headers arrive, not while streaming the body
+                with self.rate_limiter.acquire() if self.rate_limiter is not None else contextlib.nullcontext():
+                    res = self.session.request(method, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not (self.retry.should_retry(method, attempt) and _rewind(body, position)):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning("%s request failed (attempt %d): %s. Retrying in %.1fs...", method, attempt, e, delay)
+            else:
+                if res.status_code < 400:
+                    return res
+                if not (self.retry.should_retry(method, attempt, res) and _rewind(body, position)):
+                    return res
+                delay = self.retry.delay(attempt, res)
+                res.close()
+                logger.warning(
+                    "%s %s returned %d (attempt %d). Retrying in %.1fs...",
+                    method,
+                    res.url,
+                    res.status_code,
+                    attempt,
+                    delay,
+                )
+
+            time.sleep(delay)
+            attempt += 1
+            event.retries += 1
+
+    def __notify(self, hook: str, event: RequestEvent) -> None:
+        """Private method. Call a hook of every observer, logging rather than raising any errors.
+
+        :param hook: Name of the :class:`RequestObserver` method to call.
+        :param event: Event of the request.
+        """
+        for observer in self.observers:
+            try:
+                getattr(observer, hook)(event)
+            except Exception:
+                logger.exception("Request observer %r failed in %s.", observer, hook)
 
     def get(self, *args, **kwargs):
         """Make a GET request. See :func:`__request` for parameters.
@@ -143,25 +423,8 @@ class TokenAgent(Agent):
         """
         super().__init__(**kwargs)
 
-        if access_key is None:
-            logger.info("Access key not provided. Trying other sources...")
-            try:
-                access_key = os.environ["BAILO_ACCESS_KEY"]
-                logger.info("Access key acquired from BAILO_ACCESS_KEY environment variable.")
-            except KeyError:
-                logger.info("Access key not found in BAILO_ACCESS_KEY environment variable. Requires user input.")
-                access_key = getpass.getpass("BAILO ACCESS KEY:")
-                logger.info("Access key acquired from user input.")
-
-        if secret_key is None:
-            logger.info("Secret key not provided. Trying other sources...")
-            try:
-                secret_key = os.environ["BAILO_SECRET_KEY"]
-                logger.info("Secret key acquired from BAILO_SECRET_KEY environment variable.")
-            except KeyError:
-                logger.info("Secret key not found in BAILO_SECRET_KEY environment variable. Requires user input.")
-                secret_key = getpass.getpass("BAILO SECRET KEY:")
-                logger.info("Secret key acquired from user input.")
+        access_key = _resolve_key(access_key, "Access key", "BAILO_ACCESS_KEY")
+        secret_key = _resolve_key(secret_key, "Secret key", "BAILO_SECRET_KEY")
 
         self.access_key = access_key
         self.secret_key = secret_key
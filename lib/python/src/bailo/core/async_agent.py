@@ -0,0 +1,210 @@
+"""Asyncio-native agents for talking with Bailo.
+
+.. note:: Requires the optional async dependencies (``pip install bailo[async]``)
+"""
+
+from __future__ import annotations
+
+import ssl
+from collections.abc import AsyncIterator
+from typing import Any
+
+try:
+    import httpx
+
+    HTTPX = True
+except ImportError:
+    HTTPX = False
+
+# isort: split
+
+from bailo.core.agent import _raise_for_response, _resolve_key
+from bailo.core.json_codec import JsonCodec, get_codec
+
+ASYNC_BLOCK_SIZE = 64 * 1024
+
+
+async def _iter_file(data: Any) -> AsyncIterator[bytes]:
+    """Private function. Adapt a blocking file-like object into an async byte stream for httpx.
+
+    :param data: File-like object exposing `read`.
+    :return: Async iterator over chunks of the file.
+    """
+    while chunk := data.read(ASYNC_BLOCK_SIZE):
+        yield chunk
+
+
+class AsyncAgent:
+    """Base asyncio API Agent for talking with Bailo.
+
+    Mirrors :class:`bailo.core.agent.Agent`, but each HTTP method is a coroutine backed by one shared
+    `httpx.AsyncClient`, so many requests can be awaited concurrently (e.g. with `asyncio.gather`) on one event loop.
+    Error responses are mapped to the same Python Bailo errors as the synchronous agent.
+
+    .. automethod:: __request
+    """
+
+    def __init__(
+        self,
+        verify: str | bool | ssl.SSLContext = True,
+        json_codec: JsonCodec | str | None = None,
+        **kwargs,
+    ):
+        """Initiate a standard async agent.
+
+        :param verify: Path to certificate authority file, SSL context, or bool for SSL verification.
+        :param json_codec: Codec (or name of a built-in codec) encoding `json=` request bodies and decoding responses,
+            defaults to the fastest installed of orjson, msgspec and the standard library
+        :param **kwargs: Kwargs passed to `httpx.AsyncClient` (e.g. `limits` or `transport`)
+        :raises ImportError: If the optional async dependencies are not installed.
+        """
+        if not HTTPX:
+            raise ImportError("Optional async dependencies (needed for this class) are not installed.")
+
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+
+        self.verify = verify
+        self.json_codec = json_codec if isinstance(json_codec, JsonCodec) else get_codec(json_codec)
+        # reuse session for performance improvement
+        self.session = httpx.AsyncClient(verify=verify, **kwargs)
+
+    async def __request(self, method, url, **kwargs):
+        """Private method. Make an HTTP request with error handling.
+
+        Accepts the same keyword arguments that :class:`bailo.core.client.Client` passes to `requests`, translating
+        them for `httpx`. Responses requested with `stream=True` are returned unread, so must be consumed with
+        `aiter_bytes()` and closed with `aclose()` by the caller.
+
+        :param method: HTTP method name (e.g. 'GET', 'POST' etc.).
+        :param url: URL to request.
+        :param **kwargs: Keyword arguments in `requests.request` form.
+        :raises BailoException: If Bailo instance returns an error.
+        :raises ResponseException: Non-JSON error responses.
+        :return: Response object.
+        """
+        stream = kwargs.pop("stream", False)
+
+        params = kwargs.pop("params", None)
+        if params is not None:
+            # requests drops None-valued params and stringifies bools as "True"/"False"
+            params = {k: str(v) if isinstance(v, bool) else v for k, v in params.items() if v is not None}
+
+        data = kwargs.pop("data", None)
+        if data is not None:
+            kwargs["content"] = _iter_file(data) if hasattr(data, "read") else data
+
+        if kwargs.get("json") is not None:
+            kwargs["content"] = self.json_codec.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+
+        auth = kwargs.pop("auth", None)
+        req = self.session.build_request(method, url, params=params, **kwargs)
+        res = await self.session.send(req, auth=auth, stream=stream)
+
+        if res.status_code < 400:
+            return res
+
+        await res.aread()
+        _raise_for_response(method, res)
+
+    async def get(self, *args, **kwargs):
+        """Make a GET request. See :func:`__request` for parameters.
+
+        :return: Response object.
+        """
+        return await self.__request("GET", *args, **kwargs)
+
+    async def post(self, *args, **kwargs):
+        """Make a POST request. See :func:`__request` for parameters.
+
+        :return: Response object.
+        """
+        return await self.__request("POST", *args, **kwargs)
+
+    async def patch(self, *args, **kwargs):
+        """Make a PATCH request. See :func:`__request` for parameters.
+
+        :return: Response object.
+        """
+        return await self.__request("PATCH", *args, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        """Make a DELETE request. See :func:`__request` for parameters.
+
+        :return: Response object.
+        """
+        return await self.__request("DELETE", *args, **kwargs)
+
+    async def put(self, *args, **kwargs):
+        """Make a PUT request. See :func:`__request` for parameters.
+
+        :return: Response object.
+        """
+        return await self.__request("PUT", *args, **kwargs)
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class AsyncPkiAgent(AsyncAgent):
+    def __init__(self, cert: str, key: str, auth: str, **kwargs):
+        """Initiate an async agent for PKI authentication.
+
+        :param cert: Path to cert file
+        :param key: Path to key file
+        :param auth: Path to certificate authority file
+        :param **kwargs: Kwargs passed to the super `AsyncAgent` class `__init__`
+        """
+        # httpx takes client certificates through the SSL context rather than per request
+        context = ssl.create_default_context(cafile=auth)
+        context.load_cert_chain(cert, key)
+        super().__init__(verify=context, **kwargs)
+
+        self.cert = cert
+        self.key = key
+
+
+class AsyncTokenAgent(AsyncAgent):
+    def __init__(
+        self,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        **kwargs,
+    ):
+        """Initiate an async agent for API token authentication.
+
+        :param access_key: Access key
+        :param secret_key: Secret key
+        :param **kwargs: Kwargs passed to the super `AsyncAgent` class `__init__`
+        """
+        super().__init__(**kwargs)
+
+        access_key = _resolve_key(access_key, "Access key", "BAILO_ACCESS_KEY")
+        secret_key = _resolve_key(secret_key, "Secret key", "BAILO_SECRET_KEY")
+
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.basic = httpx.BasicAuth(access_key, secret_key)
+
+    async def get(self, *args, **kwargs):
+        return await super().get(*args, auth=self.basic, **kwargs)
+
+    async def post(self, *args, **kwargs):
+        return await super().post(*args, auth=self.basic, **kwargs)
+
+    async def put(self, *args, **kwargs):
+        return await super().put(*args, auth=self.basic, **kwargs)
+
+    async def patch(self, *args, **kwargs):
+        return await super().patch(*args, auth=self.basic, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        return await super().delete(*args, auth=self.basic, **kwargs)
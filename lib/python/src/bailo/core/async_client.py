@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any
+
+# isort: split
+
+from bailo.core.async_agent import AsyncAgent, AsyncTokenAgent
+from bailo.core.client import Client
+from bailo.core.single_flight import AsyncSingleFlight
+from bailo.core.utils import _request_key
+
+
+class AsyncClient(Client):
+    """Create an asyncio Client object that can be used to talk to the website.
+
+    Exposes exactly the same methods as :class:`bailo.core.client.Client`, but every method returns an awaitable, so
+    many calls can share one event loop:
+
+    >>> async with AsyncAgent() as agent:
+    ...     client = AsyncClient("https://bailo.com", agent)
+    ...     models = await asyncio.gather(*(client.get_model(model_id) for model_id in model_ids))
+
+    Methods returning a raw response (e.g. `get_download_by_filename`) resolve to an unread streamed `httpx.Response`.
+
+    :param url: Url of bailo website
+    :param agent: An async agent object to handle requests
+    """
+
+    _token_agents: tuple[type, ...] = (AsyncTokenAgent,)
+
+    def __init__(self, url: str, agent: AsyncAgent | None = None, coalesce: bool = True):
+        """Initialise an AsyncClient.
+
+        :param url: URL of the Bailo instance website.
+        :param agent: An async agent object to handle requests, defaults to AsyncAgent().
+        :param coalesce: Share one request (and a copy of its parsed JSON) between concurrent identical calls to
+            `get_model`, `get_schema`, `get_all_schemas` and `get_model_roles`, defaults to True
+        """
+        super().__init__(url, agent or AsyncAgent(), coalesce=False)  # type: ignore[reportArgumentType]
+        self._async_single_flight = AsyncSingleFlight() if coalesce else None
+
+    def _cached_get(  # type: ignore[reportIncompatibleMethodOverride]
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> Awaitable[dict[str, Any]]:
+        """Private method. Make a GET request for JSON, coalesced with identical requests already in flight.
+
+        :param url: Request URL
+        :param params: Query parameters, defaults to None
+        :return: Awaitable JSON response object
+        """
+        if self._async_single_flight is None:
+            return self._get_json(url, params)  # type: ignore[reportReturnType]
+        return self._async_single_flight.do(_request_key(url, params), lambda: self._get_json(url, params))
+
+    async def _parse_json(self, res: Awaitable[Any]) -> dict[str, Any]:  # type: ignore[reportIncompatibleMethodOverride]
+        """Await a pending response and parse it as JSON, with the same error mapping as `Client._parse_json`.
+
+        :param res: Awaitable response from the async agent.
+        :raises BailoException: If the response body contains an error key.
+        :raises ResponseException: If the response body is not valid JSON.
+        :return: Parsed JSON as a dictionary.
+        """
+        return Client._parse_json(self, await res)
+
+    async def iter_models(  # type: ignore[reportIncompatibleMethodOverride]
+        self, page_size: int = 100, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Search for models as `get_models` does, requesting the results `page_size` at a time.
+
+        Unlike the other methods, returns an async iterator rather than an awaitable:
+
+        >>> async for summary in client.iter_models(search="yolo"):
+        ...     print(summary["id"])
+
+        :param page_size: Number of results requested at a time, defaults to 100
+        :param **kwargs: Search parameters passed to `get_models` (e.g. `search` or `kind`)
+        :return: Async iterator of entry summaries
+        """
+        skip = 0
+        first_id = None
+        while True:
+            models = (await self.get_models(limit=page_size, skip=skip, **kwargs))["models"]
+            if skip and models and models[0]["id"] == first_id:
+                # the server ignored `skip`, so sent the first page again
+                return
+            if not skip and models:
+                first_id = models[0]["id"]
+
+            for summary in models:
+                yield summary
+            if len(models) != page_size:
+                # a short page is the last, and a longer one means the server ignored `limit` and sent everything
+                return
+            skip += page_size
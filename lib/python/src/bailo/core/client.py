@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import threading
+from collections.abc import Iterator
 from io import BytesIO
 from json import JSONDecodeError
 from typing import Any
@@ -11,7 +14,13 @@ import requests
 from bailo.core.agent import Agent, TokenAgent
 from bailo.core.enums import CollaboratorEntry, EntryKind, ModelVisibility, SchemaKind
 from bailo.core.exceptions import BailoException, ResponseException
-from bailo.core.utils import filter_none, normalise_json_params, normalise_query_params
+from bailo.core.identity_map import IdentityMap
+from bailo.core.instrumentation import RequestObserver
+from bailo.core.response_cache import ResponseCache
+from bailo.core.single_flight import SingleFlight
+from bailo.core.utils import _request_key, filter_none, normalise_json_params, normalise_query_params
+
+logger = logging.getLogger(__name__)
 
 
 class Client:
@@ -21,26 +30,95 @@ class Client:
     :param agent: An agent object to handle requests
     """
 
-    def __init__(self, url: str, agent: Agent | None = None):
+    # agent types that must use the token-authenticated download routes
+    _token_agents: tuple[type, ...] = (TokenAgent,)
+
+    def __init__(
+        self,
+        url: str,
+        agent: Agent | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        identity_map: IdentityMap | None = None,
+    ):
         """Initialise a Client.
 
         :param url: URL of the Bailo instance website.
         :param agent: An agent object to handle requests, defaults to Agent().
+        :param cache: Response cache for read-heavy endpoints (`get_model`, `get_schema`, `get_all_schemas` and
+            `get_model_roles`), defaults to None
+        :param coalesce: Share one request (and a copy of its parsed JSON) between concurrent identical calls to those
+            endpoints, defaults to True
+        :param identity_map: Map of live helper objects, so the same model or release is returned each time it is
+            fetched through this client, defaults to None
         """
         self.url = url.rstrip("/") + "/api"
         self.agent = agent or Agent()
+        self.cache = cache
+        self._single_flight = SingleFlight() if coalesce else None
+        self.identity_map = identity_map
+        # files of each model keyed by SHA-256 digest, shared by its releases when deduplicating uploads
+        self._file_digests: dict[str, dict[str, dict[str, Any]]] = {}
+        self._file_digests_lock = threading.Lock()
+        if cache is not None:
+            # requests changing a model or schema invalidate its cached responses
+            self._observe(cache)
+        if identity_map is not None:
+            self._observe(identity_map)
+
+    def _observe(self, observer: RequestObserver) -> None:
+        """Private method. Register an observer of the agent's requests, once, as the agent may be shared by clients.
+
+        :param observer: Observer to notify of each request, e.g. the response cache
+        """
+        observers = getattr(self.agent, "observers", None)
+        if observers is None:
+            logger.warning(
+                "Agent %s does not support observers, so %r is not invalidated by requests changing a model.",
+                type(self.agent).__name__,
+                observer,
+            )
+            return
+        if observer not in observers:
+            observers.append(observer)
 
-    @staticmethod
-    def _parse_json(res: requests.Response) -> dict[str, Any]:
-        """Parse a JSON response, raising BailoException if the body contains an error.
+    def _cached_get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Private method. Make a GET request for JSON, coalesced with identical requests already in flight.
+
+        :param url: Request URL
+        :param params: Query parameters, defaults to None
+        :return: JSON response object
+        """
+        if self._single_flight is None:
+            return self._get_json(url, params)
+        return self._single_flight.do(_request_key(url, params), lambda: self._get_json(url, params))
+
+    def _get_json(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Private method. Make a GET request for JSON, through the response cache if the client has one.
+
+        :param url: Request URL
+        :param params: Query parameters, defaults to None
+        :return: JSON response object
+        """
+        if self.cache is None:
+            if params is None:
+                return self._parse_json(self.agent.get(url))
+            return self._parse_json(self.agent.get(url, params=params))
+        return self.cache.get(self, url, params)
+
+    def _parse_json(self, res: requests.Response) -> dict[str, Any]:
+        """Parse a JSON response with the agent's JSON codec, raising BailoException if the body contains an error.
+
+        Agents without a `json_codec` (e.g. custom agents) fall back to the response's own `json()`.
 
         :param res: Response object from the agent.
         :raises BailoException: If the response body contains an error key.
         :raises ResponseException: If the response body is not valid JSON.
         :return: Parsed JSON as a dictionary.
         """
+        codec = getattr(self.agent, "json_codec", None)
         try:
-            data = res.json()
+            data = res.json() if codec is None else codec.loads(res.content)
         except (JSONDecodeError, ValueError) as e:
             raise ResponseException(
                 f"{res.status_code} Response from {res.request.method} {res.request.url} is not valid JSON"
@@ -131,6 +209,8 @@ class Client:
         admin_access: bool | None = None,
         peers: list[str] | None = None,
         title_only: bool | None = None,
+        limit: int | None = None,
+        skip: int | None = None,
     ):
         """Search for models using a combination of structured filters and free-text search.
 
@@ -156,6 +236,9 @@ class Client:
         :param peers: List of peer identifiers to include remote search results from, defaults to None
         :param title_only: If True, limits searching to entry titles only and disables
             full-text search, defaults to None
+        :param limit: Maximum number of results to return, for servers which support paging, defaults to None
+        :param skip: Number of results to skip before the first returned, for servers which support paging,
+            defaults to None
         :return: JSON response object
         """
         filtered_params = filter_none(
@@ -172,6 +255,8 @@ class Client:
                 "adminAccess": admin_access,
                 "peers": peers,
                 "titleOnly": title_only,
+                "limit": limit,
+                "skip": skip,
             }
         )
         normalised_params = normalise_query_params(filtered_params)
@@ -183,6 +268,88 @@ class Client:
             )
         )
 
+    def iter_models(
+        self,
+        task: str | None = None,
+        libraries: list[str] | None = None,
+        filters: list[str] | None = None,
+        search: str = "",
+        kind: EntryKind | None = None,
+        organisations: list[str] | None = None,
+        states: list[str] | None = None,
+        allow_templating: bool | None = None,
+        schema_id: str | None = None,
+        admin_access: bool | None = None,
+        peers: list[str] | None = None,
+        title_only: bool | None = None,
+        page_size: int = 100,
+    ) -> Iterator[dict[str, Any]]:
+        """Search for models as `get_models` does, requesting the results `page_size` at a time.
+
+        The first page is requested immediately, and each further page once the iterator reaches it, so only one
+        page of results is held at a time. Servers which do not support paging send every result in the first
+        response, which is then iterated locally.
+
+        :param task: Entry task (e.g. image classification), defaults to None
+        :param libraries: Entry library (e.g. TensorFlow), defaults to None
+        :param filters: List of collaborator role filters, as for `get_models`, defaults to None
+        :param search: Free-text search string, as for `get_models`, defaults to ""
+        :param kind: Entry kind to filter by (e.g. `EntryKind.MODEL`), defaults to None
+        :param organisations: List of organisation identifiers to restrict results, defaults to None
+        :param states: List of entry lifecycle states to restrict results, defaults to None
+        :param allow_templating: If True, restricts results to models with templating enabled, defaults to None
+        :param schema_id: Schema ID to restrict results to models using that schema, defaults to None
+        :param admin_access: If True, returns models requiring admin access, defaults to None
+        :param peers: List of peer identifiers to include remote search results from, defaults to None
+        :param title_only: If True, limits searching to entry titles only, defaults to None
+        :param page_size: Number of results requested at a time, defaults to 100
+        :return: Iterator of entry summaries
+        """
+        search_params = {
+            "task": task,
+            "libraries": libraries,
+            "filters": filters,
+            "search": search,
+            "kind": kind,
+            "organisations": organisations,
+            "states": states,
+            "allow_templating": allow_templating,
+            "schema_id": schema_id,
+            "admin_access": admin_access,
+            "peers": peers,
+            "title_only": title_only,
+        }
+        return self._iter_model_pages(
+            self.get_models(limit=page_size, skip=0, **search_params), page_size, search_params
+        )
+
+    def _iter_model_pages(
+        self, page: dict[str, Any], page_size: int, search: dict[str, Any]
+    ) -> Iterator[dict[str, Any]]:
+        """Private method. Yield the results of a search page by page, requesting each page after the first.
+
+        :param page: First page of results
+        :param page_size: Number of results requested per page
+        :param search: Search parameters passed to `get_models`
+        :return: Iterator of entry summaries
+        """
+        skip = 0
+        first_id = None
+        while True:
+            models = page["models"]
+            if skip and models and models[0]["id"] == first_id:
+                # the server ignored `skip`, so sent the first page again
+                return
+            if not skip and models:
+                first_id = models[0]["id"]
+
+            yield from models
+            if len(models) != page_size:
+                # a short page is the last, and a longer one means the server ignored `limit` and sent everything
+                return
+            skip += page_size
+            page = self.get_models(limit=page_size, skip=skip, **search)
+
     def get_model(
         self,
         model_id: str,
@@ -198,7 +365,7 @@ class Client:
         if kind:
             query = "&".join(f"kind={k}" for k in kind)
             url = f"{url}?{query}"
-        return self._parse_json(self.agent.get(url))
+        return self._cached_get(url)
 
     def patch_model(
         self,
@@ -312,13 +479,15 @@ class Client:
         :param text: Model card text to extract metadata from (e.g. HuggingFace model card)
         :return: JSON response object containing extracted metadata
         """
-        return self.agent.post(
-            f"{self.url}/v2/model/{model_id}/import-model-card-text",
-            json={
-                "text": text,
-            },
-            timeout=180,
-        ).json()
+        return self._parse_json(
+            self.agent.post(
+                f"{self.url}/v2/model/{model_id}/import-model-card-text",
+                json={
+                    "text": text,
+                },
+                timeout=180,
+            )
+        )
 
     def model_card_from_schema(
         self,
@@ -492,26 +661,50 @@ class Client:
             )
         )
 
+    @staticmethod
+    def _range_headers(byte_range: tuple[int, int | None] | None, if_range: str | None = None) -> dict[str, str] | None:
+        """Build the `Range` (and `If-Range`) headers for a partial download.
+
+        :param byte_range: Inclusive (start, end) byte offsets, with an end of None meaning the end of the file
+        :param if_range: ETag the range is valid for, so the whole file is sent if it has changed, defaults to None
+        :return: Headers dictionary, or None if no range is requested
+        """
+        if byte_range is None:
+            return None
+        start, end = byte_range
+        headers = {"Range": f"bytes={start}-{'' if end is None else end}"}
+        if if_range is not None:
+            headers["If-Range"] = if_range
+        return headers
+
     def get_download_file(
         self,
         model_id: str,
         file_id: str,
+        byte_range: tuple[int, int | None] | None = None,
+        if_range: str | None = None,
     ):
         """Download a specific file by its id.
 
         :param model_id: Unique model ID
         :param file_id: Unique file ID
+        :param byte_range: Inclusive (start, end) byte offsets to request (end of None reads to the end of the
+            file), defaults to None for the whole file
+        :param if_range: ETag of the file the range is valid for, so the whole file is sent instead if it has
+            changed, defaults to None
         :return: Response object
         """
-        if isinstance(self.agent, TokenAgent):
+        if isinstance(self.agent, self._token_agents):
             return self.agent.get(
                 f"{self.url}/v2/token/model/{model_id}/file/{file_id}/download",
+                headers=self._range_headers(byte_range, if_range),
                 stream=True,
                 timeout=10_000,
             )
         else:
             return self.agent.get(
                 f"{self.url}/v2/model/{model_id}/file/{file_id}/download",
+                headers=self._range_headers(byte_range, if_range),
                 stream=True,
                 timeout=10_000,
             )
@@ -521,23 +714,31 @@ class Client:
         model_id: str,
         semver: str,
         filename: str,
+        byte_range: tuple[int, int | None] | None = None,
+        if_range: str | None = None,
     ):
         """Download a specific file.
 
         :param model_id: Unique model ID
         :param semver: Semver of the release
         :param filename: The filename trying to download from
+        :param byte_range: Inclusive (start, end) byte offsets to request (end of None reads to the end of the
+            file), defaults to None for the whole file
+        :param if_range: ETag of the file the range is valid for, so the whole file is sent instead if it has
+            changed, defaults to None
         :return: Response object
         """
-        if isinstance(self.agent, TokenAgent):
+        if isinstance(self.agent, self._token_agents):
             return self.agent.get(
                 f"{self.url}/v2/token/model/{model_id}/release/{semver}/file/{filename}/download",
+                headers=self._range_headers(byte_range, if_range),
                 stream=True,
                 timeout=10_000,
             )
         else:
             return self.agent.get(
                 f"{self.url}/v2/model/{model_id}/release/{semver}/file/{filename}/download",
+                headers=self._range_headers(byte_range, if_range),
                 stream=True,
                 timeout=10_000,
             )
@@ -666,6 +867,8 @@ class Client:
         :param file_id: Unique file ID
         :return: JSON response object
         """
+        # the file may be in the model's digest index, which is rebuilt when next needed
+        self._file_digests.pop(model_id, None)
         return self._parse_json(
             self.agent.delete(
                 f"{self.url}/v2/model/{model_id}/file/{file_id}",
@@ -836,12 +1039,7 @@ class Client:
         :param kind: Enum to define schema kind (e.g. Model or AccessRequest), defaults to None
         :return: JSON response object
         """
-        return self._parse_json(
-            self.agent.get(
-                f"{self.url}/v2/schemas",
-                params={"kind": kind},
-            )
-        )
+        return self._cached_get(f"{self.url}/v2/schemas", params={"kind": kind})
 
     def get_schema(
         self,
@@ -852,11 +1050,7 @@ class Client:
         :param schema_id: Unique schema ID
         :return: JSON response object.
         """
-        return self._parse_json(
-            self.agent.get(
-                f"{self.url}/v2/schema/{schema_id}",
-            )
-        )
+        return self._cached_get(f"{self.url}/v2/schema/{schema_id}")
 
     def post_schema(
         self,
@@ -954,12 +1148,7 @@ class Client:
         :return: JSON response object
         """
         filtered_params = filter_none({"modelId": model_id})
-        return self._parse_json(
-            self.agent.get(
-                f"{self.url}/v2/roles",
-                params=filtered_params,
-            )
-        )
+        return self._cached_get(f"{self.url}/v2/roles", params=filtered_params)
 
     def get_access_request(self, model_id: str, access_request_id: str):
         """Retrieve a specific access request given its unique ID.
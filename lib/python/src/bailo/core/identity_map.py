@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# isort: split
+
+from bailo.core.instrumentation import RequestEvent, RequestObserver
+from bailo.core.response_cache import SAFE_METHODS, _cache_tag
+
+# forget bookkeeping for collected objects once it outgrows the live objects by this factor
+PRUNE_FACTOR = 2
+
+
+class IdentityMap(RequestObserver):
+    """Map of the live helper objects (e.g. :class:`~bailo.helper.model.Model` and
+    :class:`~bailo.helper.release.Release`) built through one :class:`~bailo.core.client.Client`.
+
+    Given to a client, `Model.from_id`, `Model.search`, `Release.from_version` and the other entry constructors
+    return the same object for the same ID, rather than a duplicate with its own copy of the card. Objects are held
+    by weak reference, so are forgotten once no longer used elsewhere. Any other request the client makes about a
+    model marks its objects stale, so they are fetched again (and updated in place) when next asked for.
+
+    >>> client = Client("https://bailo.com", identity_map=IdentityMap())
+    >>> Model.from_id(client, "yolo-abcdef") is Model.from_id(client, "yolo-abcdef")
+    True
+    """
+
+    def __init__(self) -> None:
+        self._objects: weakref.WeakValueDictionary[Hashable, Any] = weakref.WeakValueDictionary()
+        self._tags: dict[Hashable, str | None] = {}
+        self._stale: set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get the live object for `key`, unless it is stale.
+
+        :param key: Identity of the object, e.g. (Model, model ID)
+        :return: The object, or None if there is none or it must be fetched again
+        """
+        with self._lock:
+            if key in self._stale:
+                return None
+            return self._objects.get(key)
+
+    def peek(self, key: Hashable) -> Any | None:
+        """Get the live object for `key`, even if it is stale, so it can be updated in place.
+
+        :param key: Identity of the object
+        :return: The object, or None if there is none
+        """
+        return self._objects.get(key)
+
+    def add(self, key: Hashable, obj: Any, tag: str | None = None, stale: bool = False) -> None:
+        """Add (or refresh) the live object for `key`.
+
+        :param key: Identity of the object
+        :param obj: The object, freshly built or updated from the server
+        :param tag: Group of objects invalidated together, e.g. 'model:<id>', defaults to None
+        :param stale: The object is incomplete (e.g. built from a search result), so is only returned by `peek`,
+            defaults to False
+        """
+        with self._lock:
+            self._store(key, obj, tag, stale)
+
+    def get_or_add(
+        self, key: Hashable, factory: Callable[[], Any], tag: str | None = None, stale: bool = False
+    ) -> tuple[Any, bool]:
+        """Get the live object for `key`, even if it is stale (as for `peek`), or atomically add one built by
+        `factory`, so concurrent callers never build two objects for the same key.
+
+        :param key: Identity of the object
+        :param factory: Function building the object if there is none, called under the map's lock, so must not use
+            the map
+        :param tag: Group of objects invalidated together, for an added object, defaults to None
+        :param stale: An added object is incomplete, as for `add`, defaults to False
+        :return: Tuple of the object and whether it was added
+        """
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                return obj, False
+            obj = factory()
+            self._store(key, obj, tag, stale)
+            return obj, True
+
+    def _store(self, key: Hashable, obj: Any, tag: str | None, stale: bool) -> None:
+        """Private method. Store an object, with the lock held.
+
+        :param key: Identity of the object
+        :param obj: The object
+        :param tag: Group of objects invalidated together
+        :param stale: The object is incomplete
+        """
+        self._objects[key] = obj
+        self._tags[key] = tag
+        if stale:
+            self._stale.add(key)
+        else:
+            self._stale.discard(key)
+        if len(self._tags) > PRUNE_FACTOR * len(self._objects):
+            self._tags = {key: tag for key, tag in self._tags.items() if key in self._objects}
+            self._stale &= self._tags.keys()
+
+    def invalidate(self, tag: str | None = None) -> None:
+        """Mark objects stale, so they are fetched again when next asked for.
+
+        :param tag: Group of objects to mark, e.g. 'model:<id>', or None to mark all of them
+        """
+        with self._lock:
+            self._stale.update(key for key, key_tag in self._tags.items() if tag is None or key_tag == tag)
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        if event.method.upper() in SAFE_METHODS:
+            return
+        tag = _cache_tag(event.url)
+        if tag is not None:
+            self.invalidate(tag)
+
+    def __len__(self) -> int:
+        return len(self._objects)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any
+from urllib.parse import urlparse
+
+# path segments which are followed by one (or, for images, two) identifiers in Bailo API routes
+ID_SEGMENTS = {
+    "access-request": ("{accessRequestId}",),
+    "file": ("{fileId}",),
+    "image": ("{imageName}", "{imageTag}"),
+    "model": ("{modelId}",),
+    "model-card": ("{version}",),
+    "release": ("{semver}",),
+    "schema": ("{schemaId}",),
+    "webhook": ("{webhookId}",),
+}
+# segments followed by a different identifier within a release, e.g. files are named in /release/{semver}/file/...
+RELEASE_ID_SEGMENTS = {
+    "file": ("{fileName}",),
+}
+
+
+def url_template(url: str) -> str:
+    """Reduce a request URL to its route template, so requests to the same endpoint can be grouped.
+
+    >>> url_template("https://bailo.com/api/v2/model/abc123/release/1.0.0/file/model.pt/download")
+    '/v2/model/{modelId}/release/{semver}/file/{fileName}/download'
+
+    :param url: Full request URL
+    :return: URL path from the API version, with identifiers replaced by placeholders
+    """
+    path = urlparse(url).path
+    version = path.find("/v2/")
+    if version != -1:
+        path = path[version:]
+
+    segments = path.split("/")
+    i = 0
+    while i < len(segments):
+        placeholders = ID_SEGMENTS.get(segments[i], ())
+        if i >= 2 and segments[i - 2] == "release":
+            placeholders = RELEASE_ID_SEGMENTS.get(segments[i], placeholders)
+        for offset, placeholder in enumerate(placeholders, start=1):
+            if i + offset < len(segments):
+                segments[i + offset] = placeholder
+        i += len(placeholders) + 1
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """Details of one API request made by an :class:`~bailo.core.agent.Agent`, given to each observer.
+
+    Fields describing the response are None until the request has ended, and remain None if it failed before a
+    response was received (in which case `error` is set).
+
+    :param method: HTTP method name (e.g. 'GET', 'POST' etc.)
+    :param url: Full request URL
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        self.method = method
+        self.url = url
+        self.template = url_template(url)
+        self.status_code: int | None = None
+        # seconds from the first attempt until the final response (including its body, unless streamed)
+        self.latency: float | None = None
+        self.bytes_sent: int | None = None
+        self.bytes_received: int | None = None
+        self.retries = 0
+        self.error: BaseException | None = None
+
+    @property
+    def endpoint(self) -> str:
+        """Method and URL template of the request, e.g. 'GET /v2/model/{modelId}'."""
+        return f"{self.method} {self.template}"
+
+    def record_response(self, res: Any) -> None:
+        """Fill in the response status and sizes.
+
+        :param res: Response object
+        """
+        self.status_code = res.status_code
+
+        sent = res.request.headers.get("Content-Length")
+        self.bytes_sent = int(sent) if sent is not None else None
+
+        received = res.headers.get("Content-Length")
+        if received is not None:
+            self.bytes_received = int(received)
+        elif res._content_consumed:
+            self.bytes_received = len(res.content)
+
+
+class RequestObserver:
+    """Base class for observers of an :class:`~bailo.core.agent.Agent`'s requests.
+
+    Override either method, then pass the observer to the agent:
+
+    >>> agent = Agent(observers=[MyObserver()])
+
+    Each is called once per request, however many times it is retried. Observers may be called from many threads at
+    once, and exceptions they raise are logged rather than failing the request.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before a request is first sent.
+
+        :param event: Details of the request
+        """
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Called once a request has completed or failed.
+
+        :param event: Details of the request and its response
+        """
+
+
+class LatencyHistogram(RequestObserver):
+    """In-memory histogram of request latencies per endpoint, reporting percentiles.
+
+    Latencies are counted in logarithmic buckets, so memory use does not grow with the number of requests, and
+    reported percentiles are within `precision` of the true value.
+
+    >>> histogram = LatencyHistogram()
+    >>> client = Client("https://bailo.com", Agent(observers=[histogram]))
+    >>> ...
+    >>> print(histogram.report())
+
+    :param precision: Relative width of each bucket, defaults to 0.05 (5%)
+    """
+
+    # latencies below this many seconds share the first bucket
+    MIN_LATENCY = 1e-4
+
+    def __init__(self, precision: float = 0.05) -> None:
+        self._growth = math.log1p(precision)
+        self._buckets: dict[str, dict[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        if event.latency is None:
+            return
+        bucket = max(0, math.ceil(math.log(max(event.latency, self.MIN_LATENCY) / self.MIN_LATENCY) / self._growth))
+        with self._lock:
+            buckets = self._buckets.setdefault(event.endpoint, {})
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    def percentiles(self, quantiles: tuple[float, ...] = (0.5, 0.95, 0.99)) -> dict[str, dict[str, float]]:
+        """Get latency percentiles for each endpoint.
+
+        :param quantiles: Quantiles to report, defaults to (0.5, 0.95, 0.99)
+        :return: Dictionary keyed by endpoint (e.g. 'GET /v2/model/{modelId}') of `count` and latencies in seconds
+            keyed by percentile name (e.g. `p95`)
+        """
+        with self._lock:
+            snapshot = {endpoint: sorted(buckets.items()) for endpoint, buckets in self._buckets.items()}
+
+        summary = {}
+        for endpoint, buckets in snapshot.items():
+            count = sum(n for _, n in buckets)
+            stats: dict[str, float] = {"count": count}
+            for quantile in quantiles:
+                rank = quantile * count
+                seen = 0
+                for bucket, n in buckets:
+                    seen += n
+                    if seen >= rank:
+                        stats[f"p{quantile * 100:g}"] = self.MIN_LATENCY * math.exp(bucket * self._growth)
+                        break
+            summary[endpoint] = stats
+        return summary
+
+    def report(self) -> str:
+        """Format latency percentiles for each endpoint as a table, slowest p99 first.
+
+        :return: Table of request counts and p50, p95 and p99 latencies in milliseconds
+        """
+        rows = sorted(self.percentiles().items(), key=lambda item: item[1]["p99"], reverse=True)
+        width = max((len(endpoint) for endpoint, _ in rows), default=8)
+        lines = [f"{'endpoint':<{width}}  {'count':>7}  {'p50 ms':>9}  {'p95 ms':>9}  {'p99 ms':>9}"]
+        for endpoint, stats in rows:
+            lines.append(
+                f"{endpoint:<{width}}  {stats['count']:>7}  "
+                + "  ".join(f"{stats[p] * 1000:>9.1f}" for p in ("p50", "p95", "p99"))
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Discard all recorded latencies."""
+        with self._lock:
+            self._buckets.clear()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON = True
+except ImportError:
+    ORJSON = False
+
+try:
+    import msgspec
+
+    MSGSPEC = True
+except ImportError:
+    MSGSPEC = False
+
+
+class JsonCodec:
+    """JSON encoder and decoder used by an :class:`~bailo.core.agent.Agent` for request bodies (`json=`) and by a
+    :class:`~bailo.core.client.Client` for responses.
+
+    Any pair of functions can be plugged in, e.g. to add options or use another library:
+
+    >>> agent = Agent(json_codec=JsonCodec("custom", dumps=my_dumps, loads=my_loads))
+
+    :param name: Name of the codec, e.g. 'orjson'
+    :param dumps: Function encoding a JSON-serialisable object to bytes
+    :param loads: Function decoding bytes (or str) to an object, raising ValueError for invalid JSON
+    """
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes | str], Any]) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Private function. Encode with the standard library, as `requests` does for `json=` bodies."""
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+STDLIB_CODEC = JsonCodec("json", _stdlib_dumps, json.loads)
+
+
+def _check_finite(obj: Any) -> None:
+    """Private function. Reject NaN and infinite floats, as the standard library codec does, rather than let orjson
+    or msgspec silently encode them as null.
+
+    :param obj: JSON-serialisable object
+    :raises ValueError: If `obj` contains a NaN or infinite float.
+    """
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _check_finite(value)
+
+
+def _orjson_codec() -> JsonCodec:
+    """Private function. Build the orjson codec, whose decode errors already subclass ValueError."""
+
+    def dumps(obj: Any) -> bytes:
+        _check_finite(obj)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec("orjson", dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    """Private function. Build the msgspec codec, mapping its decode errors to ValueError."""
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any) -> bytes:
+        _check_finite(obj)
+        return encoder.encode(obj)
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return JsonCodec("msgspec", dumps, loads)
+
+
+def get_codec(name: str | None = None) -> JsonCodec:
+    """Get a built-in JSON codec.
+
+    :param name: One of 'orjson', 'msgspec' or 'json' (the standard library), or None for the fastest installed,
+        defaults to None
+    :raises ImportError: If the named library is not installed.
+    :raises ValueError: If the name is not a built-in codec.
+    :return: The codec
+    """
+    if name is None:
+        name = "orjson" if ORJSON else "msgspec" if MSGSPEC else "json"
+
+    if name == "json":
+        return STDLIB_CODEC
+    if name == "orjson":
+        if not ORJSON:
+            raise ImportError("Optional orjson dependency (needed for this codec) is not installed, see bailo[orjson].")
+        return _orjson_codec()
+    if name == "msgspec":
+        if not MSGSPEC:
+            raise ImportError(
+                "Optional msgspec dependency (needed for this codec) is not installed, see bailo[msgspec]."
+            )
+        return _msgspec_codec()
+    raise ValueError(f"Unknown JSON codec {name!r}, expected 'orjson', 'msgspec' or 'json'.")
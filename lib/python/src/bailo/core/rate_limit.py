@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+from collections.abc import Iterator
+
+# isort: split
+
+from bailo.core.utils import _file_lock
+
+# seconds between checks for a free in-flight slot held by another process
+SLOT_POLL_INTERVAL = 0.01
+
+
+class RateLimiter:
+    """Client-side limit on the rate and concurrency of requests, consulted by :class:`~bailo.core.agent.Agent`.
+
+    Requests are started at no more than `rate` per second on average (a token bucket allowing bursts of up to
+    `burst`), and no more than `max_in_flight` are awaiting a response at once. Callers over either limit wait
+    rather than fail, so highly concurrent clients slow down smoothly instead of being throttled by the server.
+
+    One limiter can be shared by any number of threads and agents. Given a `lock_path`, the limits are also shared
+    by every process on the host using the same path, with state kept in that file and `<lock_path>.<n>` slot files.
+
+    >>> limiter = RateLimiter(rate=20, max_in_flight=8)
+    >>> client = Client("https://bailo.com", Agent(rate_limiter=limiter))
+
+    :param rate: Average number of requests started per second, or None for no rate limit, defaults to None
+    :param burst: Maximum number of requests started at once after a quiet period, defaults to `rate` (at least 1)
+    :param max_in_flight: Maximum number of requests awaiting a response at once, or None for no limit,
+        defaults to None
+    :param lock_path: Path of a lock file to share the limits between processes, defaults to None
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        max_in_flight: int | None = None,
+        lock_path: str | None = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+        self.lock_path = lock_path
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Wait until a request may be started, then hold an in-flight slot until the context exits.
+
+        :return: Context manager to make the request within
+        """
+        if self.rate is not None:
+            self._take_token(self.rate)
+        if self._in_flight is None:
+            yield
+            return
+
+        with self._in_flight:
+            if self.lock_path is None:
+                yield
+            else:
+                with self._process_slot():
+                    yield
+
+    def _take_token(self, rate: float) -> None:
+        """Private method. Remove a token from the bucket, waiting for one to be added if it is empty.
+
+        :param rate: Tokens added to the bucket per second
+        """
+        while True:
+            if self.lock_path is None:
+                with self._lock:
+                    wait = self._refill(time.monotonic(), rate)
+            else:
+                # the bucket is kept in the lock file, timed by the wall clock shared between processes
+                with _file_lock(self.lock_path), open(self.lock_path, "r+", encoding="utf-8") as f:
+                    try:
+                        state = json.loads(f.read() or "{}")
+                        self._tokens, self._updated = float(state["tokens"]), float(state["updated"])
+                    except (KeyError, TypeError, ValueError):
+                        self._tokens, self._updated = float(self.burst), time.time()
+                    wait = self._refill(time.time(), rate)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps({"tokens": self._tokens, "updated": self._updated}))
+
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def _refill(self, now: float, rate: float) -> float:
+        """Private method. Add the tokens accrued since the last update, and take one if available.
+
+        :param now: Current time in the bucket's clock
+        :param rate: Tokens added to the bucket per second
+        :return: 0 if a token was taken, otherwise the number of seconds until one is available
+        """
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / rate
+
+    @contextlib.contextmanager
+    def _process_slot(self) -> Iterator[None]:
+        """Private method. Hold one of the `max_in_flight` slot files, waiting for another process to free one."""
+        while True:
+            for slot in range(self.max_in_flight or 1):
+                with _file_lock(f"{self.lock_path}.{slot}", blocking=False) as locked:
+                    if locked:
+                        yield
+                        return
+            time.sleep(SLOT_POLL_INTERVAL)
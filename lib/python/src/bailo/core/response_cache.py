@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import urlparse
+
+# isort: split
+
+from bailo.core.instrumentation import RequestEvent, RequestObserver
+from bailo.core.utils import _request_key
+
+# methods which do not change state on the server, so never invalidate cached responses
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _cache_tag(url: str, params: dict[str, Any] | None = None) -> str | None:
+    """Private function. Get the group of cached responses that a request to `url` reads or changes.
+
+    :param url: Request URL
+    :param params: Query parameters of the request, defaults to None
+    :return: 'model:<id>' for requests about a model, 'schemas' for schema requests, otherwise None
+    """
+    segments = urlparse(url).path.split("/")
+    if "model" in segments:
+        i = segments.index("model")
+        if i + 1 < len(segments):
+            return f"model:{segments[i + 1]}"
+    if params and params.get("modelId"):
+        return f"model:{params['modelId']}"
+    if "schema" in segments or "schemas" in segments:
+        return "schemas"
+    return None
+
+
+class _CacheEntry:
+    """Private class. A cached JSON response body and its validators."""
+
+    def __init__(self, body: dict[str, Any], tag: str | None, headers: Any) -> None:
+        self.body = body
+        self.tag = tag
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self.stored_at = time.monotonic()
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Headers to revalidate the entry with a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(RequestObserver):
+    """In-memory cache of JSON responses for read-heavy :class:`~bailo.core.client.Client` endpoints.
+
+    Used by `get_model`, `get_schema`, `get_all_schemas` and `get_model_roles` when given to a client. Responses are
+    served from memory for `ttl` seconds, after which they are revalidated with `If-None-Match` or
+    `If-Modified-Since` where the server sent an `ETag` or `Last-Modified` header, so unchanged responses are not
+    sent again. Any other request the client makes about a model (or schema) invalidates that model's (or all
+    schema) entries.
+
+    >>> client = Client("https://bailo.com", cache=ResponseCache(ttl=30))
+
+    :param ttl: Seconds a response is served without revalidation, defaults to 60
+    :param max_entries: Maximum number of cached responses, least recently used first evicted, defaults to 256
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, client: Any, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """GET a JSON response through the cache.
+
+        :param client: Client whose agent makes any request
+        :param url: Request URL
+        :param params: Query parameters, defaults to None
+        :return: Copy of the parsed JSON response
+        """
+        key = _request_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+            return copy.deepcopy(entry.body)
+
+        headers = entry.validators if entry is not None else {}
+        res = client.agent.get(url, params=params, headers=headers or None)
+        if res.status_code == 304 and entry is not None:
+            entry.stored_at = time.monotonic()
+            return copy.deepcopy(entry.body)
+
+        body = client._parse_json(res)
+        with self._lock:
+            self._entries[key] = _CacheEntry(body, _cache_tag(url, params), res.headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(body)
+
+    def invalidate(self, tag: str | None = None) -> None:
+        """Remove cached responses.
+
+        :param tag: Group of responses to remove, e.g. 'model:<id>' or 'schemas', or None to remove all of them
+        """
+        with self._lock:
+            if tag is None:
+                self._entries.clear()
+                return
+            for key in [key for key, entry in self._entries.items() if entry.tag == tag]:
+                del self._entries[key]
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        if event.method.upper() in SAFE_METHODS:
+            return
+        tag = _cache_tag(event.url)
+        if tag is not None:
+            self.invalidate(tag)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _Call:
+    """Private class. A call in flight, and its outcome once done."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls, so only one runs and every caller shares its result.
+
+    Used by :class:`~bailo.core.client.Client` for GET requests, so threads asking for the same model or schema at
+    the same moment make one HTTP request between them. Callers sharing a result each receive their own deep copy.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Call `fn`, or wait for the call already in flight with the same `key`.
+
+        :param key: Identity of the call, e.g. the request URL and parameters
+        :param fn: Function to call if no identical call is in flight
+        :raises BaseException: Any exception raised by the shared call
+        :return: Result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        # waiters copy the result, so the leader's caller must not change it in the meantime
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical coroutines on one event loop, as :class:`SingleFlight` does for threads.
+
+    Used by :class:`~bailo.core.async_client.AsyncClient`. Cancelling one caller does not cancel the shared call
+    for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `fn()`, or the identical call already in flight with the same `key`.
+
+        :param key: Identity of the call, e.g. the request URL and parameters
+        :param fn: Function returning the awaitable to run if no identical call is in flight
+        :raises BaseException: Any exception raised by the shared call
+        :return: Copy of the result of the call
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+        return copy.deepcopy(await asyncio.shield(task))
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import time
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any
+
+# size of the reusable buffer each transfer streams through
+STREAM_BUFFER_SIZE = 1024 * 1024
+# files are read in blocks of this size to compute their digest
+DIGEST_BLOCK_SIZE = 1024 * 1024
+# progress callbacks fire at most this often, however small the chunks being transferred
+PROGRESS_INTERVAL = 0.1
+# files already compressed (including zip-based weight formats) are stored in zip archives rather than deflated
+ZIP_STORED_PATTERNS = (
+    "*.7z",
+    "*.bz2",
+    "*.gz",
+    "*.gif",
+    "*.h5",
+    "*.jpeg",
+    "*.jpg",
+    "*.keras",
+    "*.mp4",
+    "*.npz",
+    "*.png",
+    "*.pt",
+    "*.pth",
+    "*.safetensors",
+    "*.tar.gz",
+    "*.tgz",
+    "*.webp",
+    "*.xz",
+    "*.zip",
+    "*.zst",
+)
+
+
+class ThrottledProgress:
+    """Batch byte counts given to a progress callback, so it is called at most once every `interval` seconds.
+
+    Call :meth:`flush` once the transfer is complete to report any remaining bytes.
+
+    :param callback: Function given the number of bytes transferred since it was last called, e.g. `tqdm.update`
+    :param interval: Minimum number of seconds between callbacks, defaults to PROGRESS_INTERVAL
+    """
+
+    def __init__(self, callback: Callable[[int], Any], interval: float = PROGRESS_INTERVAL) -> None:
+        self.callback = callback
+        self.interval = interval
+
+        self._pending = 0
+        self._last = time.monotonic()
+
+    def __call__(self, n: int) -> None:
+        self._pending += n
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            self.flush()
+
+    def flush(self) -> None:
+        """Report any bytes not yet given to the callback."""
+        if self._pending:
+            pending, self._pending = self._pending, 0
+            self.callback(pending)
+
+
+def iter_response(res: Any, buffer_size: int = STREAM_BUFFER_SIZE) -> Iterator[memoryview]:
+    """Stream the body of a `requests` response through one reusable buffer.
+
+    Where the body is not content-encoded, the raw stream is read with `readinto` so no new bytes object is
+    allocated per chunk. Each view yielded is only valid until the next is requested.
+
+    :param res: Streamed response object
+    :param buffer_size: Maximum size in bytes of each chunk, defaults to STREAM_BUFFER_SIZE
+    :return: Iterator of memoryviews over the response body
+    """
+    raw = getattr(res, "raw", None)
+    if raw is None or not hasattr(raw, "readinto") or res.headers.get("content-encoding", "identity") != "identity":
+        # let requests decode compressed bodies
+        for data in res.iter_content(buffer_size):
+            yield memoryview(data)
+        return
+
+    view = memoryview(bytearray(buffer_size))
+    while n := raw.readinto(view):
+        yield view[:n]
+
+
+def sha256_digest(f: IO[bytes]) -> str:
+    """Compute the SHA-256 hex digest of a binary file object, read from its current position to the end.
+
+    :param f: File object opened for reading in binary mode
+    :return: Hex digest
+    """
+    sha256 = hashlib.sha256()
+    while data := f.read(DIGEST_BLOCK_SIZE):
+        sha256.update(data)
+    return sha256.hexdigest()
+
+
+def pwrite_all(fd: int, data: bytes | memoryview, offset: int) -> None:
+    """Write all of `data` at `offset` in the open file descriptor, without moving its position.
+
+    :param fd: File descriptor opened for writing
+    :param data: Bytes to write
+    :param offset: Byte offset within the file
+    """
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+class ProgressReader:
+    """Wrap a readable file object for use as a streamed request body, reading it in large blocks.
+
+    HTTP clients read request bodies in small blocks (16 KiB for urllib3), so each read is widened to at least
+    `buffer_size` bytes, and progress is reported through a :class:`ThrottledProgress`. Every other attribute is
+    passed through to the wrapped object, so the body's length can still be found with `seek` and `tell`.
+
+    :param data: Readable file object
+    :param callback: Function given the number of bytes read, defaults to None
+    :param buffer_size: Minimum size in bytes of each read, defaults to STREAM_BUFFER_SIZE
+    :param hasher: Hash object (e.g. `hashlib.sha256()`) updated with every block read, defaults to None
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        callback: Callable[[int], Any] | None = None,
+        buffer_size: int = STREAM_BUFFER_SIZE,
+        hasher: Any = None,
+    ) -> None:
+        self._data = data
+        self._progress = ThrottledProgress(callback) if callback is not None else None
+        self._buffer_size = buffer_size
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._data.read(max(size, self._buffer_size) if size >= 0 else size)
+        if self._hasher is not None:
+            self._hasher.update(data)
+        if self._progress is not None:
+            self._progress(len(data))
+            if not data or size < 0:
+                self._progress.flush()
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._data, name)
+
+
+class _ZipSink:
+    """Private class. Unseekable write target collecting a zip archive's bytes until they are drained."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def iter_zip(
+    root: str,
+    stored_patterns: Iterable[str] = ZIP_STORED_PATTERNS,
+    buffer_size: int = STREAM_BUFFER_SIZE,
+    callback: Callable[[int], Any] | None = None,
+) -> Iterator[bytes]:
+    """Generate a zip archive of a directory on the fly, without writing it to disk.
+
+    Entries are named relative to `root`, as with `shutil.make_archive`. Files matching any of `stored_patterns` are
+    stored as-is, and all others are deflated. As the archive is streamed, its size is not known in advance.
+
+    :param root: Directory to archive
+    :param stored_patterns: Glob patterns of file names to store without compression, defaults to ZIP_STORED_PATTERNS
+    :param buffer_size: Size in bytes of each read from the source files, defaults to STREAM_BUFFER_SIZE
+    :param callback: Function given the number of source file bytes read, defaults to None
+    :return: Iterator of chunks of the zip archive
+    """
+    stored_patterns = list(stored_patterns)
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:  # type: ignore[reportArgumentType]
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in dirnames:
+                dir_path = os.path.join(dirpath, name)
+                zf.writestr(zipfile.ZipInfo.from_file(dir_path, os.path.relpath(dir_path, root)), b"")
+
+            for name in sorted(filenames):
+                file_path = os.path.join(dirpath, name)
+                zinfo = zipfile.ZipInfo.from_file(file_path, os.path.relpath(file_path, root))
+                if any(fnmatch.fnmatch(name.lower(), pattern) for pattern in stored_patterns):
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+                with open(file_path, "rb") as src, zf.open(zinfo, "w") as dest:
+                    while data := src.read(buffer_size):
+                        dest.write(data)
+                        if callback is not None:
+                            callback(len(data))
+                        if chunk := sink.drain():
+                            yield chunk
+                if chunk := sink.drain():
+                    yield chunk
+
+    if chunk := sink.drain():
+        yield chunk
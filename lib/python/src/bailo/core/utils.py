@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import contextlib
 import os
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from enum import Enum
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 NO_COLOR = "NO_COLOR" in os.environ
 
 
@@ -64,6 +71,47 @@ def normalise_json_params(value: Any) -> Any:
     return value
 
 
+def _request_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+    """Private function. Identify a GET request by its URL and query parameters, ignoring None-valued parameters.
+
+    :param url: Request URL
+    :param params: Query parameters, defaults to None
+    :return: Key which is equal for identical requests
+    """
+    if not params:
+        return url
+    return f"{url}?{sorted((k, str(v)) for k, v in params.items() if v is not None)}"
+
+
+@contextlib.contextmanager
+def _file_lock(path: str, blocking: bool = True) -> Iterator[bool]:
+    """Private function. Hold an exclusive lock on `path`, shared between threads and processes on one host.
+
+    :param path: Path of the lock file, created if missing
+    :param blocking: Wait for the lock if it is held elsewhere, defaults to True
+    :return: Context manager giving True if the lock is held, or False if `blocking` is False and it was not free
+    """
+    with open(path, "a+b") as f:
+        try:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            if blocking:
+                raise
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 class NestedDict(dict):
     def __getitem__(self, keytuple):
         """Retrieve a value from a (possibly nested) dictionary using a single key or a tuple of keys.
@@ -113,6 +113,10 @@ class Datacard(Entry):
         :param datacard_id: A unique datacard ID
         :return: A datacard object
         """
+        datacard = cls._live(client, datacard_id)
+        if datacard is not None:
+            return datacard
+
         res = client.get_model(model_id=datacard_id)["model"]
         if res["kind"] != "data-card":
             raise BailoException(
@@ -121,9 +125,21 @@ class Datacard(Entry):
 
         logger.info("Datacard %s successfully retrieved from server.", datacard_id)
 
+        return cls._track(client, res)
+
+    @classmethod
+    def _from_model(cls, client: Client, res: dict[str, Any], card: bool = True, lazy: bool = False) -> Datacard:
+        """Private method. Build a datacard from a `get_model` response.
+
+        :param client: A client object used to interact with Bailo
+        :param res: Model dictionary from the API response
+        :param card: Unpack the latest card from `res`, defaults to True
+        :param lazy: If not unpacking the card, fetch it on first access to a card property, defaults to False
+        :return: A datacard object
+        """
         datacard = cls(
             client=client,
-            datacard_id=datacard_id,
+            datacard_id=res["id"],
             name=res["name"],
             description=res["description"],
             collaborators=res["collaborators"],
@@ -132,8 +148,10 @@ class Datacard(Entry):
             tags=res.get("tags"),
         )
         datacard._unpack(res)
-
-        datacard.get_card_latest()
+        if card:
+            datacard._unpack_latest_card(res)
+        elif lazy:
+            datacard._card_pending = True
 
         return datacard
 
@@ -152,6 +170,7 @@ class Datacard(Entry):
 
         :return: Datacard as a dictionary.
         """
+        self.prefetch()
         return self._card
 
     @data_card.setter
@@ -160,6 +179,7 @@ class Datacard(Entry):
 
         :param value: The new datacard metadata as a dictionary.
         """
+        self.prefetch()
         self._card = value
 
     @property
@@ -168,6 +188,7 @@ class Datacard(Entry):
 
         :return: Datacard version.
         """
+        self.prefetch()
         return self._card_version
 
     @data_card_version.setter
@@ -176,6 +197,7 @@ class Datacard(Entry):
 
         :param value: The version to set.
         """
+        self.prefetch()
         self._card_version = value
 
     @property
@@ -184,6 +206,7 @@ class Datacard(Entry):
 
         :return: Schema ID of the datacard.
         """
+        self.prefetch()
         return self._card_schema
 
     @data_card_schema.setter
@@ -192,4 +215,5 @@ class Datacard(Entry):
 
         :param value: The Schema ID to set.
         """
+        self.prefetch()
         self._card_schema = value
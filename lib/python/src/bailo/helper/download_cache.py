@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Any
+
+# isort: split
+
+from bailo.core.streaming import sha256_digest
+from bailo.core.utils import _file_lock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bailo", "files")
+DEFAULT_MAX_SIZE = 50 * 1024**3
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Private function. Hardlink `src` to `dst`, copying if linking is not possible, replacing any existing `dst`.
+
+    :param src: Existing file
+    :param dst: Destination path
+    """
+    tmp_path = f"{dst}.{os.getpid()}.tmp"
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        # e.g. across devices, or on file systems without hardlinks
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+class DownloadCache:
+    """Represent a local, content-addressed cache of downloaded release files.
+
+    Files are stored once per SHA-256 content digest and indexed by model ID, file ID and file revision, so repeated
+    downloads of the same file are served from disk by hardlink (or copy). When the cache grows beyond `max_size`,
+    the least recently used files are evicted. The cache directory can safely be shared by concurrent processes on
+    one host, as all index changes are made under a file lock.
+
+    >>> cache = DownloadCache("/data/bailo-cache", max_size=100 * 1024**3)
+    >>> release.download_all(path="weights", cache=cache)
+
+    .. warning:: Downloaded files may be hardlinks to the cached copy, so should not be modified in place.
+
+    :param path: Directory to store cached files in, defaults to ~/.cache/bailo/files
+    :param max_size: Maximum total size in bytes of cached files, or None for no limit, defaults to 50 GiB
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, max_size: int | None = DEFAULT_MAX_SIZE) -> None:
+        self.path = path
+        self.max_size = max_size
+
+        self._blobs = os.path.join(path, "blobs")
+        self._index_path = os.path.join(path, "index.json")
+        self._lock_path = os.path.join(path, ".lock")
+        os.makedirs(self._blobs, exist_ok=True)
+
+    @staticmethod
+    def key(model_id: str, file_metadata: dict[str, Any]) -> str:
+        """Build the cache key for a file.
+
+        :param model_id: A unique model ID
+        :param file_metadata: File object from the Bailo API, including its `id`
+        :return: Cache key, changing whenever the file is modified
+        """
+        file_id = file_metadata.get("id") or file_metadata["_id"]
+        revision = f"{file_metadata.get('updatedAt', '')}:{file_metadata.get('size', '')}"
+        return f"{model_id}/{file_id}/{revision}"
+
+    def fetch(self, key: str, dest: str) -> bool:
+        """Write a cached file to `dest`, if present.
+
+        :param key: Cache key from :meth:`key`
+        :param dest: Local path to write the file to
+        :return: True if the file was served from the cache, otherwise False
+        """
+        with _file_lock(self._lock_path):
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return False
+
+            blob = os.path.join(self._blobs, entry["digest"])
+            if not os.path.isfile(blob) or os.path.getsize(blob) != entry["size"]:
+                logger.warning("Cached file for %s is missing or corrupt. Removing from cache.", key)
+                del index[key]
+                self._write_index(index)
+                return False
+
+            _link_or_copy(blob, dest)
+            entry["accessed"] = time.time()
+            self._write_index(index)
+
+        logger.info("File %s served from cache %s.", key, self.path)
+        return True
+
+    def store(self, key: str, src: str) -> None:
+        """Add a downloaded file to the cache, evicting least recently used files if over `max_size`.
+
+        :param key: Cache key from :meth:`key`
+        :param src: Local path of the downloaded file
+        """
+        with open(src, "rb") as f:
+            digest = sha256_digest(f)
+
+        with _file_lock(self._lock_path):
+            blob = os.path.join(self._blobs, digest)
+            if not os.path.isfile(blob):
+                _link_or_copy(src, blob)
+
+            index = self._read_index()
+            index[key] = {"digest": digest, "size": os.path.getsize(blob), "accessed": time.time()}
+            self._evict(index)
+            self._write_index(index)
+
+        logger.info("File %s stored in cache %s.", key, self.path)
+
+    def clear(self) -> None:
+        """Remove every file from the cache."""
+        with _file_lock(self._lock_path):
+            self._write_index({})
+            for blob in os.listdir(self._blobs):
+                os.remove(os.path.join(self._blobs, blob))
+
+    def _evict(self, index: dict[str, Any]) -> None:
+        """Private method. Remove least recently used entries (and their files, once unreferenced) from `index`.
+
+        :param index: Cache index, modified in place
+        """
+        if self.max_size is None:
+            return
+
+        sizes = {entry["digest"]: entry["size"] for entry in index.values()}
+        total = sum(sizes.values())
+        for key, entry in sorted(index.items(), key=lambda item: item[1]["accessed"]):
+            if total <= self.max_size:
+                break
+            del index[key]
+            if all(other["digest"] != entry["digest"] for other in index.values()):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(os.path.join(self._blobs, entry["digest"]))
+                total -= entry["size"]
+                logger.info("Evicted %s from cache %s.", key, self.path)
+
+    def _read_index(self) -> dict[str, Any]:
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: dict[str, Any]) -> None:
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._index_path)
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import logging
+import threading
 import warnings
-from typing import Any
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from bailo.core.client import Client
 from bailo.core.enums import CollaboratorEntry, EntryKind, MinimalSchema, ModelVisibility
 
+# concurrent get_model requests made when building many entries at once
+HYDRATE_MAX_WORKERS = 8
 logger = logging.getLogger(__name__)
 
+EntryT = TypeVar("EntryT", bound="Entry")
+
 
 class Entry:
     """Represent an entry in Bailo
@@ -54,6 +61,95 @@ class Entry:
         self._card = None
         self._card_version = None
         self._card_schema = None
+        # set for entries built without their card, which is then fetched on first access
+        self._card_pending = False
+        self._card_lock = threading.Lock()
+
+    @classmethod
+    def from_ids(
+        cls: type[EntryT], client: Client, ids: Iterable[str], max_workers: int = HYDRATE_MAX_WORKERS
+    ) -> list[EntryT]:
+        """Return many existing entries from Bailo, fetched concurrently with `from_id`.
+
+        >>> models = Model.from_ids(client, ["yolo-abcdef", "resnet-123456"])
+
+        :param client: A client object used to interact with Bailo
+        :param ids: Unique entry IDs
+        :param max_workers: Maximum number of concurrent requests, defaults to HYDRATE_MAX_WORKERS
+        :raises BailoException: If any ID does not exist or belongs to another kind of entry.
+        :return: List of entry objects, in the order of `ids`
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda entry_id: cls.from_id(client, entry_id), ids))  # type: ignore[reportAttributeAccessIssue]
+
+    @classmethod
+    def _live(cls: type[EntryT], client: Client, entry_id: str) -> EntryT | None:
+        """Private method. Get the live entry with `entry_id` from the client's identity map, if it is fresh.
+
+        :param client: A client object used to interact with Bailo
+        :param entry_id: A unique entry ID
+        :return: The live entry, or None if it must be fetched
+        """
+        if client.identity_map is None:
+            return None
+        return client.identity_map.get((cls, entry_id))
+
+    @classmethod
+    def _track(cls: type[EntryT], client: Client, res: dict[str, Any], card: bool = True, lazy: bool = False) -> EntryT:
+        """Private method. Build an entry from a `get_model` response or search result, or update the live entry
+        with the same ID in the client's identity map.
+
+        :param client: A client object used to interact with Bailo
+        :param res: Model dictionary from the API response
+        :param card: Unpack the latest card from `res`, defaults to True
+        :param lazy: If not unpacking the card of a new entry, fetch it on first access, defaults to False
+        :return: The entry
+        """
+        identity_map = client.identity_map
+        if identity_map is None:
+            return cls._from_model(client, res, card=card, lazy=lazy)  # type: ignore[reportAttributeAccessIssue]
+
+        key = (cls, res["id"])
+        tag = f"model:{res['id']}"
+        entry, added = identity_map.get_or_add(
+            key,
+            lambda: cls._from_model(client, res, card=card, lazy=lazy),  # type: ignore[reportAttributeAccessIssue]
+            tag=tag,
+            # an entry without its card is only complete if it will be fetched on first access
+            stale=not (card or lazy),
+        )
+        if added:
+            return entry
+
+        entry._unpack(res)
+        if card:
+            entry._unpack_latest_card(res)
+            identity_map.add(key, entry, tag=tag)
+        # otherwise the summary alone leaves the live entry's card, and so its staleness, unchanged
+        return entry
+
+    @staticmethod
+    def prefetch_all(entries: Iterable[Entry], max_workers: int = HYDRATE_MAX_WORKERS) -> None:
+        """Fetch the cards of many lazily loaded entries concurrently (see `prefetch`).
+
+        :param entries: Entry objects, e.g. from `Model.search(client, lazy=True)`
+        :param max_workers: Maximum number of concurrent requests, defaults to HYDRATE_MAX_WORKERS
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda entry: entry.prefetch(), entries))
+
+    def prefetch(self) -> None:
+        """Fetch the card now if it is loaded lazily, rather than on first access to a card property.
+
+        :raises BailoException: If the card could not be fetched, in which case it is fetched again on next access.
+        """
+        if not self._card_pending:
+            return
+        with self._card_lock:
+            # another thread may have fetched the card while this one waited
+            if self._card_pending:
+                self.get_card_latest()
+                self._card_pending = False
 
     def update(self) -> None:
         """Upload and retrieve any changes to the entry summary on Bailo."""
@@ -111,8 +207,15 @@ class Entry:
     def get_card_latest(self) -> None:
         """Get the latest card from Bailo."""
         res = self.client.get_model(model_id=self.id)
-        if "card" in res["model"]:
-            self._unpack_card(res["model"]["card"])
+        self._unpack_latest_card(res["model"])
+
+    def _unpack_latest_card(self, res: dict[str, Any]) -> None:
+        """Private method. Unpack the latest card from a `get_model` response, warning if the entry has none.
+
+        :param res: Model dictionary from the API response.
+        """
+        if "card" in res:
+            self._unpack_card(res["card"])
             logger.info("Latest card for ID %s successfully retrieved.", self.id)
         else:
             warnings.warn(
@@ -144,6 +247,7 @@ class Entry:
         :param card: Metadata dictionary to update, defaults to None to use existing card.
         """
         if card is None:
+            self.prefetch()
             card = self._card
 
         res = self.client.put_model_card(model_id=self.id, metadata=card)
@@ -188,5 +292,7 @@ class Entry:
             self._card = res["metadata"]
         except KeyError:
             self._card = None
+        # cleared last, as readers skip the lock once it is clear
+        self._card_pending = False
 
         logger.info("Card attributes for ID %s successfully unpacked.", self.id)
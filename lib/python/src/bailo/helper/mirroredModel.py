@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from semantic_version import Version
@@ -11,7 +12,7 @@ from semantic_version import Version
 from bailo.core.client import Client
 from bailo.core.enums import CollaboratorEntry, EntryKind, ModelVisibility
 from bailo.core.exceptions import BailoException
-from bailo.helper.entry import Entry
+from bailo.helper.entry import HYDRATE_MAX_WORKERS, Entry
 from bailo.helper.release import Release
 
 logger = logging.getLogger(__name__)
@@ -151,6 +152,10 @@ class MirroredModel(Entry):
         :param model_id: A unique mirrored model ID
         :return: A mirrored model object
         """
+        model = cls._live(client, model_id)
+        if model is not None:
+            return model
+
         res = client.get_model(model_id=model_id)["model"]
         if res["kind"] != EntryKind.MIRRORED_MODEL:
             raise BailoException(
@@ -159,22 +164,7 @@ class MirroredModel(Entry):
 
         logger.info("Model %s successfully retrieved from server.", model_id)
 
-        model = cls(
-            client=client,
-            model_id=model_id,
-            name=res["name"],
-            description=res["description"],
-            sourceModelId=res["settings"]["mirror"]["sourceModelId"],
-            collaborators=res["collaborators"],
-            organisation=res.get("organisation"),
-            state=res.get("state"),
-            tags=res.get("tags"),
-        )
-
-        model._unpack(res)
-        model.get_card_latest()
-
-        return model
+        return cls._track(client, res)
 
     @classmethod
     def search(
@@ -191,6 +181,9 @@ class MirroredModel(Entry):
         admin_access: bool | None = None,
         peers: list[str] | None = None,
         title_only: bool | None = None,
+        hydrate: bool = True,
+        max_workers: int = HYDRATE_MAX_WORKERS,
+        lazy: bool = False,
     ) -> list[MirroredModel]:
         """Return a list of mirrored model objects from Bailo, based on search parameters.
 
@@ -212,6 +205,12 @@ class MirroredModel(Entry):
         :param peers: List of peer identifiers to include remote search results from, defaults to None
         :param title_only: If True, limits searching to mirrored model titles only and disables
             full-text search, defaults to None
+        :param hydrate: Fetch each mirrored model's settings and latest card, defaults to True. If False, objects
+            are built from the search results alone, without `sourceModelId` or a card, for listing
+        :param max_workers: Maximum number of concurrent requests fetching mirrored models, defaults to
+            HYDRATE_MAX_WORKERS
+        :param lazy: Without hydration, fetch each mirrored model's card on first access to a card property (or
+            `prefetch`), defaults to False
         :return: List of mirrored model objects
         """
         res = client.get_models(
@@ -228,37 +227,55 @@ class MirroredModel(Entry):
             peers=peers,
             title_only=title_only,
         )
-        models = []
-
-        for model in res["models"]:
-            res_model = client.get_model(model_id=model["id"])["model"]
-            model_obj = cls(
-                client=client,
-                model_id=model["id"],
-                name=model["name"],
-                description=model["description"],
-                sourceModelId=res_model["settings"]["mirror"]["sourceModelId"],
-                collaborators=model["collaborators"],
-                organisation=model.get("organisation"),
-                state=model.get("state"),
-                tags=model.get("tags"),
-            )
-            model_obj._unpack(res_model)
-            model_obj.get_card_latest()
-            models.append(model_obj)
+        if not hydrate:
+            return [cls._track(client, model, card=False, lazy=lazy) for model in res["models"]]
+
+        def hydrate_model(model: dict[str, Any]) -> MirroredModel:
+            return cls._track(client, client.get_model(model_id=model["id"])["model"])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(hydrate_model, res["models"]))
+
+    @classmethod
+    def _from_model(cls, client: Client, res: dict[str, Any], card: bool = True, lazy: bool = False) -> MirroredModel:
+        """Private method. Build a mirrored model from a `get_model` response or search result.
+
+        :param client: A client object used to interact with Bailo
+        :param res: Model dictionary from the API response
+        :param card: Unpack the latest card from `res`, defaults to True
+        :param lazy: If not unpacking the card, fetch it on first access to a card property, defaults to False
+        :return: A mirrored model object
+        """
+        model = cls(
+            client=client,
+            model_id=res["id"],
+            name=res["name"],
+            description=res["description"],
+            sourceModelId=res.get("settings", {}).get("mirror", {}).get("sourceModelId", ""),
+            collaborators=res.get("collaborators"),
+            organisation=res.get("organisation"),
+            state=res.get("state"),
+            tags=res.get("tags"),
+        )
+        model._unpack(res)
+        if card:
+            model._unpack_latest_card(res)
+        elif lazy:
+            model._card_pending = True
 
-        return models
+        return model
 
-    def get_releases(self) -> list[Release]:
+    def get_releases(self, max_workers: int = 1) -> list[Release]:
         """Get all releases for the mirrored model.
 
+        Releases are built from the bodies listed by one `get_all_releases` request. Any listed without all of their
+        fields are fetched individually.
+
+        :param max_workers: Maximum number of concurrent requests for incompletely listed releases, defaults to 1
         :return: List of Release objects
         """
         res = self.client.get_all_releases(model_id=self.model_id)
-        releases = []
-
-        for release in res["releases"]:
-            releases.append(self.get_release(version=release["semver"]))
+        releases = Release._from_listing(self.client, self.model_id, res["releases"], max_workers=max_workers)
 
         logger.info("Successfully retrieved all releases for mirrored model %s.", self.model_id)
 
@@ -275,20 +292,22 @@ class MirroredModel(Entry):
     def get_latest_release(self):
         """Get the latest release for the mirrored model from Bailo.
 
+        Only the release with the highest version is built, from a single `get_all_releases` request.
+
         :return: Release object
         """
-        releases = self.get_releases()
-        if not releases:
+        res = self.client.get_all_releases(model_id=self.model_id)
+        latest_release = Release._latest_from_listing(self.client, self.model_id, res["releases"])
+        if latest_release is None:
             raise BailoException("This mirrored model has no releases.")
 
-        latest_release = max(releases)
         logger.info(
             "latest_release (%s) for %s retrieved successfully.",
             str(latest_release.version),
             self.model_id,
         )
 
-        return max(releases)
+        return latest_release
 
     def get_images(self):
         """Get all model image references for the mirrored model.
@@ -318,15 +337,23 @@ class MirroredModel(Entry):
         self._update_card(card=model_card)
 
     def get_card_latest(self) -> None:
-        """Get the latest card from Bailo."""
+        """Get the latest card and additional information from Bailo."""
         res = self.client.get_model(model_id=self.id)
-        if "card" in res["model"]:
-            self._unpack_card(res["model"]["card"])
+        self._unpack_latest_card(res["model"])
+
+    def _unpack_latest_card(self, res: dict[str, Any]) -> None:
+        """Private method. Unpack the latest card and additional information from a `get_model` response, warning if
+        the mirrored model has either missing.
+
+        :param res: Model dictionary from the API response.
+        """
+        if "card" in res:
+            self._unpack_card(res["card"])
             logger.info("Latest card for ID %s successfully retrieved.", self.id)
         else:
             warnings.warn(f"ID {self.id} does not have any associated model card.")
-        if "mirroredCard" in res["model"]:
-            self._unpack_card(res["model"]["mirroredCard"], True)
+        if "mirroredCard" in res:
+            self._unpack_card(res["mirroredCard"], True)
         else:
             warnings.warn(f"ID {self.id} does not have any associated additional information.")
 
@@ -347,6 +374,7 @@ class MirroredModel(Entry):
 
         :return: Model card data.
         """
+        self.prefetch()
         return {"card": self._card, "additional_information": self._mirrored_card}
 
     @property
@@ -355,6 +383,7 @@ class MirroredModel(Entry):
 
         :return: Model card version.
         """
+        self.prefetch()
         return {
             "card": self._card_version,
             "additional_information": self._mirrored_card_version,
@@ -366,6 +395,7 @@ class MirroredModel(Entry):
 
         :return: Model card schema.
         """
+        self.prefetch()
         return self._card_schema
 
     def __repr__(self) -> str:
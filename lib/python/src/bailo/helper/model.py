@@ -5,6 +5,7 @@ import os
 import shutil
 import tempfile
 import warnings
+from collections.abc import Iterator
 from typing import Any
 
 from semantic_version import Version
@@ -129,15 +130,31 @@ class Model(Entry):
         :param model_id: A unique model ID
         :return: A model object
         """
+        model = cls._live(client, model_id)
+        if model is not None:
+            return model
+
         res = client.get_model(model_id=model_id)["model"]
         if res["kind"] != "model":
             raise BailoException(f"ID {model_id} does not belong to a model. Did you mean to use Datacard.from_id()?")
 
         logger.info("Model %s successfully retrieved from server.", model_id)
 
+        return cls._track(client, res)
+
+    @classmethod
+    def _from_model(cls, client: Client, res: dict[str, Any], card: bool = True, lazy: bool = False) -> Model:
+        """Private method. Build a model from a `get_model` response or search result.
+
+        :param client: A client object used to interact with Bailo
+        :param res: Model dictionary from the API response
+        :param card: Unpack the latest card from `res`, defaults to True
+        :param lazy: If not unpacking the card, fetch it on first access to a card property, defaults to False
+        :return: A model object
+        """
         model = cls(
             client=client,
-            model_id=model_id,
+            model_id=res["id"],
             name=res["name"],
             description=res["description"],
             collaborators=res["collaborators"],
@@ -145,9 +162,11 @@ class Model(Entry):
             state=res.get("state"),
             tags=res.get("tags"),
         )
-
         model._unpack(res)
-        model.get_card_latest()
+        if card:
+            model._unpack_latest_card(res)
+        elif lazy:
+            model._card_pending = True
 
         return model
 
@@ -166,6 +185,7 @@ class Model(Entry):
         admin_access: bool | None = None,
         peers: list[str] | None = None,
         title_only: bool | None = None,
+        lazy: bool = False,
     ) -> list[Model]:
         """Return a list of model objects from Bailo, based on search parameters.
 
@@ -187,6 +207,8 @@ class Model(Entry):
         :param peers: List of peer identifiers to include remote search results from, defaults to None
         :param title_only: If True, limits searching to model titles only and disables
             full-text search, defaults to None
+        :param lazy: Fetch each model's card on first access to a card property (or `prefetch`), as search results
+            do not include it, defaults to False
         :return: List of model objects
         """
         res = client.get_models(
@@ -203,27 +225,70 @@ class Model(Entry):
             peers=peers,
             title_only=title_only,
         )
-        models: list[Model] = []
-
-        for model_data in res["models"]:
-            model_obj = cls(
-                client=client,
-                model_id=model_data["id"],
-                name=model_data["name"],
-                description=model_data["description"],
-                collaborators=model_data["collaborators"],
-                organisation=model_data.get("organisation"),
-                state=model_data.get("state"),
-                tags=model_data.get("tags"),
-            )
-            model_obj._unpack(model_data)
+        return [cls._track(client, model_data, card="card" in model_data, lazy=lazy) for model_data in res["models"]]
 
-            if "card" in model_data:
-                model_obj._unpack_card(model_data["card"])
+    @classmethod
+    def iter_search(
+        cls,
+        client: Client,
+        task: str | None = None,
+        libraries: list[str] | None = None,
+        filters: list[str] | None = None,
+        search: str = "",
+        organisations: list[str] | None = None,
+        states: list[str] | None = None,
+        allow_templating: bool | None = None,
+        schema_id: str | None = None,
+        admin_access: bool | None = None,
+        peers: list[str] | None = None,
+        title_only: bool | None = None,
+        page_size: int = 100,
+        lazy: bool = False,
+    ) -> Iterator[Model]:
+        """Iterate over model objects from Bailo, based on search parameters, as `search` returns them.
 
-            models.append(model_obj)
+        Results are requested `page_size` at a time (see `Client.iter_models`), and each model object is only
+        built once the iterator reaches it, so memory use stays flat however many models match.
 
-        return models
+        :param client: A client object used to interact with Bailo
+        :param task: Model task (e.g. image classification), defaults to None
+        :param libraries: Model library (e.g. TensorFlow), defaults to None
+        :param filters: List of collaborator role filters. Special value `"mine"` restricts results to
+            models where the current user is a collaborator. Otherwise, values are treated as collaborator
+            roles, defaults to None
+        :param search: Free-text search string. Always performs a partial, case-insensitive match against
+            the model name. If `title_only` is False, a full-text search across model content is also
+            performed, defaults to ""
+        :param organisations: List of organisation identifiers to restrict results, defaults to None
+        :param states: List of model lifecycle states to restrict results, defaults to None
+        :param allow_templating: If True, restricts results to models with templating enabled, defaults to None
+        :param schema_id: Schema ID to restrict results to models using that schema, defaults to None
+        :param admin_access: If True, returns models requiring admin access. The caller must
+            have the Admin role or the request will be rejected by the backend, defaults to None
+        :param peers: List of peer identifiers to include remote search results from, defaults to None
+        :param title_only: If True, limits searching to model titles only and disables
+            full-text search, defaults to None
+        :param page_size: Number of results requested at a time, defaults to 100
+        :param lazy: Fetch each model's card on first access to a card property (or `prefetch`), as search results
+            do not include it, defaults to False
+        :return: Iterator of model objects
+        """
+        summaries = client.iter_models(
+            page_size=page_size,
+            task=task,
+            libraries=libraries,
+            filters=filters,
+            search=search,
+            kind=EntryKind.MODEL,
+            organisations=organisations,
+            states=states,
+            allow_templating=allow_templating,
+            schema_id=schema_id,
+            admin_access=admin_access,
+            peers=peers,
+            title_only=title_only,
+        )
+        return (cls._track(client, model_data, card="card" in model_data, lazy=lazy) for model_data in summaries)
 
     @classmethod
     def from_mlflow(
@@ -377,16 +442,17 @@ class Model(Entry):
             )
         raise BailoException("Create a model card before creating a release")
 
-    def get_releases(self) -> list[Release]:
+    def get_releases(self, max_workers: int = 1) -> list[Release]:
         """Get all releases for the model.
 
+        Releases are built from the bodies listed by one `get_all_releases` request. Any listed without all of their
+        fields are fetched individually.
+
+        :param max_workers: Maximum number of concurrent requests for incompletely listed releases, defaults to 1
         :return: List of Release objects
         """
         res = self.client.get_all_releases(model_id=self.model_id)
-        releases = []
-
-        for release in res["releases"]:
-            releases.append(self.get_release(version=release["semver"]))
+        releases = Release._from_listing(self.client, self.model_id, res["releases"], max_workers=max_workers)
 
         logger.info("Successfully retrieved all releases for model %s.", self.model_id)
 
@@ -403,20 +469,22 @@ class Model(Entry):
     def get_latest_release(self):
         """Get the latest release for the model from Bailo.
 
+        Only the release with the highest version is built, from a single `get_all_releases` request.
+
         :return: Release object
         """
-        releases = self.get_releases()
-        if not releases:
+        res = self.client.get_all_releases(model_id=self.model_id)
+        latest_release = Release._latest_from_listing(self.client, self.model_id, res["releases"])
+        if latest_release is None:
             raise BailoException("This model has no releases.")
 
-        latest_release = max(releases)
         logger.info(
             "latest_release (%s) for %s retrieved successfully.",
             str(latest_release.version),
             self.model_id,
         )
 
-        return max(releases)
+        return latest_release
 
     def get_images(self):
         """Get all model image references for the model.
@@ -442,6 +510,7 @@ class Model(Entry):
 
         :return: Model card data.
         """
+        self.prefetch()
         return self._card
 
     @model_card.setter
@@ -450,6 +519,7 @@ class Model(Entry):
 
         :param value: The data to set.
         """
+        self.prefetch()
         self._card = value
 
     @property
@@ -458,6 +528,7 @@ class Model(Entry):
 
         :return: Model card version.
         """
+        self.prefetch()
         return self._card_version
 
     @model_card_version.setter
@@ -466,6 +537,7 @@ class Model(Entry):
 
         :param value: The version to set.
         """
+        self.prefetch()
         self._card_version = value
 
     @property
@@ -474,6 +546,7 @@ class Model(Entry):
 
         :return: Model card schema.
         """
+        self.prefetch()
         return self._card_schema
 
     @model_card_schema.setter
@@ -482,6 +555,7 @@ class Model(Entry):
 
         :param value: The schema to set.
         """
+        self.prefetch()
         self._card_schema = value
 
     def __repr__(self) -> str:
@@ -728,8 +802,7 @@ class Experiment:
                 str(release_new_version),
                 self.model.model_id,
             )
-            for artifact in artifacts:
-                release_new.upload(path=artifact)
+            release_new.upload_many(artifacts)
             self.published = True
 
             if os.path.exists(self.temp_dir) and os.path.isdir(self.temp_dir):
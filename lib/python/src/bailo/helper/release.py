@@ -1,26 +1,247 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import contextlib
 import fnmatch
+import functools
+import hashlib
+import json
 import logging
 import os
-import shutil
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 from typing import Any
 
+import requests
 from semantic_version import Version
 from tqdm import tqdm
-from tqdm.utils import CallbackIOWrapper
 
 # isort: split
 
 from bailo.core.client import Client
-from bailo.core.exceptions import BailoException
+from bailo.core.exceptions import BailoException, ResponseException
+from bailo.core.streaming import (
+    ZIP_STORED_PATTERNS,
+    ProgressReader,
+    ThrottledProgress,
+    iter_response,
+    iter_zip,
+    pwrite_all,
+    sha256_digest,
+)
 from bailo.core.utils import NO_COLOR
-
-BLOCK_SIZE = 1024
+from bailo.helper.download_cache import DownloadCache
+
+# size of the buffer file contents are streamed through, which can be raised for fast links
+BLOCK_SIZE = 1024 * 1024
+# files of at least this many bytes are uploaded in concurrent parts
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 4
+# files uploaded at once by Release.upload_many
+UPLOAD_MAX_WORKERS = 4
+MULTIPART_MAX_ATTEMPTS = 3
+MULTIPART_RETRY_BACKOFF = 1.0
+# byte range fetched by each request of a segmented download
+DOWNLOAD_SEGMENT_SIZE = 64 * 1024 * 1024
+# downloads are written to "<path>.part" until complete, and resumed from it if interrupted
+PART_SUFFIX = ".part"
+# the ETag of the file a partial download belongs to is kept in "<path>.part.etag", to validate resuming from it
+ETAG_SUFFIX = ".etag"
+# uploaded files are tagged with their SHA-256 digest, so identical files can be reused rather than uploaded again
+DIGEST_TAG_PREFIX = "sha256:"
+# progress of multipart uploads from disk is journalled here so interrupted uploads can be resumed
+UPLOAD_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bailo", "uploads")
+# fields of a release response needed to build a Release without fetching it again
+RELEASE_FIELDS = ("semver", "modelCardVersion", "notes", "fileIds", "images", "minor", "draft")
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_version(semver: str) -> Version:
+    """Private function. Parse a release's semantic version, caching the result as versions are compared often.
+
+    :param semver: Semantic version, optionally prefixed with 'v' (e.g. 'v1.0.0')
+    :return: Version object
+    """
+    return Version.coerce(semver[1:] if semver.startswith("v") else semver)
+
+
+def _parse_content_range(res: Any) -> tuple[int, int] | None:
+    """Private function. Get the start offset and full file size from a partial (206) response's `Content-Range`.
+
+    :param res: Response object
+    :return: Tuple of (start, total size) in bytes, or None if the response is not a partial response of known size
+    """
+    if res.status_code != 206:
+        return None
+    try:
+        # e.g. "bytes 100-199/1000"
+        byte_range, total = res.headers["content-range"].split(" ", 1)[1].split("/")
+        return int(byte_range.split("-")[0]), int(total)
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def _expected_sha256(res: Any) -> str | None:
+    """Private function. Get the SHA-256 digest of the full file from a `Repr-Digest` or `Digest` header, if sent.
+
+    :param res: Response object
+    :return: Hex digest, or None if the server did not send a SHA-256 digest
+    """
+    for header in ("repr-digest", "digest"):
+        for item in res.headers.get(header, "").split(","):
+            algorithm, _, value = item.strip().partition("=")
+            if algorithm.lower() == "sha-256" and value:
+                try:
+                    return base64.b64decode(value.strip(":")).hex()
+                except binascii.Error:
+                    return None
+    return None
+
+
+def _range_not_satisfiable(e: BailoException | ResponseException) -> bool:
+    """Private function. Check whether a download failed because its requested range cannot be satisfied (416).
+
+    :param e: Exception raised by the agent for the error response
+    :return: True if the response status was 416
+    """
+    if isinstance(e, BailoException):
+        return e.status_code == 416
+    # non-JSON error responses only carry their status code in the message
+    return str(e).startswith("416 ")
+
+
+def _read_etag(part_path: str) -> str | None:
+    """Private function. Get the ETag saved for a partial download.
+
+    :param part_path: Local path of the partial file
+    :return: ETag, or None if none was saved
+    """
+    try:
+        with open(f"{part_path}{ETAG_SUFFIX}", encoding="utf-8") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+def _write_etag(part_path: str, etag: str | None) -> None:
+    """Private function. Save the ETag of the file a partial download belongs to, or forget it if there is none.
+
+    :param part_path: Local path of the partial file
+    :param etag: ETag sent with the response, or None
+    """
+    if etag is None:
+        _remove(f"{part_path}{ETAG_SUFFIX}")
+        return
+    with open(f"{part_path}{ETAG_SUFFIX}", "w", encoding="utf-8") as f:
+        f.write(etag)
+
+
+def _discard_partial(part_path: str) -> None:
+    """Private function. Delete a partial download and its saved ETag.
+
+    :param part_path: Local path of the partial file
+    """
+    _remove(part_path)
+    _remove(f"{part_path}{ETAG_SUFFIX}")
+
+
+def _remove(path: str) -> None:
+    """Private function. Delete a file if it exists.
+
+    :param path: Local path of the file
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _sha256_file(path: str) -> str:
+    """Private function. Compute the SHA-256 hex digest of a file.
+
+    :param path: Local path of the file
+    :return: Hex digest
+    """
+    with open(path, "rb") as f:
+        return sha256_digest(f)
+
+
+class _UploadJournal:
+    """Private class. On-disk record of a multipart upload's accepted parts, allowing an interrupted upload to resume.
+
+    A journal is keyed by model ID, file name and source path, and is ignored if the source file's size or
+    modification time has changed since it was written.
+    """
+
+    def __init__(self, journal_dir: str, model_id: str, name: str, source: str) -> None:
+        source = os.path.abspath(source)
+        stat = os.stat(source)
+        key = hashlib.sha256(f"{model_id}\0{name}\0{source}".encode()).hexdigest()
+
+        self.path = os.path.join(journal_dir, f"{key}.json")
+        self.source = {"path": source, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+        self.upload: dict[str, Any] | None = None
+        self.parts: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if state.get("source") != self.source:
+            logger.info("Ignoring upload journal %s as %s has changed.", self.path, source)
+            return
+
+        self.upload = state["upload"]
+        self.parts = {int(part_number): etag for part_number, etag in state["parts"].items()}
+
+    def start(self, upload: dict[str, Any]) -> None:
+        """Record a newly started multipart upload.
+
+        :param upload: Response of the multipart start call (fileId, uploadId and chunks)
+        """
+        with self._lock:
+            self.upload = upload
+            self.parts = {}
+            self._save()
+
+    def record(self, part_number: int, etag: str) -> None:
+        """Record a part accepted by the server.
+
+        :param part_number: 1-based part number
+        :param etag: ETag returned for the part
+        """
+        with self._lock:
+            self.parts[part_number] = etag
+            self._save()
+
+    def remove(self) -> None:
+        """Delete the journal from disk."""
+        _remove(self.path)
+
+    def discard(self) -> None:
+        """Delete the journal from disk and forget the upload, so the next upload starts afresh."""
+        with self._lock:
+            self.upload = None
+            self.parts = {}
+            self.remove()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source, "upload": self.upload, "parts": self.parts}, f)
+        # replace atomically so an interruption never leaves a truncated journal
+        os.replace(tmp_path, self.path)
+
+
 class Release:
     def __init__(
         self,
@@ -66,6 +287,11 @@ class Release:
         self.images = images
         self.draft = draft
 
+        # depth of nested `defer_update` contexts, and whether an update was deferred by them
+        self._update_depth = 0
+        self._update_pending = False
+        self._update_lock = threading.Lock()
+
     @classmethod
     def create(
         cls,
@@ -133,16 +359,16 @@ class Release:
         :param client: A client object used to interact with Bailo
         :param model_id: A Unique Model ID
         :param version: A semantic version of a model release
-        :return: Release object
+        :return: Release object, the same live object for each call if the client has an identity map
         """
-        res = client.get_release(model_id, str(version))["release"]
+        identity_map = client.identity_map
+        key = (cls, model_id, str(_parse_version(version) if isinstance(version, str) else version))
+        if identity_map is not None:
+            release = identity_map.get(key)
+            if release is not None:
+                return release
 
-        model_card_version = res["modelCardVersion"]
-        notes = res["notes"]
-        files = res["fileIds"]
-        images = res["images"]
-        minor = res["minor"]
-        draft = res["draft"]
+        res = client.get_release(model_id, str(version))["release"]
 
         logger.info(
             "Release %s of model ID %s successfully retrieved from server.",
@@ -150,28 +376,124 @@ class Release:
             model_id,
         )
 
+        if identity_map is None:
+            return cls._from_response(client, model_id, res, version)
+
+        release, added = identity_map.get_or_add(
+            key, lambda: cls._from_response(client, model_id, res, version), tag=f"model:{model_id}"
+        )
+        if not added:
+            release._unpack(res)
+            identity_map.add(key, release, tag=f"model:{model_id}")
+        return release
+
+    def _unpack(self, res: dict[str, Any]) -> None:
+        """Private method. Update release attributes, other than the version, from a release response body.
+
+        :param res: Release response body
+        """
+        self.model_card_version = res["modelCardVersion"]
+        self.notes = res["notes"]
+        self.files = res["fileIds"]
+        self.images = res["images"]
+        self.minor = res["minor"]
+        self.draft = res["draft"]
+
+    @classmethod
+    def _from_response(
+        cls, client: Client, model_id: str, res: dict[str, Any], version: Version | str | None = None
+    ) -> Release:
+        """Private method. Build a release from a release response body.
+
+        :param client: A client object used to interact with Bailo
+        :param model_id: A Unique Model ID
+        :param res: Release response body, as returned by `get_release` or in `get_all_releases`
+        :param version: A semantic version of the release, defaults to the `semver` of the response
+        :return: Release object
+        """
         return cls(
             client,
             model_id,
-            version,
-            model_card_version,
-            notes,
-            files,
-            images,
-            minor,
-            draft,
+            version if version is not None else res["semver"],
+            res["modelCardVersion"],
+            res["notes"],
+            res["fileIds"],
+            res["images"],
+            res["minor"],
+            res["draft"],
         )
 
-    def download(self, filename: str, write: bool = True, path: str | None = None) -> Any:
+    @classmethod
+    def _from_listing(
+        cls, client: Client, model_id: str, listing: list[dict[str, Any]], max_workers: int = 1
+    ) -> list[Release]:
+        """Private method. Build releases from the bodies in a `get_all_releases` response.
+
+        Releases are built from their listed bodies without further requests. Only those missing a field are fetched
+        with `from_version`, using up to `max_workers` concurrent requests.
+
+        :param client: A client object used to interact with Bailo
+        :param model_id: A Unique Model ID
+        :param listing: Release bodies from the `releases` key of a `get_all_releases` response
+        :param max_workers: Maximum number of concurrent requests for incomplete releases, defaults to 1
+        :return: List of Release objects, in the order listed
+        """
+        releases: list[Release | None] = [
+            cls._from_response(client, model_id, res) if all(field in res for field in RELEASE_FIELDS) else None
+            for res in listing
+        ]
+
+        missing = [i for i, release in enumerate(releases) if release is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = executor.map(lambda i: cls.from_version(client, model_id, listing[i]["semver"]), missing)
+                for i, release in zip(missing, fetched):
+                    releases[i] = release
+
+        return releases  # type: ignore[reportReturnType]
+
+    @classmethod
+    def _latest_from_listing(cls, client: Client, model_id: str, listing: list[dict[str, Any]]) -> Release | None:
+        """Private method. Build the release with the highest version from the bodies in a `get_all_releases`
+        response, without building the others.
+
+        :param client: A client object used to interact with Bailo
+        :param model_id: A Unique Model ID
+        :param listing: Release bodies from the `releases` key of a `get_all_releases` response
+        :return: Release object, or None if there are no releases
+        """
+        if not listing:
+            return None
+        latest = max(listing, key=lambda res: _parse_version(res["semver"]))
+        return cls._from_listing(client, model_id, [latest])[0]
+
+    def download(
+        self,
+        filename: str,
+        write: bool = True,
+        path: str | None = None,
+        max_workers: int = 1,
+        segment_size: int = DOWNLOAD_SEGMENT_SIZE,
+        cache: DownloadCache | None = None,
+    ) -> Any:
         """Returns a response object given the file name and optionally writes file to disk.
 
+        Files are written to `<path>.part` and only renamed into place once their size (and a SHA-256 digest, if the
+        server sends a `Repr-Digest` or `Digest` header) checks out. If a `.part` file is left behind by an
+        interrupted download, the next download of the same path resumes from its current length.
+
         :param filename: The name of the file to retrieve
         :param write: Bool to determine if writing file to disk, defaults to True
         :param path: Local path to write file to (if write set to True)
-
-        :return: A JSON response object
+        :param max_workers: Maximum number of concurrent HTTP Range requests used to fetch the file in segments of
+            `segment_size` bytes (if write set to True), defaults to 1. Falls back to a single stream if the
+            server does not support range requests
+        :param segment_size: Size in bytes of each segment of a segmented download, defaults to 64 MiB
+        :param cache: Local download cache to serve the file from, and to add it to once downloaded (if write set to
+            True), defaults to None
+
+        :return: A JSON response object, or None if the file was served from `cache` (there being no response)
         """
-        res = self.client.get_download_by_filename(self.model_id, str(self.version), filename)
         logger.info(
             "Downloading file %s from version %s of %s...",
             filename,
@@ -182,55 +504,310 @@ class Release:
         if write:
             if path is None:
                 path = filename
-            total_size = int(res.headers.get("content-length", 0))
+            res = self._download_file(filename, path, cache, max_workers=max_workers, segment_size=segment_size)
+            logger.info("File written to %s", path)
+        else:
+            res = self.client.get_download_by_filename(self.model_id, str(self.version), filename)
 
-            if NO_COLOR:
-                colour = "white"
-            else:
-                colour = "green"
+        logger.info(
+            "Downloading of file %s from version %s of %s completed.",
+            filename,
+            str(self.version),
+            self.model_id,
+        )
+
+        return res
+
+    def _download_file(
+        self,
+        filename: str,
+        path: str,
+        cache: DownloadCache | None = None,
+        file_metadata: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Private method. Download a file to disk, through the download cache if given.
+
+        :param filename: The name of the file to retrieve
+        :param path: Local path to write the file to
+        :param cache: Local download cache, defaults to None
+        :param file_metadata: File object from the release, looked up by name if needed, defaults to None
+        :param **kwargs: Kwargs passed to :meth:`_fetch_to_path`
+        :return: The (consumed) response object, or None if the file was served from the cache
+        """
+        if cache is None:
+            return self._fetch_to_path(filename, path, **kwargs)
 
-            with tqdm(
-                total=total_size,
+        if file_metadata is None:
+            file_metadata = self._get_files_metadata().get(filename)
+            if file_metadata is None:
+                return self._fetch_to_path(filename, path, **kwargs)
+
+        key = DownloadCache.key(self.model_id, file_metadata)
+        if cache.fetch(key, path):
+            if kwargs.get("t") is not None:
+                kwargs["t"].update(file_metadata.get("size", 0))
+            return None
+
+        res = self._fetch_to_path(filename, path, **kwargs)
+        cancelled = kwargs.get("cancelled")
+        if cancelled is None or not cancelled.is_set():
+            cache.store(key, path)
+
+        return res
+
+    def _get_files_metadata(self) -> dict[str, dict[str, Any]]:
+        """Private method. Get the file objects of this release from Bailo.
+
+        :return: Dictionary of file objects keyed by file name
+        """
+        files_metadata = self.client.get_release(self.model_id, str(self.version))["release"]["files"]
+
+        return {file_metadata["name"]: file_metadata for file_metadata in files_metadata}
+
+    def _fetch_to_path(
+        self,
+        filename: str,
+        path: str,
+        max_workers: int = 1,
+        segment_size: int = DOWNLOAD_SEGMENT_SIZE,
+        t: tqdm | None = None,
+        cancelled: threading.Event | None = None,
+    ) -> Any:
+        """Private method. Download a file via `<path>.part`, resuming any existing partial file of the same file.
+
+        Resuming is validated with the file's ETag, saved alongside the partial file. A partial file without one, or
+        of a file which has since changed, is discarded and the download restarted.
+
+        :param filename: The name of the file to retrieve
+        :param path: Local path to write the file to
+        :param max_workers: Maximum number of concurrent segment requests for a fresh download, defaults to 1
+        :param segment_size: Size in bytes of each segment, defaults to DOWNLOAD_SEGMENT_SIZE
+        :param t: Shared progress bar to advance, defaults to None to create one for this file
+        :param cancelled: Event which, once set, stops the download and leaves the partial file, defaults to None
+        :raises ResponseException: If the downloaded file does not match the expected size or digest.
+        :return: The (consumed) response object
+        """
+        part_path = f"{path}{PART_SUFFIX}"
+        offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        etag = _read_etag(part_path) if offset else None
+        if offset and etag is None:
+            logger.info("Discarding %s as it cannot be validated against %s.", part_path, filename)
+            _discard_partial(part_path)
+            offset = 0
+        segmented = not offset and max_workers > 1 and hasattr(os, "pwrite")
+
+        if offset:
+            byte_range = (offset, None)
+        elif segmented:
+            byte_range = (0, segment_size - 1)
+        else:
+            byte_range = None
+
+        try:
+            res = self.client.get_download_by_filename(
+                self.model_id, str(self.version), filename, byte_range, if_range=etag
+            )
+        except (BailoException, ResponseException) as e:
+            # other failures (e.g. a transient 5xx) leave the partial file to be resumed by the next attempt
+            if byte_range is None or not _range_not_satisfiable(e):
+                raise
+            # e.g. the partial file is stale or already complete, so the range cannot be satisfied
+            logger.warning("Range requested for %s cannot be satisfied. Restarting from the beginning.", filename)
+            if offset:
+                _discard_partial(part_path)
+            return self._fetch_to_path(filename, path, 1, segment_size, t, cancelled)
+
+        content_range = _parse_content_range(res)
+        if content_range is not None and content_range[0] != offset:
+            res.close()
+            raise ResponseException(f"{res.status_code} Unexpected Content-Range for {filename}")
+        if offset and content_range is not None and res.headers.get("etag") != etag:
+            # the server did not honour If-Range, but the file has changed since the partial file was written
+            res.close()
+            logger.info("%s has changed since it was partially downloaded. Restarting from the beginning.", filename)
+            _discard_partial(part_path)
+            return self._fetch_to_path(filename, path, max_workers, segment_size, t, cancelled)
+        if offset and content_range is None:
+            logger.info("Server sent all of %s, which may have changed. Restarting from the beginning.", filename)
+            offset = 0
+        if not offset:
+            _write_etag(part_path, res.headers.get("etag"))
+
+        if content_range is not None:
+            total_size = content_range[1]
+        elif "content-length" in res.headers and res.headers.get("content-encoding", "identity") == "identity":
+            total_size = int(res.headers["content-length"])
+        else:
+            total_size = None
+
+        if offset:
+            logger.info("Resuming download of %s from byte %d.", filename, offset)
+
+        if NO_COLOR:
+            colour = "white"
+        else:
+            colour = "green"
+
+        progress = (
+            tqdm(
+                total=total_size or 0,
                 unit="B",
                 unit_scale=True,
-                unit_divisor=BLOCK_SIZE,
+                unit_divisor=1024,
                 postfix=f"downloading {filename} as {path}",
                 colour=colour,
-            ) as t:
-                with open(path, "wb") as f:
-                    for data in res.iter_content(BLOCK_SIZE):
-                        t.update(len(data))
-                        f.write(data)
+            )
+            if t is None
+            else contextlib.nullcontext(t)
+        )
+        with progress as bar:
+            bar.update(offset)
+            if segmented and content_range is not None and total_size is not None:
+                self._download_segments(filename, res, part_path, total_size, segment_size, max_workers, bar)
+            elif not self._write_response(res, part_path, bar.update, cancelled, append=bool(offset)):
+                return res
 
-            logger.info("File written to %s", path)
+        size = os.path.getsize(part_path)
+        if total_size is not None and size != total_size:
+            raise ResponseException(f"Downloaded {size} of {total_size} bytes of {filename}. Retry to resume.")
+
+        digest = _expected_sha256(res)
+        if digest is not None and _sha256_file(part_path) != digest:
+            _discard_partial(part_path)
+            raise ResponseException(f"Downloaded file {filename} does not match its SHA-256 digest.")
+
+        os.replace(part_path, path)
+        _remove(f"{part_path}{ETAG_SUFFIX}")
+
+        return res
+
+    def _download_segments(
+        self,
+        filename: str,
+        first_res: Any,
+        path: str,
+        total_size: int,
+        segment_size: int,
+        max_workers: int,
+        t: tqdm,
+    ) -> None:
+        """Private method. Download a file as concurrent HTTP Range requests written at their offsets with `pwrite`.
+
+        :param filename: The name of the file to retrieve
+        :param first_res: Partial response for the first segment
+        :param path: Local path to write the file to
+        :param total_size: Size of the whole file in bytes
+        :param segment_size: Size in bytes of each segment
+        :param max_workers: Maximum number of segments fetched at once
+        :param t: Progress bar to advance as bytes are written
+        :raises ResponseException: If a segment is not partial content, or is of another revision of the file.
+        """
+
+        def write_segment(res: Any, offset: int) -> None:
+            progress = ThrottledProgress(t.update)
+            for data in iter_response(res, BLOCK_SIZE):
+                pwrite_all(fd, data, offset)
+                offset += len(data)
+                progress(len(data))
+            progress.flush()
+
+        # every segment must come from the same revision of the file as the first
+        etag = first_res.headers.get("etag")
+
+        def fetch_segment(start: int) -> None:
+            end = min(start + segment_size, total_size) - 1
+            res = self.client.get_download_by_filename(
+                self.model_id, str(self.version), filename, byte_range=(start, end), if_range=etag
+            )
+            if res.status_code != 206:
+                res.close()
+                raise ResponseException(f"{res.status_code} Expected partial content for bytes {start}-{end}")
+            if etag is not None and res.headers.get("etag") != etag:
+                res.close()
+                raise ResponseException(f"{filename} changed on the server during a segmented download. Retry.")
+            write_segment(res, start)
 
         logger.info(
-            "Downloading of file %s from version %s of %s completed.",
+            "Downloading %s in %d segments with up to %d workers.",
             filename,
-            str(self.version),
-            self.model_id,
+            -(-total_size // segment_size),
+            max_workers,
         )
-
-        return res
+        try:
+            with open(path, "wb") as f:
+                # preallocate so each segment can be written in place
+                f.truncate(total_size)
+                fd = f.fileno()
+
+                with ThreadPoolExecutor(max_workers=max_workers - 1) as executor:
+                    futures = [
+                        executor.submit(fetch_segment, start) for start in range(segment_size, total_size, segment_size)
+                    ]
+                    try:
+                        write_segment(first_res, 0)
+                        for future in as_completed(futures):
+                            future.result()
+                    except BaseException:
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        raise
+        except BaseException:
+            os.remove(path)
+            raise
+
+    @staticmethod
+    def _write_response(
+        res: Any,
+        path: str,
+        update: Any,
+        cancelled: threading.Event | None = None,
+        append: bool = False,
+    ) -> bool:
+        """Private method. Stream a download response to disk.
+
+        :param res: Streamed response object
+        :param path: Local path to write the file to
+        :param update: Callback given the number of bytes written, called at most every PROGRESS_INTERVAL seconds
+        :param cancelled: Event which, once set, stops the download, defaults to None
+        :param append: Append to the file rather than overwriting it, defaults to False
+        :return: False if the download was cancelled, otherwise True
+        """
+        progress = ThrottledProgress(update)
+        with open(path, "ab" if append else "wb") as f:
+            for data in iter_response(res, BLOCK_SIZE):
+                if cancelled is not None and cancelled.is_set():
+                    res.close()
+                    progress.flush()
+                    return False
+                f.write(data)
+                progress(len(data))
+        progress.flush()
+
+        return True
 
     def download_all(
         self,
         path: str = os.getcwd(),
         include: list | str | None = None,
         exclude: list | str | None = None,
+        max_workers: int = 1,
+        cache: DownloadCache | None = None,
     ):
         """Writes all files in a release to disk at the given path, applying inclusion/exclusion filters.
 
         :param path: Local directory to output files.
         :param include: List of glob patterns (str) or single string to include, defaults to None
         :param exclude: List of glob patterns (str) or single string to exclude, defaults to None
+        :param max_workers: Maximum number of files downloaded at once, defaults to 1. Concurrent downloads share a
+            single progress bar, and the first failure cancels all outstanding downloads before being raised
+        :param cache: Local download cache to serve files from, and to add them to once downloaded, defaults to None
         :raises BailoException: If the release has no files assigned.
         .. note:: Fnmatch statements support Unix shell-style wildcards.
         """
-        files_metadata = self.client.get_release(self.model_id, str(self.version))["release"]["files"]
-        if files_metadata == []:
+        files_metadata = self._get_files_metadata()
+        if not files_metadata:
             raise BailoException("Release has no associated files.")
-        file_names = [file_metadata["name"] for file_metadata in files_metadata]
+        file_names = list(files_metadata)
         orig_file_names = file_names
 
         if isinstance(include, str):
@@ -254,18 +831,198 @@ class Release:
             {self.model_id},
         )
         os.makedirs(path, exist_ok=True)
+        if max_workers > 1:
+            self._download_concurrently(file_names, files_metadata, path, max_workers, cache)
+            return
+
         for file in file_names:
             file_path = os.path.join(path, file)
-            self.download(filename=file, path=file_path)
+            if cache is None:
+                self.download(filename=file, path=file_path)
+            else:
+                self._download_file(file, file_path, cache, files_metadata[file])
+
+    def _download_concurrently(
+        self,
+        file_names: list[str],
+        files_metadata: dict[str, dict[str, Any]],
+        path: str,
+        max_workers: int,
+        cache: DownloadCache | None = None,
+    ):
+        """Private method. Download files on a bounded thread pool with one aggregate progress bar.
 
-    def upload(self, path: str, data: BytesIO | None = None) -> str:  # type: ignore[reportRedeclaration]
+        :param file_names: Names of the files to download
+        :param files_metadata: File objects keyed by file name, for sizes and cache keys
+        :param path: Local directory to output files
+        :param max_workers: Maximum number of files downloaded at once
+        :param cache: Local download cache, defaults to None
+        """
+        if NO_COLOR:
+            colour = "white"
+        else:
+            colour = "green"
+
+        cancelled = threading.Event()
+
+        with tqdm(
+            total=sum(files_metadata[file].get("size", 0) for file in file_names),
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            postfix=f"downloading {len(file_names)} files to {path}",
+            colour=colour,
+        ) as t:
+
+            def download_file(file: str):
+                if cancelled.is_set():
+                    return
+                self._download_file(
+                    file, os.path.join(path, file), cache, files_metadata[file], t=t, cancelled=cancelled
+                )
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(download_file, file) for file in file_names]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    cancelled.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+        logger.info(
+            "Downloading of %d files from version %s of %s completed.",
+            len(file_names),
+            str(self.version),
+            self.model_id,
+        )
+
+    def upload_many(
+        self,
+        paths: list[str],
+        max_workers: int = UPLOAD_MAX_WORKERS,
+        multipart_threshold: int | None = MULTIPART_THRESHOLD,
+        journal_dir: str | None = UPLOAD_JOURNAL_DIR,
+        stored_patterns: list[str] | str | None = None,
+        deduplicate: bool = False,
+    ) -> list[str]:
+        """Upload many files (or directories) to the release concurrently, then update the release once.
+
+        Every file is uploaded even if another fails, and those uploaded are added to the release before the first
+        failure (in the order of `paths`) is raised.
+
+        :param paths: Paths of the files or directories to be uploaded
+        :param max_workers: Maximum number of files uploaded at once, defaults to UPLOAD_MAX_WORKERS
+        :param multipart_threshold: Size in bytes from which each file is uploaded as concurrent multipart chunks, as
+            for `upload`, defaults to MULTIPART_THRESHOLD (64 MiB)
+        :param journal_dir: Directory in which to journal multipart uploads, as for `upload`, defaults to
+            UPLOAD_JOURNAL_DIR
+        :param stored_patterns: Glob patterns of files stored without compression when zipping directories, as for
+            `upload`, defaults to None
+        :param deduplicate: Reuse existing files with the same SHA-256 digest, as for `upload`, defaults to False
+        :return: The unique file IDs of the files uploaded, in the order of `paths`
+        """
+        with self.defer_update(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # submitted rather than mapped, so a failure does not cancel the uploads yet to start
+            futures = [
+                executor.submit(
+                    self.upload,
+                    path,
+                    multipart_threshold=multipart_threshold,
+                    journal_dir=journal_dir,
+                    stored_patterns=stored_patterns,
+                    deduplicate=deduplicate,
+                )
+                for path in paths
+            ]
+            return [future.result() for future in futures]
+
+    @contextlib.contextmanager
+    def defer_update(self) -> Iterator[Release]:
+        """Defer the release update made after each upload until the context exits, so uploading many files
+        updates the release once rather than once per file.
+
+        If the context raises, the release is still updated with the files uploaded before it did, and any failure of
+        that update is logged rather than raised in place of the original error.
+
+        >>> with release.defer_update():
+        ...     for path in paths:
+        ...         release.upload(path)
+
+        :return: Context manager yielding the release
+        """
+        with self._update_lock:
+            self._update_depth += 1
+        failed = False
+        try:
+            yield self
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._update_lock:
+                self._update_depth -= 1
+                flush = self._update_depth == 0 and self._update_pending
+                if flush:
+                    self._update_pending = False
+            if flush and failed:
+                # still add the files uploaded before the failure, without hiding its cause
+                try:
+                    self.update()
+                except Exception:
+                    logger.warning(
+                        "Update of version %s of %s after a failed upload also failed.",
+                        str(self.version),
+                        self.model_id,
+                        exc_info=True,
+                    )
+            elif flush:
+                self.update()
+
+    def _attach(self, file_id: str) -> None:
+        """Private method. Add an uploaded file to the release, and update the release unless updates are deferred.
+
+        :param file_id: The unique file ID
+        """
+        with self._update_lock:
+            # e.g. a deduplicated file which is already in the release
+            if file_id in self.files:
+                return
+            self.files.append(file_id)
+            if self._update_depth:
+                self._update_pending = True
+                return
+        self.update()
+
+    def upload(  # type: ignore[reportRedeclaration]
+        self,
+        path: str,
+        data: BytesIO | None = None,
+        multipart_threshold: int | None = MULTIPART_THRESHOLD,
+        max_workers: int = MULTIPART_MAX_WORKERS,
+        journal_dir: str | None = UPLOAD_JOURNAL_DIR,
+        stored_patterns: list[str] | str | None = None,
+        deduplicate: bool = False,
+    ) -> str:
         """Upload a file to the release.
 
         :param path: The path, or name of file or directory to be uploaded
         :param data: A BytesIO object if not loading from disk, defaults to None
+        :param multipart_threshold: Size in bytes from which the file is uploaded as concurrent multipart chunks,
+            or None to always use a single request, defaults to MULTIPART_THRESHOLD (64 MiB)
+        :param max_workers: Maximum number of chunks uploaded at once in multipart mode, defaults to 4
+        :param journal_dir: Directory in which to journal multipart uploads of files on disk, so that re-running an
+            interrupted upload of the same path only sends the remaining parts, or None to disable resuming,
+            defaults to UPLOAD_JOURNAL_DIR (~/.cache/bailo/uploads)
+        :param stored_patterns: When uploading a directory, glob patterns (str) or single string of file names to
+            store in the zip without compression, defaults to ZIP_STORED_PATTERNS (already compressed formats)
+        :param deduplicate: Tag the uploaded file with its SHA-256 digest, computed as it is sent, and if a file with
+            the same digest already exists on the model, add that file to the release instead of uploading again,
+            defaults to False. Directories are always uploaded
 
         :return: The unique file ID of the file uploaded
-        .. note:: If path provided is a directory, it will be uploaded as a zip
+        .. note:: If path provided is a directory, it will be zipped on the fly and uploaded as a single stream
         """
         logger.info(
             "Uploading file(s) to version %s of %s...",
@@ -274,33 +1031,57 @@ class Release:
         )
 
         to_close = False
+        journal = None
         # If no datastream object provided
         name = os.path.split(path)[-1]
-        if data is None:
-            # If we haven't passed in a file object, we must create one from the path.
-            # Check if file exists, if it does the zip required
-            zip_required = not os.path.isfile(path)
-
-            if zip_required:
-                logger.info(
-                    "Given path (%s) is a directory. This will be converted to a zip file for upload.",
-                    path,
-                )
-                shutil.make_archive(name, "zip", path)
-                path = f"{name}.zip"
-                name = path
-
-            data: BytesIO = open(path, "rb")  # type: ignore[reportAssignmentType]
-            to_close = True
-
-            if zip_required:
-                os.remove(path)
-
-        # cache the current file position then move to the end and get the size before moving it back.
-        old_file_position = data.tell()
-        data.seek(0, os.SEEK_END)
-        size = data.tell()
-        data.seek(old_file_position, os.SEEK_SET)
+        if data is None and not os.path.isfile(path):
+            if not os.path.isdir(path):
+                raise FileNotFoundError(f"No such file or directory: '{path}'")
+            logger.info(
+                "Given path (%s) is a directory. This will be streamed as a zip file for upload.",
+                path,
+            )
+            name = f"{os.path.basename(os.path.normpath(path))}.zip"
+            if stored_patterns is None:
+                stored_patterns = list(ZIP_STORED_PATTERNS)
+            elif isinstance(stored_patterns, str):
+                stored_patterns = [stored_patterns]
+            # the size of the streamed zip is not known in advance, so progress is measured over the source files
+            size = sum(
+                os.path.getsize(os.path.join(dirpath, file)) for dirpath, _, files in os.walk(path) for file in files
+            )
+        else:
+            if data is None:
+                # If we haven't passed in a file object, we must create one from the path.
+                data: BytesIO = open(path, "rb")  # type: ignore[reportAssignmentType]
+                to_close = True
+                if journal_dir is not None:
+                    journal = _UploadJournal(journal_dir, self.model_id, name, path)
+
+            # cache the current file position then move to the end and get the size before moving it back.
+            old_file_position = data.tell()
+            data.seek(0, os.SEEK_END)
+            size = data.tell()
+            data.seek(old_file_position, os.SEEK_SET)
+
+        digest = None
+        sha256 = None
+        if deduplicate and data is not None:
+            digests = self._file_digests()
+            resuming = journal is not None and journal.upload is not None
+            # only read the file up front if it could match an existing file, or cannot be hashed as it is sent
+            # copied, as concurrent uploads add to the index
+            if resuming or any(file.get("size") == size for file in list(digests.values())):
+                digest = self._sha256_data(data)
+                if digest in digests:
+                    file_id = digests[digest]["id"]
+                    logger.info("File %s matches existing file %s, which will be used instead.", name, file_id)
+                    self._attach(file_id)
+                    if to_close:
+                        data.close()
+                    return file_id
+            else:
+                sha256 = hashlib.sha256()
 
         if NO_COLOR:
             colour = "white"
@@ -311,17 +1092,31 @@ class Release:
             total=size,
             unit="B",
             unit_scale=True,
-            unit_divisor=BLOCK_SIZE,
+            unit_divisor=1024,
             postfix=f"uploading {name}",
             colour=colour,
         ) as t:
-            wrapped_buffer = CallbackIOWrapper(t.update, data, "read")
-            res: dict[str, Any] = self.client._parse_json(
-                self.client.simple_upload(self.model_id, name, wrapped_buffer)  # type: ignore[reportArgumentType]
-            )
+            if data is None:
+                progress = ThrottledProgress(t.update)
+                body = iter_zip(path, stored_patterns, BLOCK_SIZE, progress)
+                res: dict[str, Any] = self.client._parse_json(
+                    self.client.simple_upload(self.model_id, name, body)  # type: ignore[reportArgumentType]
+                )
+                progress.flush()
+            elif multipart_threshold is not None and size >= multipart_threshold:
+                res = self._multipart_upload(name, data, size, t, max_workers, journal, sha256)
+            else:
+                wrapped_buffer = ProgressReader(data, t.update, BLOCK_SIZE, sha256)
+                res = self.client._parse_json(
+                    self.client.simple_upload(self.model_id, name, wrapped_buffer)  # type: ignore[reportArgumentType]
+                )
 
-        self.files.append(res["file"]["id"])
-        self.update()
+        if sha256 is not None:
+            digest = sha256.hexdigest()
+        if digest is not None:
+            res = self._tag_digest(res["file"], digest)
+
+        self._attach(res["file"]["id"])
         if to_close:
             data.close()
         logger.info(
@@ -333,6 +1128,164 @@ class Release:
 
         return res["file"]["id"]
 
+    def _file_digests(self) -> dict[str, dict[str, Any]]:
+        """Private method. Get the model's files keyed by the SHA-256 digest tagged on them at upload.
+
+        The index is held by the client, so is shared by every release of the model uploaded to through it.
+
+        :return: Dictionary of file objects keyed by hex digest, fetched once and updated by later uploads
+        """
+        file_digests = self.client._file_digests
+        digests = file_digests.get(self.model_id)
+        if digests is None:
+            with self.client._file_digests_lock:
+                # another thread may have built the index while this one waited
+                digests = file_digests.get(self.model_id)
+                if digests is None:
+                    digests = {}
+                    for file in self.client.get_files(self.model_id)["files"]:
+                        if not file.get("complete", True):
+                            continue
+                        for tag in file.get("tags", []):
+                            if tag.startswith(DIGEST_TAG_PREFIX):
+                                digests[tag[len(DIGEST_TAG_PREFIX) :]] = file
+                    # published only once complete, so concurrent uploads never see a partial index
+                    file_digests[self.model_id] = digests
+        return digests
+
+    def _tag_digest(self, file: dict[str, Any], digest: str) -> dict[str, Any]:
+        """Private method. Tag an uploaded file with its SHA-256 digest, and add it to the digest index.
+
+        :param file: File object of the uploaded file
+        :param digest: Hex digest of the file contents
+        :return: JSON response object of the file update
+        """
+        tags = [tag for tag in file.get("tags", []) if not tag.startswith(DIGEST_TAG_PREFIX)]
+        res = self.client.patch_file(self.model_id, file["id"], tags=[*tags, f"{DIGEST_TAG_PREFIX}{digest}"])
+        self._file_digests()[digest] = res["file"]
+        return res
+
+    @staticmethod
+    def _sha256_data(data: BytesIO) -> str:
+        """Private method. Compute the SHA-256 hex digest of a file object from its current position, then rewind.
+
+        :param data: Seekable file object
+        :return: Hex digest
+        """
+        position = data.tell()
+        digest = sha256_digest(data)
+        data.seek(position)
+        return digest
+
+    def _multipart_upload(
+        self,
+        name: str,
+        data: BytesIO,
+        size: int,
+        t: tqdm,
+        max_workers: int,
+        journal: _UploadJournal | None = None,
+        sha256: Any = None,
+    ) -> dict[str, Any]:
+        """Private method. Upload a file as concurrent multipart chunks, retrying failed chunks individually.
+
+        :param name: Name of the file on Bailo
+        :param data: Seekable file object to read chunks from
+        :param size: Size of the file in bytes
+        :param t: Progress bar to advance as chunks complete
+        :param max_workers: Maximum number of chunks uploaded at once
+        :param journal: Journal to resume from and record accepted parts to, defaults to None
+        :param sha256: Hash object to update with each chunk as it is read, in order, defaults to None. Must not be
+            given when resuming, as completed chunks are not read
+        :return: JSON response object of the finished upload
+        """
+        completed: dict[int, str] = {}
+        resumed = journal is not None and journal.upload is not None
+        if journal is not None and journal.upload is not None:
+            start_res = journal.upload
+            completed = dict(journal.parts)
+            logger.info("Resuming upload of %s with %d parts already complete.", name, len(completed))
+        else:
+            start_res = self.client.start_multipart_upload(self.model_id, name, size)
+            if journal is not None:
+                journal.start(start_res)
+
+        file_id = start_res["fileId"]
+        upload_id = start_res["uploadId"]
+        chunks = start_res["chunks"]
+        remaining = [(i, chunk) for i, chunk in enumerate(chunks, start=1) if i not in completed]
+        t.update(sum(chunk["endByte"] - chunk["startByte"] + 1 for i, chunk in enumerate(chunks, 1) if i in completed))
+        logger.info("Uploading %s as %d parts with up to %d workers.", name, len(remaining), max_workers)
+
+        # the file object is shared between workers, so reads must not interleave, and are taken in order
+        read_lock = threading.Lock()
+        pending = iter(remaining)
+
+        def upload_part() -> dict[str, Any]:
+            with read_lock:
+                part_number, chunk = next(pending)
+                data.seek(chunk["startByte"])
+                body = data.read(chunk["endByte"] - chunk["startByte"] + 1)
+                if sha256 is not None:
+                    sha256.update(body)
+
+            res = self._retry_part(
+                lambda: self.client.upload_multipart_part(self.model_id, file_id, upload_id, part_number, body),
+                part_number,
+            )
+            t.update(len(body))
+            if journal is not None:
+                journal.record(part_number, res["ETag"])
+
+            return {"ETag": res["ETag"], "PartNumber": part_number}
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(upload_part) for _ in remaining]
+                try:
+                    parts = [future.result() for future in futures]
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+            parts += [{"ETag": etag, "PartNumber": part_number} for part_number, etag in completed.items()]
+            parts.sort(key=lambda part: part["PartNumber"])
+            res = self.client.finish_multipart_upload(self.model_id, file_id, upload_id, parts)
+        except BailoException as e:
+            # a resumed upload may have expired or been aborted on the server, so start it afresh, once
+            if journal is not None and resumed and (e.status_code or 500) < 500:
+                logger.warning("Server rejected the resumed upload of %s. Discarding its journal and restarting.", name)
+                journal.discard()
+                t.reset()
+                return self._multipart_upload(name, data, size, t, max_workers, journal, sha256)
+            raise
+
+        if journal is not None:
+            journal.remove()
+
+        return res
+
+    @staticmethod
+    def _retry_part(upload: Any, part_number: int) -> dict[str, Any]:
+        """Private method. Call `upload`, retrying with exponential backoff on transient failures.
+
+        :param upload: Callable performing the part upload
+        :param part_number: Part number, for logging
+        :return: JSON response object of the part upload
+        """
+        attempt = 1
+        while True:
+            try:
+                return upload()
+            except (BailoException, ResponseException, requests.ConnectionError, requests.Timeout) as e:
+                # client errors will fail the same way again
+                client_error = isinstance(e, BailoException) and (e.status_code or 500) < 500
+                if client_error or attempt >= MULTIPART_MAX_ATTEMPTS:
+                    raise
+                logger.warning("Upload of part %d failed (attempt %d): %s. Retrying...", part_number, attempt, e)
+                time.sleep(MULTIPART_RETRY_BACKOFF * 2 ** (attempt - 1))
+                attempt += 1
+
     def update(self) -> Any:
         """Update the any changes to this release on Bailo.
 
@@ -368,7 +1321,7 @@ class Release:
             if isinstance(value, str):
                 if value.startswith("v"):
                     value = value[1:]
-                version_obj = Version.coerce(value)
+                version_obj = _parse_version(value)
             elif isinstance(value, Version):
                 version_obj = value
             else:
@@ -0,0 +1,103 @@
+"""Benchmark JSON encoding and decoding of large Bailo payloads with each installed codec.
+
+Decodes a model search response and a model card response through `Client._parse_json`, and encodes the model card
+as the `json=` body of `put_model_card`, comparing the standard library with orjson and msgspec where installed.
+
+    PYTHONPATH=src python tests/benchmarks/bench_json.py --models 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import requests
+
+# isort: split
+
+from bailo import Agent, Client
+from bailo.core.json_codec import MSGSPEC, ORJSON, JsonCodec, get_codec
+
+
+def _search_payload(models: int) -> dict[str, Any]:
+    return {
+        "models": [
+            {
+                "id": f"model-{i:06d}",
+                "name": f"Model {i}",
+                "description": "A model trained to classify images of everyday objects. " * 4,
+                "tags": ["vision", "classification", f"team-{i % 50}"],
+                "kind": "model",
+                "organisation": "Example Organisation",
+                "state": "Development",
+                "collaborators": [{"entity": f"user:user{i % 200}", "roles": ["owner"]}],
+                "visibility": "public",
+                "createdAt": "2026-01-01T00:00:00.000Z",
+                "updatedAt": "2026-06-01T12:30:00.000Z",
+            }
+            for i in range(models)
+        ]
+    }
+
+
+def _card_payload(sections: int) -> dict[str, Any]:
+    metadata = {
+        f"section{s}": {
+            "overview": "Free text describing this part of the model card in some detail. " * 8,
+            "metrics": [
+                {"name": f"metric{m}", "value": m / 7, "threshold": 0.5, "passed": m % 3 != 0} for m in range(50)
+            ],
+            "datasets": [
+                {"name": f"dataset{d}", "url": f"https://example.com/data/{d}", "size": d * 1024} for d in range(20)
+            ],
+        }
+        for s in range(sections)
+    }
+    return {
+        "modelCard": {"modelId": "model-000000", "version": 12, "schemaId": "minimal-general-v10", "metadata": metadata}
+    }
+
+
+def _response(body: bytes) -> requests.Response:
+    res = requests.Response()
+    res.status_code = 200
+    res._content = body
+    res.request = requests.Request("GET", "https://example.com").prepare()
+    return res
+
+
+def _timed(fn: Callable[[], Any], size: int, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return size * repeat / (time.perf_counter() - start) / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=20000, help="models in the search response, defaults to 20000")
+    parser.add_argument("--sections", type=int, default=200, help="sections in the model card, defaults to 200")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions, defaults to 5")
+    args = parser.parse_args()
+
+    codecs: list[JsonCodec] = [get_codec("json")]
+    codecs += [get_codec("orjson")] if ORJSON else []
+    codecs += [get_codec("msgspec")] if MSGSPEC else []
+
+    payloads = {"search": _search_payload(args.models), "model card": _card_payload(args.sections)}
+    for name, payload in payloads.items():
+        body = get_codec("json").dumps(payload)
+        print(f"\n{name} ({len(body) / 1024 / 1024:.1f} MiB):")
+        for codec in codecs:
+            client = Client("https://example.com", Agent(json_codec=codec))
+            res = _response(body)
+            decode = _timed(lambda: client._parse_json(res), len(body), args.repeat)
+            encode = _timed(lambda: codec.dumps(payload), len(body), args.repeat)
+            print(f"  {codec.name:<8} decode {decode:8.1f} MiB/s   encode {encode:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark release file download and upload throughput against a local stub server.
+
+Compares the current streaming path of :class:`bailo.helper.release.Release` with the previous one, which copied
+downloads in 1 KiB blocks and sent uploads in urllib3's 16 KiB blocks, advancing the progress bar on every block.
+
+    PYTHONPATH=src python tests/benchmarks/bench_transfer.py --size 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
+
+# isort: split
+
+from bailo import Client, Release
+
+MODEL_ID = "bench"
+VERSION = "1.0.0"
+CHUNK = os.urandom(1024 * 1024)
+
+
+def _stub_server(size: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _json(self, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _drain(self) -> None:
+            remaining = int(self.headers.get("Content-Length", 0))
+            while remaining:
+                remaining -= len(self.rfile.read(min(remaining, len(CHUNK))))
+
+        def do_GET(self):
+            if not self.path.endswith("/download"):
+                self._json({"release": {"files": []}})
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            for offset in range(0, size, len(CHUNK)):
+                self.wfile.write(CHUNK[: size - offset])
+
+        def do_POST(self):
+            self._drain()
+            self._json({"file": {"id": "file-id"}})
+
+        def do_PUT(self):
+            self._drain()
+            self._json({"release": {}})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _legacy_download(client: Client, filename: str, path: str) -> None:
+    res = client.get_download_by_filename(MODEL_ID, VERSION, filename)
+    with tqdm(total=int(res.headers["content-length"]), unit="B", unit_scale=True, unit_divisor=1024) as t:
+        with open(path, "wb") as f:
+            for data in res.iter_content(1024):
+                t.update(len(data))
+                f.write(data)
+
+
+def _legacy_upload(client: Client, path: str) -> None:
+    with open(path, "rb") as f, tqdm(total=os.path.getsize(path), unit="B", unit_scale=True, unit_divisor=1024) as t:
+        client._parse_json(client.simple_upload(MODEL_ID, "file", CallbackIOWrapper(t.update, f, "read")))
+
+
+def _timed(fn: Callable[[], object], size: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return size / (time.perf_counter() - start) / 1024**2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1024, help="file size in MiB, defaults to 1024")
+    args = parser.parse_args()
+    size = args.size * 1024 * 1024
+
+    server = _stub_server(size)
+    client = Client(f"http://127.0.0.1:{server.server_port}")
+    release = Release(client, MODEL_ID, VERSION, 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source")
+        with open(source, "wb") as f:
+            for offset in range(0, size, len(CHUNK)):
+                f.write(CHUNK[: size - offset])
+        dest = os.path.join(tmp, "dest")
+
+        results = {
+            "download (1 KiB blocks)": _timed(lambda: _legacy_download(client, "file", dest), size),
+            "download": _timed(lambda: release.download("file", path=dest), size),
+            "upload (16 KiB blocks)": _timed(lambda: _legacy_upload(client, source), size),
+            "upload": _timed(lambda: release.upload(source, multipart_threshold=None, journal_dir=None), size),
+        }
+
+    server.shutdown()
+    print(f"\n{args.size} MiB over loopback:")
+    for name, throughput in results.items():
+        print(f"  {name:<24} {throughput:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
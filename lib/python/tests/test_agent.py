@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import pytest
+import requests
+
+# isort: split
+
+from bailo import Agent, RetryPolicy
+from bailo.core.exceptions import BailoException, ResponseException
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch("bailo.core.agent.time.sleep")
+
+
+def test_retries_transient_error(requests_mock, sleep):
+    requests_mock.get(
+        "https://example.com/api",
+        [{"status_code": 503, "text": "Service Unavailable"}, {"json": {"success": True}}],
+    )
+
+    res = Agent().get("https://example.com/api")
+
+    assert res.json() == {"success": True}
+    assert requests_mock.call_count == 2
+    assert sleep.call_count == 1
+
+
+def test_retries_connection_error(requests_mock, sleep):
+    requests_mock.get("https://example.com/api", [{"exc": requests.ConnectionError}, {"json": {"success": True}}])
+
+    assert Agent().get("https://example.com/api").json() == {"success": True}
+
+
+def test_gives_up_after_max_attempts(requests_mock, sleep):
+    requests_mock.get("https://example.com/api", status_code=502, text="Bad Gateway")
+
+    with pytest.raises(ResponseException):
+        Agent(retry=RetryPolicy(max_attempts=4)).get("https://example.com/api")
+
+    assert requests_mock.call_count == 4
+
+
+def test_does_not_retry_non_idempotent_method(requests_mock, sleep):
+    requests_mock.post("https://example.com/api", status_code=503, text="Service Unavailable")
+
+    with pytest.raises(ResponseException):
+        Agent().post("https://example.com/api")
+
+    assert requests_mock.call_count == 1
+
+
+def test_does_not_retry_client_error(requests_mock, sleep):
+    requests_mock.get("https://example.com/api", status_code=404, json={"error": {"message": "Not found"}})
+
+    with pytest.raises(BailoException):
+        Agent().get("https://example.com/api")
+
+    assert requests_mock.call_count == 1
+
+
+def test_honours_retry_after(requests_mock, sleep):
+    requests_mock.get(
+        "https://example.com/api",
+        [{"status_code": 429, "text": "Too Many Requests", "headers": {"Retry-After": "7"}}, {"json": {}}],
+    )
+
+    Agent().get("https://example.com/api")
+
+    sleep.assert_called_once_with(7.0)
+
+
+def test_rewinds_streamed_body(requests_mock, sleep):
+    bodies = []
+
+    def callback(request, context):
+        bodies.append(request.body.read())
+        context.status_code = 503 if len(bodies) == 1 else 200
+        return "{}"
+
+    requests_mock.put("https://example.com/api", text=callback)
+    data = BytesIO(b"0123456789")
+    data.seek(2)
+
+    Agent().put("https://example.com/api", data=data)
+
+    assert bodies == [b"23456789", b"23456789"]
+
+
+def test_refuses_to_retry_unrewindable_body(requests_mock, sleep):
+    requests_mock.put("https://example.com/api", status_code=503, text="Service Unavailable")
+
+    with pytest.raises(ResponseException):
+        Agent().put("https://example.com/api", data=iter([b"data"]))
+
+    assert requests_mock.call_count == 1
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(backoff=1.0, max_backoff=3.0)
+
+    assert all(0 <= policy.delay(attempt) <= 3.0 for attempt in range(1, 10))
+
+
+@pytest.fixture
+def server():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_pool_reuses_connections(server):
+    agent = Agent(pool_maxsize=4)
+
+    for _ in range(3):
+        agent.get(server)
+
+    [metrics] = agent.pool_metrics()
+    assert metrics["maxsize"] == 4
+    assert metrics["connections_opened"] == 1
+    assert metrics["requests"] == 3
+    assert metrics["idle"] == 1
+    assert metrics["in_use"] == 0
+
+
+def test_host_pool_maxsize(server):
+    agent = Agent(host_pool_maxsize={server: 2})
+
+    agent.get(server)
+
+    assert [metrics["maxsize"] for metrics in agent.pool_metrics()] == [2]
+
+
+def test_keep_alive_disabled(server):
+    res = Agent(keep_alive=False).get(server)
+
+    assert res.request.headers["Connection"] == "close"
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from io import BytesIO
+
+import httpx
+import pytest
+
+# isort: split
+
+from bailo import AsyncAgent, AsyncClient, AsyncTokenAgent
+from bailo.core.exceptions import BailoException, ResponseException
+
+
+def _client(handler, agent_cls=AsyncAgent, **kwargs) -> AsyncClient:
+    agent = agent_cls(transport=httpx.MockTransport(handler), **kwargs)
+    return AsyncClient("https://example.com", agent)
+
+
+def test_get_model():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v2/model/test_id"
+        return httpx.Response(200, json={"model": {"id": "test_id"}})
+
+    client = _client(handler)
+
+    assert asyncio.run(client.get_model("test_id")) == {"model": {"id": "test_id"}}
+
+
+def test_gather_many_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"model": {"id": request.url.path.rsplit("/", 1)[-1]}})
+
+    client = _client(handler)
+
+    async def fetch_all():
+        return await asyncio.gather(*(client.get_model(f"model-{i}") for i in range(50)))
+
+    results = asyncio.run(fetch_all())
+
+    assert [res["model"]["id"] for res in results] == [f"model-{i}" for i in range(50)]
+
+
+def test_query_params_match_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"reviews": [], "query": str(request.url.query, "ascii")})
+
+    client = _client(handler)
+    res = asyncio.run(client.get_reviews(active=True, model_id="test_id"))
+
+    # None-valued params are dropped, as they are by requests
+    assert res["query"] == "active=true&modelId=test_id"
+
+
+def test_post_json_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"body": json.loads(request.content)})
+
+    client = _client(handler)
+    res = asyncio.run(client.post_schema("schema", "name", "description", "model", {}, []))
+
+    assert res["body"]["id"] == "schema"
+
+
+def test_iter_models_requests_pages():
+    models = [{"id": f"model-{i}"} for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit, skip = int(request.url.params["limit"]), int(request.url.params["skip"])
+        return httpx.Response(200, json={"models": models[skip : skip + limit]})
+
+    client = _client(handler)
+
+    async def collect():
+        return [summary async for summary in client.iter_models(page_size=2, search="yolo")]
+
+    assert asyncio.run(collect()) == models
+
+
+def test_upload_multipart_part_streams_file():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Length"] == "4"
+        assert request.read() == b"test"
+        return httpx.Response(200, json={"ETag": "etag-1"})
+
+    client = _client(handler)
+    res = asyncio.run(client.upload_multipart_part("test_id", "file", "upload", 1, BytesIO(b"test")))
+
+    assert res == {"ETag": "etag-1"}
+
+
+def test_token_agent_download_route():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v2/token/model/test_id/release/1.0.0/file/test.txt/download"
+        assert request.headers["Authorization"].startswith("Basic ")
+        return httpx.Response(200, content=b"data")
+
+    client = _client(handler, AsyncTokenAgent, access_key="access", secret_key="secret")
+
+    async def download():
+        res = await client.get_download_by_filename("test_id", "1.0.0", "test.txt")
+        return await res.aread()
+
+    assert asyncio.run(download()) == b"data"
+
+
+def test_bailo_exception():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json={"error": {"message": "Dummy error!", "context": {"modelId": "test_id"}}})
+
+    client = _client(handler)
+
+    with pytest.raises(BailoException) as exc_info:
+        asyncio.run(client.get_model("test_id"))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.message == "Dummy error!"
+    assert exc_info.value.context == {"modelId": "test_id"}
+
+
+def test_response_exception():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, content=b"Bad Gateway")
+
+    client = _client(handler)
+
+    with pytest.raises(ResponseException):
+        asyncio.run(client.get_model("test_id"))
+
+
+def test_error_in_success_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"error": {"message": "Hidden error"}})
+
+    client = _client(handler)
+
+    with pytest.raises(BailoException):
+        asyncio.run(client.get_model("test_id"))
+
+
+def test_concurrent_identical_gets_coalesced():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"schema": {"id": "test_id"}})
+
+    client = _client(handler)
+
+    async def fetch_all():
+        return await asyncio.gather(*(client.get_schema("test_id") for _ in range(10)))
+
+    results = asyncio.run(fetch_all())
+
+    assert calls == ["/api/v2/schema/test_id"]
+    assert all(result == {"schema": {"id": "test_id"}} for result in results)
@@ -222,6 +222,38 @@ def test_get_models(
     assert result == {"success": True}
 
 
+def _summaries(start, stop):
+    return [{"id": f"model-{i}"} for i in range(start, stop)]
+
+
+def test_iter_models_requests_pages(requests_mock):
+    models = _summaries(0, 5)
+
+    def callback(request, context):
+        limit, skip = int(request.qs["limit"][0]), int(request.qs["skip"][0])
+        return {"models": models[skip : skip + limit]}
+
+    requests_mock.get("https://example.com/api/v2/models/search", json=callback)
+
+    client = Client("https://example.com")
+    summaries = client.iter_models(page_size=2, search="yolo")
+
+    assert requests_mock.call_count == 1
+    assert list(summaries) == models
+    assert [request.qs["skip"] for request in requests_mock.request_history] == [["0"], ["2"], ["4"]]
+    assert all(request.qs["search"] == ["yolo"] for request in requests_mock.request_history)
+
+
+@pytest.mark.parametrize("total", [5, 2])
+def test_iter_models_server_ignores_paging(requests_mock, total):
+    requests_mock.get("https://example.com/api/v2/models/search", json={"models": _summaries(0, total)})
+
+    client = Client("https://example.com")
+
+    assert list(client.iter_models(page_size=2)) == _summaries(0, total)
+    assert requests_mock.call_count == (1 if total > 2 else 2)
+
+
 def test_get_model(requests_mock):
     requests_mock.get("https://example.com/api/v2/model/test_id", json={"success": True})
 
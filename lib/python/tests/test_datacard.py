@@ -13,6 +13,28 @@ def test_datacard(local_datacard):
     assert isinstance(local_datacard, Datacard)
 
 
+def test_from_id_makes_one_request(requests_mock):
+    requests_mock.get(
+        "https://example.com/api/v2/model/data",
+        json={
+            "model": {
+                "id": "data",
+                "name": "data",
+                "description": "test",
+                "visibility": "public",
+                "kind": "data-card",
+                "collaborators": [],
+                "card": {"schemaId": "minimal-data-card-v10", "version": 2, "metadata": {"overview": {}}},
+            }
+        },
+    )
+
+    datacard = Datacard.from_id(Client("https://example.com"), "data")
+
+    assert (datacard.datacard_id, datacard.data_card_version) == ("data", 2)
+    assert requests_mock.call_count == 1
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     ("name", "description", "organisation", "state", "tags", "visibility", "collaborators"),
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+
+# isort: split
+
+from bailo import Client, DownloadCache, Release
+
+
+def _store(cache: DownloadCache, tmp_path, key: str, data: bytes) -> None:
+    src = tmp_path / key.replace("/", "_")
+    src.write_bytes(data)
+    cache.store(key, str(src))
+
+
+def test_fetch_miss(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+
+    assert not cache.fetch("model/file/rev", str(tmp_path / "out"))
+
+
+def test_store_and_fetch(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    _store(cache, tmp_path, "model/file/rev", b"weights")
+
+    dest = tmp_path / "out"
+    assert cache.fetch("model/file/rev", str(dest))
+    assert dest.read_bytes() == b"weights"
+
+
+def test_identical_content_stored_once(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    _store(cache, tmp_path, "model-a/file/rev", b"weights")
+    _store(cache, tmp_path, "model-b/file/rev", b"weights")
+
+    assert len(os.listdir(tmp_path / "cache" / "blobs")) == 1
+
+
+def test_least_recently_used_evicted(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), max_size=10)
+    _store(cache, tmp_path, "model/a/rev", b"aaaa")
+    _store(cache, tmp_path, "model/b/rev", b"bbbb")
+    assert cache.fetch("model/a/rev", str(tmp_path / "out"))
+
+    _store(cache, tmp_path, "model/c/rev", b"cccc")
+
+    assert cache.fetch("model/a/rev", str(tmp_path / "out"))
+    assert not cache.fetch("model/b/rev", str(tmp_path / "out"))
+    assert cache.fetch("model/c/rev", str(tmp_path / "out"))
+
+
+def test_key_changes_with_revision():
+    file_metadata = {"id": "file-id", "updatedAt": "2026-01-01T00:00:00.000Z", "size": 4}
+
+    assert DownloadCache.key("model", file_metadata) == DownloadCache.key("model", dict(file_metadata))
+    assert DownloadCache.key("model", file_metadata) != DownloadCache.key(
+        "model", {**file_metadata, "updatedAt": "2026-02-01T00:00:00.000Z"}
+    )
+
+
+def test_download_all_served_from_cache(requests_mock, tmp_path):
+    names = ["a.txt", "b.txt"]
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0",
+        json={"release": {"files": [{"id": f"id-{name}", "name": name, "size": 5} for name in names]}},
+    )
+    download_urls = [f"https://example.com/api/v2/model/test_id/release/1.0.0/file/{name}/download" for name in names]
+    for url, name in zip(download_urls, names):
+        requests_mock.get(url, content=name.encode())
+    cache = DownloadCache(str(tmp_path / "cache"))
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    release.download_all(path=str(tmp_path / "first"), cache=cache)
+    requests_mock.reset_mock()
+    release.download_all(path=str(tmp_path / "second"), cache=cache, max_workers=2)
+
+    assert (tmp_path / "second" / "a.txt").read_bytes() == b"a.txt"
+    assert (tmp_path / "second" / "b.txt").read_bytes() == b"b.txt"
+    assert not any(req.url in download_urls for req in requests_mock.request_history)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# isort: split
+
+from bailo import Client, IdentityMap, Model, Release
+
+
+def _model_body(model_id, name="yolo"):
+    return {
+        "id": model_id,
+        "name": name,
+        "description": "test",
+        "visibility": "public",
+        "kind": "model",
+        "collaborators": [],
+        "card": {"schemaId": "minimal-general-v10", "version": 1, "metadata": {"overview": {}}},
+    }
+
+
+@pytest.fixture
+def client():
+    return Client("https://example.com", identity_map=IdentityMap())
+
+
+def test_from_id_returns_live_model(requests_mock, client):
+    requests_mock.get("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+
+    model = Model.from_id(client, "yolo")
+
+    assert Model.from_id(client, "yolo") is model
+    assert requests_mock.call_count == 1
+
+
+def test_mutation_refreshes_live_model_in_place(requests_mock, client):
+    requests_mock.get(
+        "https://example.com/api/v2/model/yolo",
+        [{"json": {"model": _model_body("yolo")}}, {"json": {"model": _model_body("yolo", name="renamed")}}],
+    )
+    requests_mock.patch("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+    model = Model.from_id(client, "yolo")
+
+    client.patch_model("yolo", name="renamed")
+
+    assert Model.from_id(client, "yolo") is model
+    assert model.name == "renamed"
+    assert requests_mock.call_count == 3
+
+
+def test_search_returns_live_models(requests_mock, client):
+    summary = {key: value for key, value in _model_body("yolo").items() if key != "card"}
+    requests_mock.get("https://example.com/api/v2/models/search", json={"models": [summary]})
+    requests_mock.get("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+
+    [searched] = Model.search(client)
+    model = Model.from_id(client, "yolo")
+
+    assert model is searched
+    assert model.model_card_version == 1
+    assert Model.search(client)[0] is model
+
+
+def test_from_version_returns_live_release(requests_mock, client):
+    requests_mock.get(
+        "https://example.com/api/v2/model/yolo/release/1.0.0",
+        json={
+            "release": {
+                "semver": "1.0.0",
+                "modelCardVersion": 1,
+                "notes": "notes",
+                "fileIds": [],
+                "images": [],
+                "minor": False,
+                "draft": False,
+            }
+        },
+    )
+
+    release = Release.from_version(client, "yolo", "1.0.0")
+
+    assert Release.from_version(client, "yolo", "v1.0.0") is release
+    assert requests_mock.call_count == 1
+
+
+def test_unused_objects_are_forgotten(requests_mock, client):
+    requests_mock.get("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+    Model.from_id(client, "yolo")
+    gc.collect()
+
+    assert len(client.identity_map) == 0
+
+
+def test_concurrent_from_id_returns_one_model(requests_mock, client):
+    requests_mock.get("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+
+    models = Model.from_ids(client, ["yolo"] * 16, max_workers=16)
+
+    assert all(model is models[0] for model in models)
+
+
+def test_get_or_add_builds_once():
+    identity_map = IdentityMap()
+    built = []
+
+    def factory():
+        # widen the window between the lookup and the insert
+        time.sleep(0.01)
+        built.append(Release.__new__(Release))
+        return built[-1]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: identity_map.get_or_add("key", factory), range(8)))
+
+    assert len(built) == 1
+    assert [added for _, added in results].count(True) == 1
+    assert all(obj is built[0] for obj, _ in results)
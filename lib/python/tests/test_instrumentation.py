@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+# isort: split
+
+from bailo import Agent, Client, LatencyHistogram, RequestObserver
+from bailo.core.exceptions import BailoException
+from bailo.core.instrumentation import RequestEvent, url_template
+
+
+@pytest.mark.parametrize(
+    ("url", "template"),
+    [
+        ("https://example.com/api/v2/model/abc/releases", "/v2/model/{modelId}/releases"),
+        (
+            "https://example.com/api/v2/model/abc/release/1.0.0/file/model.pt/download",
+            "/v2/model/{modelId}/release/{semver}/file/{fileName}/download",
+        ),
+        (
+            "https://example.com/api/v2/model/abc/file/def/download",
+            "/v2/model/{modelId}/file/{fileId}/download",
+        ),
+        (
+            "https://example.com/api/v2/filescanning/model/abc/image/name/tag/scan",
+            "/v2/filescanning/model/{modelId}/image/{imageName}/{imageTag}/scan",
+        ),
+        ("https://example.com/api/v2/models/search?task=x", "/v2/models/search"),
+        ("https://example.com/api/v2/schema/abc", "/v2/schema/{schemaId}"),
+    ],
+)
+def test_url_template(url, template):
+    assert url_template(url) == template
+
+
+class _Recorder(RequestObserver):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_request_start(self, event):
+        self.started.append(event.endpoint)
+
+    def on_request_end(self, event):
+        self.ended.append(event)
+
+
+def test_observer_sees_request(requests_mock, mocker):
+    mocker.patch("bailo.core.agent.time.sleep")
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id",
+        [{"status_code": 503, "text": "Unavailable"}, {"json": {"model": {"id": "test_id"}}}],
+    )
+    recorder = _Recorder()
+
+    Client("https://example.com", Agent(observers=[recorder])).get_model("test_id")
+
+    [event] = recorder.ended
+    assert recorder.started == ["GET /v2/model/{modelId}"]
+    assert event.status_code == 200
+    assert event.retries == 1
+    assert event.bytes_received == len(b'{"model": {"id": "test_id"}}')
+    assert event.latency is not None
+
+
+def test_observer_sees_error(requests_mock):
+    requests_mock.post("https://example.com/api/v2/model/test_id/webhooks", status_code=400, json={"error": {}})
+    recorder = _Recorder()
+
+    with pytest.raises(BailoException):
+        Client("https://example.com", Agent(observers=[recorder])).post_webhook("test_id", "name", "https://hook")
+
+    assert recorder.ended[0].status_code == 400
+    assert recorder.ended[0].bytes_sent is not None
+
+
+def test_failing_observer_does_not_fail_request(requests_mock):
+    class Broken(RequestObserver):
+        def on_request_end(self, event):
+            raise RuntimeError
+
+    requests_mock.get("https://example.com/api/v2/model/test_id", json={"model": {}})
+
+    assert Client("https://example.com", Agent(observers=[Broken()])).get_model("test_id") == {"model": {}}
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(precision=0.01)
+    for i in range(1, 101):
+        event = RequestEvent("GET", "https://example.com/api/v2/model/abc")
+        event.latency = i / 1000
+        histogram.on_request_end(event)
+
+    stats = histogram.percentiles()["GET /v2/model/{modelId}"]
+
+    assert stats["count"] == 100
+    assert stats["p50"] == pytest.approx(0.050, rel=0.01)
+    assert stats["p95"] == pytest.approx(0.095, rel=0.01)
+    assert stats["p99"] == pytest.approx(0.099, rel=0.01)
+    assert "GET /v2/model/{modelId}" in histogram.report()
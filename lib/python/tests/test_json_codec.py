@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import requests
+
+# isort: split
+
+from bailo import Agent, Client, JsonCodec
+from bailo.core.exceptions import ResponseException
+from bailo.core.json_codec import ORJSON, get_codec
+
+
+@pytest.mark.parametrize(
+    "name", ["json", pytest.param("orjson", marks=pytest.mark.skipif(not ORJSON, reason="orjson"))]
+)
+def test_codec_round_trip(name):
+    codec = get_codec(name)
+    obj = {"models": [{"id": "abc", "tags": ["a", "b"], "card": {"score": 0.5, "valid": True, "owner": None}}]}
+
+    encoded = codec.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == obj
+    with pytest.raises(ValueError):
+        codec.loads(b"not json")
+
+
+@pytest.mark.parametrize(
+    "name", ["json", pytest.param("orjson", marks=pytest.mark.skipif(not ORJSON, reason="orjson"))]
+)
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+def test_codec_rejects_non_finite_floats(name, value):
+    with pytest.raises(ValueError):
+        get_codec(name).dumps({"metrics": [{"accuracy": value}]})
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.skipif(not ORJSON, reason="orjson is not installed")
+def test_fastest_codec_is_default():
+    assert Agent().json_codec.name == "orjson"
+
+
+def test_request_body_encoded_by_codec(requests_mock):
+    requests_mock.post("https://example.com/api/v2/models", json={"model": {"id": "abc"}})
+    codec = JsonCodec("custom", lambda obj: json.dumps(obj, sort_keys=True).encode(), json.loads)
+    client = Client("https://example.com", Agent(json_codec=codec))
+
+    client.post_model(name="test", kind="model", description="description")
+
+    request = requests_mock.last_request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.json()["name"] == "test"
+    assert request.body == json.dumps(request.json(), sort_keys=True).encode()
+
+
+def test_response_decoded_by_codec(requests_mock):
+    requests_mock.get("https://example.com/api/v2/model/abc", json={"model": {"id": "abc"}})
+    decoded = []
+
+    def loads(data):
+        decoded.append(data)
+        return json.loads(data)
+
+    client = Client("https://example.com", Agent(json_codec=JsonCodec("custom", get_codec("json").dumps, loads)))
+
+    assert client.get_model("abc") == {"model": {"id": "abc"}}
+    assert decoded == [b'{"model": {"id": "abc"}}']
+
+
+@pytest.mark.parametrize(
+    "name", ["json", pytest.param("orjson", marks=pytest.mark.skipif(not ORJSON, reason="orjson"))]
+)
+def test_invalid_response_json(requests_mock, name):
+    requests_mock.get("https://example.com/api/v2/model/abc", text="<html>")
+    client = Client("https://example.com", Agent(json_codec=name))
+
+    with pytest.raises(ResponseException):
+        client.get_model("abc")
+
+
+def test_agent_without_codec_falls_back_to_response_json(requests_mock):
+    class LegacyAgent:
+        def get(self, *args, **kwargs):
+            return requests.get(*args, **kwargs)
+
+    requests_mock.get("https://example.com/api/v2/model/abc", json={"model": {"id": "abc"}})
+    client = Client("https://example.com", LegacyAgent())  # type: ignore[reportArgumentType]
+
+    assert client.get_model("abc") == {"model": {"id": "abc"}}
@@ -57,6 +57,50 @@ def test_get_card_latest_with_card_and_mirrored_card(local_mirrored_model, reque
     }
 
 
+def _mirrored_model_body(model_id):
+    return {
+        "id": model_id,
+        "name": model_id,
+        "description": "test",
+        "visibility": "public",
+        "kind": EntryKind.MIRRORED_MODEL,
+        "collaborators": [],
+        "settings": {"mirror": {"sourceModelId": f"source-{model_id}"}},
+        "card": {"schemaId": "minimal-general-v10", "version": 1, "metadata": {"overview": {}}},
+        "mirroredCard": {"schemaId": "minimal-general-v10", "version": 2, "metadata": {"overview": {}}},
+    }
+
+
+@pytest.fixture
+def search_mock(requests_mock):
+    summaries = [
+        {"id": f"mirror-{i}", "name": f"mirror-{i}", "description": "test", "visibility": "public"} for i in range(3)
+    ]
+    requests_mock.get("https://example.com/api/v2/models/search", json={"models": summaries})
+    for i in range(3):
+        requests_mock.get(
+            f"https://example.com/api/v2/model/mirror-{i}", json={"model": _mirrored_model_body(f"mirror-{i}")}
+        )
+    return requests_mock
+
+
+def test_search_hydrates_with_one_request_per_model(search_mock):
+    models = MirroredModel.search(Client("https://example.com"), max_workers=2)
+
+    assert [model.model_id for model in models] == ["mirror-0", "mirror-1", "mirror-2"]
+    assert [model.sourceModelId for model in models] == ["source-mirror-0", "source-mirror-1", "source-mirror-2"]
+    assert all(model.model_card_version == {"card": 2, "additional_information": 1} for model in models)
+    assert search_mock.call_count == 4
+
+
+def test_search_without_hydration(search_mock):
+    models = MirroredModel.search(Client("https://example.com"), hydrate=False)
+
+    assert [model.name for model in models] == ["mirror-0", "mirror-1", "mirror-2"]
+    assert all(model.model_card == {"card": None, "additional_information": None} for model in models)
+    assert search_mock.call_count == 1
+
+
 def test_update_sends_source_model_id_when_changed(local_mirrored_model, requests_mock):
     requests_mock.patch(
         "https://example.com/api/v2/model/test-id",
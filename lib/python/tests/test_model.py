@@ -7,7 +7,7 @@ from bailo.core.enums import CollaboratorEntry, MinimalSchema, Role
 
 # isort: split
 
-from bailo import Client, Datacard, Experiment, Model, ModelVisibility
+from bailo import Agent, Client, Datacard, Experiment, Model, ModelVisibility, Release, RetryPolicy
 from bailo.core.enums import EntryKind
 from bailo.core.exceptions import BailoException
 from bailo.core.utils import NestedDict
@@ -43,6 +43,160 @@ def test_unpack_hydrates_all_fields(local_model):
     assert local_model.settings["ungovernedAccess"] is True
 
 
+def test_iter_search_builds_models_lazily(requests_mock):
+    summary = {
+        "id": "yolo",
+        "name": "Yolo",
+        "description": "You only look once",
+        "visibility": "public",
+        "collaborators": [],
+        "tags": ["ml"],
+    }
+    requests_mock.get("https://example.com/api/v2/models/search", json={"models": [summary]})
+
+    models = Model.iter_search(Client("https://example.com"), search="yolo")
+    [model] = list(models)
+
+    assert isinstance(model, Model)
+    assert (model.model_id, model.name, model.tags) == ("yolo", "Yolo", ["ml"])
+    assert requests_mock.last_request.qs["kind"] == ["model"]
+
+
+def _release_body(semver: str) -> dict[str, Any]:
+    return {
+        "semver": semver,
+        "modelCardVersion": 1,
+        "notes": "notes",
+        "fileIds": ["file-id"],
+        "images": [],
+        "minor": False,
+        "draft": False,
+    }
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_releases_builds_from_listing(requests_mock, local_model, max_workers):
+    incomplete = _release_body("1.0.2")
+    del incomplete["fileIds"]
+    requests_mock.get(
+        "https://example.com/api/v2/model/test-id/releases",
+        json={"releases": [_release_body("1.0.0"), _release_body("1.0.1"), incomplete]},
+    )
+    requests_mock.get(
+        "https://example.com/api/v2/model/test-id/release/1.0.2", json={"release": _release_body("1.0.2")}
+    )
+
+    releases = local_model.get_releases(max_workers=max_workers)
+
+    assert [str(release.version) for release in releases] == ["1.0.0", "1.0.1", "1.0.2"]
+    assert all(release.files == ["file-id"] for release in releases)
+    assert requests_mock.call_count == 2
+
+
+def test_get_latest_release_builds_only_latest(requests_mock, local_model, mocker):
+    requests_mock.get(
+        "https://example.com/api/v2/model/test-id/releases",
+        json={"releases": [_release_body(semver) for semver in ("1.9.0", "1.10.0", "1.2.0")]},
+    )
+    from_response = mocker.spy(Release, "_from_response")
+
+    release = local_model.get_latest_release()
+
+    assert str(release.version) == "1.10.0"
+    assert from_response.call_count == 1
+    assert requests_mock.call_count == 1
+
+
+def test_get_latest_release_without_releases(requests_mock, local_model):
+    requests_mock.get("https://example.com/api/v2/model/test-id/releases", json={"releases": []})
+
+    with pytest.raises(BailoException):
+        local_model.get_latest_release()
+
+
+def _model_body(model_id: str, kind: str = "model") -> dict[str, Any]:
+    return {
+        "id": model_id,
+        "name": model_id,
+        "description": "test",
+        "visibility": "public",
+        "kind": kind,
+        "collaborators": [],
+        "card": {"schemaId": "minimal-general-v10", "version": 3, "metadata": {"overview": {}}},
+    }
+
+
+def test_from_id_makes_one_request(requests_mock):
+    requests_mock.get("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+
+    model = Model.from_id(Client("https://example.com"), "yolo")
+
+    assert (model.model_id, model.model_card_version, model.model_card_schema) == ("yolo", 3, "minimal-general-v10")
+    assert requests_mock.call_count == 1
+
+
+def test_from_ids(requests_mock):
+    for i in range(5):
+        requests_mock.get(f"https://example.com/api/v2/model/model-{i}", json={"model": _model_body(f"model-{i}")})
+
+    models = Model.from_ids(Client("https://example.com"), [f"model-{i}" for i in range(5)], max_workers=3)
+
+    assert [model.model_id for model in models] == [f"model-{i}" for i in range(5)]
+    assert requests_mock.call_count == 5
+
+
+def test_from_ids_wrong_kind(requests_mock):
+    requests_mock.get("https://example.com/api/v2/model/yolo", json={"model": _model_body("yolo")})
+    requests_mock.get("https://example.com/api/v2/model/data", json={"model": _model_body("data", kind="data-card")})
+
+    with pytest.raises(BailoException):
+        Model.from_ids(Client("https://example.com"), ["yolo", "data"])
+
+
+@pytest.fixture
+def lazy_search_mock(requests_mock):
+    summaries = [{key: value for key, value in _model_body(f"model-{i}").items() if key != "card"} for i in range(3)]
+    requests_mock.get("https://example.com/api/v2/models/search", json={"models": summaries})
+    for i in range(3):
+        requests_mock.get(f"https://example.com/api/v2/model/model-{i}", json={"model": _model_body(f"model-{i}")})
+    return requests_mock
+
+
+def test_lazy_search_fetches_card_on_access(lazy_search_mock):
+    models = Model.search(Client("https://example.com"), lazy=True)
+
+    assert [model.name for model in models] == ["model-0", "model-1", "model-2"]
+    assert lazy_search_mock.call_count == 1
+
+    assert models[0].model_card_schema == "minimal-general-v10"
+    assert models[0].model_card == {"overview": {}}
+    assert lazy_search_mock.call_count == 2
+
+
+def test_lazy_card_fetched_again_after_failure(lazy_search_mock):
+    models = Model.search(Client("https://example.com", Agent(retry=RetryPolicy(max_attempts=1))), lazy=True)
+    lazy_search_mock.get(
+        "https://example.com/api/v2/model/model-0",
+        [{"status_code": 500, "json": {"error": {"message": "boom"}}}, {"json": {"model": _model_body("model-0")}}],
+    )
+
+    with pytest.raises(BailoException):
+        models[0].model_card
+
+    assert models[0].model_card == {"overview": {}}
+    assert models[0].model_card_version == 3
+
+
+def test_prefetch_all(lazy_search_mock):
+    models = Model.search(Client("https://example.com"), lazy=True)
+
+    Model.prefetch_all(models, max_workers=2)
+
+    assert lazy_search_mock.call_count == 4
+    assert [model.model_card_version for model in models] == [3, 3, 3]
+    assert lazy_search_mock.call_count == 4
+
+
 def test_create_experiment_from_model(local_model):
     experiment = local_model.create_experiment()
 
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# isort: split
+
+from bailo import Agent, RateLimiter
+
+
+def test_rate_limits_requests(mocker):
+    sleeps = []
+    clock = [0.0]
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    mocker.patch("bailo.core.rate_limit.time.sleep", side_effect=sleep)
+    mocker.patch("bailo.core.rate_limit.time.monotonic", side_effect=lambda: clock[0])
+    limiter = RateLimiter(rate=2, burst=2)
+
+    for _ in range(4):
+        with limiter.acquire():
+            pass
+
+    # the burst is used straight away, then requests are spaced at the rate
+    assert sum(sleeps) == 1.0
+
+
+def test_caps_requests_in_flight():
+    limiter = RateLimiter(max_in_flight=2)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def request(_):
+        with limiter.acquire():
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(request, range(16)))
+
+    assert max(peak) == 2
+
+
+def test_shared_between_processes(tmp_path):
+    lock_path = str(tmp_path / "limit.lock")
+    first = RateLimiter(rate=1, burst=1, max_in_flight=1, lock_path=lock_path)
+    second = RateLimiter(rate=1, burst=1, max_in_flight=1, lock_path=lock_path)
+
+    def request():
+        with second.acquire():
+            pass
+
+    with first.acquire():
+        start = time.monotonic()
+        # the slot is held by the first limiter, so the second waits for it once the bucket refills
+        waiting = threading.Thread(target=request)
+        waiting.start()
+        waiting.join(timeout=1.5)
+        assert waiting.is_alive()
+    waiting.join()
+
+    assert time.monotonic() - start >= 1.0
+
+
+def test_agent_consults_limiter(requests_mock, mocker):
+    requests_mock.get("https://example.com/api", json={})
+    limiter = RateLimiter(max_in_flight=1)
+    acquire = mocker.spy(limiter, "acquire")
+
+    Agent(rate_limiter=limiter).get("https://example.com/api")
+
+    assert acquire.call_count == 1
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import os
+import re
+import zipfile
+from io import BytesIO
+
 import pytest
-from bailo import Client, Release
-from bailo.core.exceptions import BailoException
+from bailo import Agent, Client, Release, RetryPolicy
+from bailo.core.exceptions import BailoException, ResponseException
+from bailo.helper.release import _UploadJournal
 from semantic_version import Version
 
 
@@ -156,3 +164,545 @@ def test_retrieve_release_with_v_in_version(integration_client, example_model):
     release = Release.from_version(client=integration_client, model_id=example_model.model_id, version="v2.0.0")
 
     assert str(release.version) == "2.0.0"
+
+
+def _mock_multipart(requests_mock, part_responses):
+    requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/multipart/start",
+        json={
+            "fileId": "file_id",
+            "uploadId": "upload_id",
+            "chunks": [{"startByte": 0, "endByte": 3}, {"startByte": 4, "endByte": 7}, {"startByte": 8, "endByte": 9}],
+        },
+    )
+    requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/multipart/part",
+        part_responses,
+    )
+    requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/multipart/finish",
+        json={"file": {"id": "file_id"}},
+    )
+    requests_mock.put("https://example.com/api/v2/model/test_id/release/1.0.0", json={"success": True})
+
+
+def test_upload_multipart(requests_mock):
+    _mock_multipart(requests_mock, [{"json": {"ETag": "etag"}}])
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    file_id = release.upload("test.bin", BytesIO(b"0123456789"), multipart_threshold=10)
+
+    assert file_id == "file_id"
+    part_bodies = sorted(req.body for req in requests_mock.request_history if req.path.endswith("/part"))
+    assert part_bodies == [b"0123", b"4567", b"89"]
+    finish = [req for req in requests_mock.request_history if req.path.endswith("/finish")][0].json()
+    assert finish["parts"] == [{"ETag": "etag", "PartNumber": i} for i in (1, 2, 3)]
+    assert requests_mock.last_request.json()["fileIds"] == ["file_id"]
+
+
+def test_upload_below_threshold_uses_simple_upload(requests_mock):
+    requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/simple", json={"file": {"id": "simple_id"}}
+    )
+    requests_mock.put("https://example.com/api/v2/model/test_id/release/1.0.0", json={"success": True})
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    assert release.upload("test.bin", BytesIO(b"0123456789"), multipart_threshold=11) == "simple_id"
+
+
+def test_upload_directory_streams_zip(requests_mock, tmp_path, monkeypatch):
+    upload = requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/simple", json={"file": {"id": "zip_id"}}
+    )
+    requests_mock.put("https://example.com/api/v2/model/test_id/release/1.0.0", json={"success": True})
+    model_dir = tmp_path / "model"
+    (model_dir / "weights").mkdir(parents=True)
+    (model_dir / "config.json").write_text('{"layers": 2}')
+    (model_dir / "weights" / "model.safetensors").write_bytes(b"\0" * 1000)
+    monkeypatch.chdir(tmp_path)
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    assert release.upload(str(model_dir)) == "zip_id"
+
+    assert upload.last_request.qs["name"] == ["model.zip"]
+    archive = zipfile.ZipFile(BytesIO(b"".join(upload.last_request.body)))
+    assert archive.namelist() == ["weights/", "config.json", "weights/model.safetensors"]
+    assert archive.read("weights/model.safetensors") == b"\0" * 1000
+    assert archive.getinfo("config.json").compress_type == zipfile.ZIP_DEFLATED
+    assert archive.getinfo("weights/model.safetensors").compress_type == zipfile.ZIP_STORED
+    # nothing is written to the working directory
+    assert sorted(os.listdir(tmp_path)) == ["model"]
+
+
+@pytest.fixture
+def many_files_mock(requests_mock):
+    def simple_upload(request, context):
+        return {"file": {"id": f"{request.qs['name'][0]}_id"}}
+
+    requests_mock.post("https://example.com/api/v2/model/test_id/files/upload/simple", json=simple_upload)
+    return requests_mock.put("https://example.com/api/v2/model/test_id/release/1.0.0", json={"success": True})
+
+
+def test_upload_many_updates_release_once(many_files_mock, tmp_path):
+    paths = []
+    for i in range(5):
+        paths.append(str(tmp_path / f"file{i}.bin"))
+        (tmp_path / f"file{i}.bin").write_bytes(b"0123456789")
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    file_ids = release.upload_many(paths, max_workers=3, journal_dir=None)
+
+    assert file_ids == [f"file{i}.bin_id" for i in range(5)]
+    assert many_files_mock.call_count == 1
+    assert sorted(many_files_mock.last_request.json()["fileIds"]) == file_ids
+
+
+def test_upload_many_attaches_completed_files_on_failure(many_files_mock, tmp_path):
+    (tmp_path / "file.bin").write_bytes(b"0123456789")
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with pytest.raises(FileNotFoundError):
+        release.upload_many([str(tmp_path / "missing.bin"), str(tmp_path / "file.bin")], journal_dir=None)
+
+    assert many_files_mock.call_count == 1
+    assert many_files_mock.last_request.json()["fileIds"] == ["file.bin_id"]
+
+
+def test_defer_update(many_files_mock):
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with release.defer_update():
+        with release.defer_update():
+            release.upload("a.bin", BytesIO(b"a"))
+        release.upload("b.bin", BytesIO(b"b"))
+        assert not many_files_mock.called
+
+    assert many_files_mock.call_count == 1
+    assert many_files_mock.last_request.json()["fileIds"] == ["a.bin_id", "b.bin_id"]
+
+
+def test_defer_update_keeps_upload_error(requests_mock):
+    requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/simple",
+        [{"json": {"file": {"id": "a.bin_id"}}}, {"status_code": 400, "json": {"error": {"message": "Bad file"}}}],
+    )
+    update = requests_mock.put(
+        "https://example.com/api/v2/model/test_id/release/1.0.0",
+        status_code=400,
+        json={"error": {"message": "Bad release"}},
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with pytest.raises(BailoException, match="Bad file"):
+        with release.defer_update():
+            release.upload("a.bin", BytesIO(b"a"))
+            release.upload("b.bin", BytesIO(b"b"))
+
+    assert update.call_count == 1
+
+
+def test_upload_deduplicate_reuses_existing_file(requests_mock):
+    digest = hashlib.sha256(b"0123456789").hexdigest()
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/files",
+        json={"files": [{"id": "existing_id", "size": 10, "tags": [f"sha256:{digest}"]}]},
+    )
+    upload = requests_mock.post("https://example.com/api/v2/model/test_id/files/upload/simple")
+    requests_mock.put("https://example.com/api/v2/model/test_id/release/1.0.0", json={"success": True})
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    assert release.upload("test.bin", BytesIO(b"0123456789"), deduplicate=True) == "existing_id"
+
+    assert not upload.called
+    assert release.files == ["existing_id"]
+
+
+def test_upload_deduplicate_skips_file_already_in_release(requests_mock):
+    digest = hashlib.sha256(b"0123456789").hexdigest()
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/files",
+        json={"files": [{"id": "existing_id", "size": 10, "tags": [f"sha256:{digest}"]}]},
+    )
+    update = requests_mock.put("https://example.com/api/v2/model/test_id/release/1.0.0", json={"success": True})
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1, files=["existing_id"])
+
+    assert release.upload("test.bin", BytesIO(b"0123456789"), deduplicate=True) == "existing_id"
+
+    assert release.files == ["existing_id"]
+    assert not update.called
+
+
+def test_upload_many_deduplicate_fetches_digests_once(requests_mock, many_files_mock, tmp_path):
+    files = requests_mock.get(
+        "https://example.com/api/v2/model/test_id/files",
+        json={"files": [{"id": "other_id", "size": 10, "tags": ["sha256:other"]}]},
+    )
+    requests_mock.patch(
+        re.compile(r"https://example.com/api/v2/model/test_id/file/.*"),
+        json=lambda request, context: {"file": {"id": request.path.rsplit("/", 1)[-1]}},
+    )
+    paths = []
+    for i in range(5):
+        paths.append(str(tmp_path / f"file{i}.bin"))
+        (tmp_path / f"file{i}.bin").write_bytes(f"{i}123456789".encode())
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    release.upload_many(paths, max_workers=5, journal_dir=None, deduplicate=True)
+
+    assert files.call_count == 1
+
+
+def test_upload_deduplicate_index_shared_by_releases(requests_mock):
+    digest = hashlib.sha256(b"0123456789").hexdigest()
+    files = requests_mock.get("https://example.com/api/v2/model/test_id/files", json={"files": []})
+
+    def simple_upload(request, context):
+        # stream the body, as a real transport would
+        while request.body.read(4):
+            pass
+        return {"file": {"id": "file_id", "tags": []}}
+
+    upload = requests_mock.post("https://example.com/api/v2/model/test_id/files/upload/simple", json=simple_upload)
+    requests_mock.patch(
+        "https://example.com/api/v2/model/test_id/file/file_id",
+        json={"file": {"id": "file_id", "tags": [f"sha256:{digest}"], "size": 10}},
+    )
+    requests_mock.put(re.compile(r"https://example.com/api/v2/model/test_id/release/.*"), json={"success": True})
+    client = Client("https://example.com")
+    first = Release(client, "test_id", "1.0.0", 1)
+    second = Release(client, "test_id", "2.0.0", 1)
+
+    assert first.upload("test.bin", BytesIO(b"0123456789"), deduplicate=True) == "file_id"
+    assert second.upload("test.bin", BytesIO(b"0123456789"), deduplicate=True) == "file_id"
+
+    assert files.call_count == 1
+    assert upload.call_count == 1
+    assert second.files == ["file_id"]
+
+
+@pytest.mark.parametrize("multipart_threshold", [None, 10])
+def test_upload_deduplicate_tags_digest(requests_mock, multipart_threshold):
+    _mock_multipart(requests_mock, [{"json": {"ETag": "etag"}}])
+
+    def simple_upload(request, context):
+        # stream the body, as a real transport would
+        while request.body.read(4):
+            pass
+        return {"file": {"id": "file_id", "tags": []}}
+
+    requests_mock.post("https://example.com/api/v2/model/test_id/files/upload/simple", json=simple_upload)
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/files",
+        json={"files": [{"id": "other_id", "size": 4, "tags": ["sha256:other"]}]},
+    )
+    patch = requests_mock.patch(
+        "https://example.com/api/v2/model/test_id/file/file_id", json={"file": {"id": "file_id"}}
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    release.upload("test.bin", BytesIO(b"0123456789"), multipart_threshold=multipart_threshold, deduplicate=True)
+
+    digest = hashlib.sha256(b"0123456789").hexdigest()
+    assert patch.last_request.json() == {"tags": [f"sha256:{digest}"]}
+    assert release._file_digests()[digest]["id"] == "file_id"
+
+
+def test_upload_multipart_retries_failed_part(requests_mock, mocker):
+    sleep = mocker.patch("bailo.helper.release.time.sleep")
+    _mock_multipart(
+        requests_mock,
+        [{"status_code": 503, "text": "Service Unavailable"}, {"json": {"ETag": "etag"}}],
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    assert release.upload("test.bin", BytesIO(b"0123456789"), multipart_threshold=1, max_workers=1) == "file_id"
+    assert sleep.call_count == 1
+    assert len([req for req in requests_mock.request_history if req.path.endswith("/part")]) == 4
+
+
+def test_upload_multipart_does_not_retry_client_error(requests_mock, mocker):
+    mocker.patch("bailo.helper.release.time.sleep")
+    _mock_multipart(requests_mock, [{"status_code": 400, "json": {"error": {"message": "Bad part"}}}])
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with pytest.raises(BailoException):
+        release.upload("test.bin", BytesIO(b"0123456789"), multipart_threshold=1, max_workers=1)
+
+    assert not any(req.path.endswith("/finish") for req in requests_mock.request_history)
+
+
+def test_upload_multipart_resumes_from_journal(requests_mock, mocker, tmp_path):
+    mocker.patch("bailo.helper.release.time.sleep")
+    _mock_multipart(
+        requests_mock,
+        [{"json": {"ETag": "etag-1"}}, {"json": {"ETag": "etag-2"}}, {"status_code": 503, "text": "Unavailable"}],
+    )
+    source = tmp_path / "test.bin"
+    source.write_bytes(b"0123456789")
+    journal_dir = tmp_path / "journal"
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with pytest.raises(ResponseException):
+        release.upload(str(source), multipart_threshold=1, max_workers=1, journal_dir=str(journal_dir))
+    assert len(list(journal_dir.iterdir())) == 1
+
+    requests_mock.reset_mock()
+    requests_mock.post("https://example.com/api/v2/model/test_id/files/upload/multipart/part", json={"ETag": "etag-3"})
+    assert release.upload(str(source), multipart_threshold=1, journal_dir=str(journal_dir)) == "file_id"
+
+    paths = [req.path for req in requests_mock.request_history]
+    assert not any(path.endswith("/start") for path in paths)
+    assert [req.body for req in requests_mock.request_history if req.path.endswith("/part")] == [b"89"]
+    finish = [req for req in requests_mock.request_history if req.path.endswith("/finish")][0].json()
+    assert finish["parts"] == [{"ETag": f"etag-{i}", "PartNumber": i} for i in (1, 2, 3)]
+    assert not list(journal_dir.iterdir())
+
+
+def test_upload_multipart_restarts_rejected_resume(requests_mock, mocker, tmp_path):
+    mocker.patch("bailo.helper.release.time.sleep")
+    _mock_multipart(requests_mock, [{"status_code": 503, "text": "Unavailable"}])
+    source = tmp_path / "test.bin"
+    source.write_bytes(b"0123456789")
+    journal_dir = tmp_path / "journal"
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with pytest.raises(ResponseException):
+        release.upload(str(source), multipart_threshold=1, max_workers=1, journal_dir=str(journal_dir))
+    assert len(list(journal_dir.iterdir())) == 1
+
+    # the resumed upload has no accepted parts, and has expired on the server
+    requests_mock.reset_mock()
+    requests_mock.post(
+        "https://example.com/api/v2/model/test_id/files/upload/multipart/part",
+        [{"status_code": 404, "json": {"error": {"message": "Upload not found"}}}, {"json": {"ETag": "etag"}}],
+    )
+    assert release.upload(str(source), multipart_threshold=1, max_workers=1, journal_dir=str(journal_dir)) == "file_id"
+
+    paths = [req.path for req in requests_mock.request_history]
+    assert len([path for path in paths if path.endswith("/start")]) == 1
+    assert any(path.endswith("/finish") for path in paths)
+    assert not list(journal_dir.iterdir())
+
+
+def test_upload_multipart_ignores_stale_journal(requests_mock, tmp_path):
+    _mock_multipart(requests_mock, [{"json": {"ETag": "etag"}}])
+    source = tmp_path / "test.bin"
+    source.write_bytes(b"0123456789")
+    journal_dir = tmp_path / "journal"
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    journal = _UploadJournal(str(journal_dir), "test_id", "test.bin", str(source))
+    journal.start({"fileId": "old", "uploadId": "old", "chunks": []})
+    source.write_bytes(b"9876543210!")
+
+    assert release.upload(str(source), multipart_threshold=1, journal_dir=str(journal_dir)) == "file_id"
+    assert any(req.path.endswith("/start") for req in requests_mock.request_history)
+
+
+def _mock_release_files(requests_mock, names):
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0",
+        json={"release": {"files": [{"name": name, "size": len(name)} for name in names]}},
+    )
+
+
+def test_download_all_concurrently(requests_mock, tmp_path):
+    names = [f"file-{i}.txt" for i in range(8)]
+    _mock_release_files(requests_mock, names)
+    for name in names:
+        requests_mock.get(
+            f"https://example.com/api/v2/model/test_id/release/1.0.0/file/{name}/download", content=name.encode()
+        )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    release.download_all(path=str(tmp_path), exclude="file-7.txt", max_workers=4)
+
+    assert sorted(os.listdir(tmp_path)) == names[:-1]
+    assert all((tmp_path / name).read_bytes() == name.encode() for name in names[:-1])
+
+
+def test_download_all_concurrently_raises_first_failure(requests_mock, tmp_path):
+    names = ["good.txt", "missing.txt"]
+    _mock_release_files(requests_mock, names)
+    requests_mock.get("https://example.com/api/v2/model/test_id/release/1.0.0/file/good.txt/download", content=b"ok")
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/missing.txt/download",
+        status_code=404,
+        json={"error": {"message": "File not found"}},
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+
+    with pytest.raises(BailoException, match="File not found"):
+        release.download_all(path=str(tmp_path), max_workers=2)
+
+
+def _ranged_content(data: bytes, etag: str = "etag", if_range: bool = True):
+    def callback(request, context):
+        context.headers["ETag"] = etag
+        range_header = request.headers.get("Range")
+        if range_header is None or (if_range and request.headers.get("If-Range", etag) != etag):
+            return data
+        start, end = (int(offset) if offset else None for offset in range_header[len("bytes=") :].split("-"))
+        end = len(data) - 1 if end is None else min(end, len(data) - 1)
+        context.status_code = 206
+        context.headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+        return data[start : end + 1]
+
+    return callback
+
+
+def test_download_segmented(requests_mock, tmp_path):
+    data = bytes(range(256)) * 40
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        content=_ranged_content(data),
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+
+    release.download("weights.bin", path=str(path), max_workers=4, segment_size=1000)
+
+    assert path.read_bytes() == data
+    ranges = sorted(req.headers["Range"] for req in requests_mock.request_history)
+    assert len(ranges) == 11
+    assert "bytes=10000-10239" in ranges
+
+
+@pytest.mark.parametrize("if_range", [True, False])
+def test_download_segmented_aborts_if_file_changes(requests_mock, tmp_path, if_range):
+    data = bytes(range(256)) * 40
+    old = _ranged_content(data, etag="old-etag", if_range=if_range)
+    new = _ranged_content(data[::-1], etag="new-etag", if_range=if_range)
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        content=lambda request, context: (old if request.headers["Range"] == "bytes=0-999" else new)(request, context),
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+
+    with pytest.raises(ResponseException):
+        release.download("weights.bin", path=str(path), max_workers=4, segment_size=1000)
+
+    assert not path.exists()
+    assert not (tmp_path / "weights.bin.part").exists()
+    assert {req.headers.get("If-Range") for req in requests_mock.request_history[1:]} == {"old-etag"}
+
+
+def test_download_segmented_falls_back_without_range_support(requests_mock, tmp_path):
+    data = b"0123456789" * 300
+    requests_mock.get("https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download", content=data)
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+
+    release.download("weights.bin", path=str(path), max_workers=4, segment_size=1000)
+
+    assert path.read_bytes() == data
+    assert requests_mock.call_count == 1
+
+
+def test_download_resumes_part_file(requests_mock, tmp_path):
+    data = bytes(range(256)) * 4
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        content=_ranged_content(data),
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+    (tmp_path / "weights.bin.part").write_bytes(data[:100])
+    (tmp_path / "weights.bin.part.etag").write_text("etag")
+
+    release.download("weights.bin", path=str(path))
+
+    assert path.read_bytes() == data
+    assert not (tmp_path / "weights.bin.part").exists()
+    assert not (tmp_path / "weights.bin.part.etag").exists()
+    assert requests_mock.last_request.headers["Range"] == "bytes=100-"
+    assert requests_mock.last_request.headers["If-Range"] == "etag"
+
+
+@pytest.mark.parametrize("if_range", [True, False])
+@pytest.mark.parametrize("saved_etag", ["old-etag", None])
+def test_download_does_not_reuse_stale_part_file(requests_mock, tmp_path, if_range, saved_etag):
+    data = bytes(range(256)) * 4
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        content=_ranged_content(data, etag="new-etag", if_range=if_range),
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+    # left by an older revision of the file, or another file downloaded to the same path
+    (tmp_path / "weights.bin.part").write_bytes(b"x" * 100)
+    if saved_etag is not None:
+        (tmp_path / "weights.bin.part.etag").write_text(saved_etag)
+
+    release.download("weights.bin", path=str(path))
+
+    assert path.read_bytes() == data
+    assert not (tmp_path / "weights.bin.part.etag").exists()
+
+
+def test_download_restarts_stale_part_file(requests_mock, tmp_path):
+    data = b"0123456789"
+    url = "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download"
+    requests_mock.get(url, request_headers={"Range": "bytes=20-"}, status_code=416, json={"error": {"message": "Bad"}})
+    requests_mock.get(url, content=data)
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+    (tmp_path / "weights.bin.part").write_bytes(b"x" * 20)
+    (tmp_path / "weights.bin.part.etag").write_text("etag")
+
+    release.download("weights.bin", path=str(path))
+
+    assert path.read_bytes() == data
+
+
+def test_download_keeps_part_file_on_server_error(requests_mock, tmp_path):
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        status_code=503,
+        text="Service Unavailable",
+    )
+    release = Release(Client("https://example.com", Agent(retry=RetryPolicy(max_attempts=1))), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+    (tmp_path / "weights.bin.part").write_bytes(b"x" * 500)
+    (tmp_path / "weights.bin.part.etag").write_text("etag")
+
+    with pytest.raises(ResponseException, match="503"):
+        release.download("weights.bin", path=str(path))
+
+    assert requests_mock.call_count == 1
+    assert (tmp_path / "weights.bin.part").read_bytes() == b"x" * 500
+    assert (tmp_path / "weights.bin.part.etag").read_text() == "etag"
+
+
+def test_download_incomplete_keeps_part_file(requests_mock, tmp_path):
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        content=b"01234",
+        headers={"Content-Length": "10"},
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+
+    with pytest.raises(ResponseException):
+        release.download("weights.bin", path=str(path))
+
+    assert not path.exists()
+    assert (tmp_path / "weights.bin.part").read_bytes() == b"01234"
+
+
+def test_download_verifies_digest(requests_mock, tmp_path):
+    data = b"0123456789"
+    requests_mock.get(
+        "https://example.com/api/v2/model/test_id/release/1.0.0/file/weights.bin/download",
+        content=data,
+        headers={"Repr-Digest": f"sha-256=:{base64.b64encode(hashlib.sha256(b'other').digest()).decode()}:"},
+    )
+    release = Release(Client("https://example.com"), "test_id", "1.0.0", 1)
+    path = tmp_path / "weights.bin"
+
+    with pytest.raises(ResponseException, match="digest"):
+        release.download("weights.bin", path=str(path))
+
+    assert not path.exists()
+    assert not (tmp_path / "weights.bin.part").exists()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import requests
+
+# isort: split
+
+from bailo import Agent, Client, ResponseCache
+
+MODEL_URL = "https://example.com/api/v2/model/test_id"
+
+
+def test_fresh_response_served_from_cache(requests_mock):
+    requests_mock.get(MODEL_URL, json={"model": {"id": "test_id"}})
+    client = Client("https://example.com", cache=ResponseCache())
+
+    first = client.get_model("test_id")
+    first["model"]["id"] = "changed"
+
+    assert client.get_model("test_id") == {"model": {"id": "test_id"}}
+    assert requests_mock.call_count == 1
+
+
+def test_stale_response_revalidated(requests_mock):
+    requests_mock.get(
+        MODEL_URL,
+        [{"json": {"model": {"id": "test_id"}}, "headers": {"ETag": 'W/"v1"'}}, {"status_code": 304}],
+    )
+    client = Client("https://example.com", cache=ResponseCache(ttl=0))
+
+    client.get_model("test_id")
+
+    assert client.get_model("test_id") == {"model": {"id": "test_id"}}
+    assert requests_mock.last_request.headers["If-None-Match"] == 'W/"v1"'
+
+
+def test_mutation_invalidates_model(requests_mock):
+    requests_mock.get(MODEL_URL, json={"model": {"id": "test_id"}})
+    requests_mock.get("https://example.com/api/v2/roles?modelId=test_id", json={"roles": []})
+    requests_mock.get("https://example.com/api/v2/schema/schema_id", json={"schema": {}})
+    requests_mock.patch(MODEL_URL, json={"model": {"id": "test_id"}})
+    cache = ResponseCache()
+    client = Client("https://example.com", cache=cache)
+    client.get_model("test_id")
+    client.get_model_roles("test_id")
+    client.get_schema("schema_id")
+
+    client.patch_model("test_id", name="new name")
+
+    assert len(cache) == 1
+    client.get_model("test_id")
+    assert requests_mock.last_request.method == "GET"
+
+
+def test_least_recently_used_evicted(requests_mock):
+    for schema_id in ("a", "b", "c"):
+        requests_mock.get(f"https://example.com/api/v2/schema/{schema_id}", json={"schema": {"id": schema_id}})
+    client = Client("https://example.com", cache=ResponseCache(max_entries=2))
+    client.get_schema("a")
+    client.get_schema("b")
+    client.get_schema("a")
+
+    client.get_schema("c")
+    requests_mock.reset_mock()
+    client.get_schema("a")
+    client.get_schema("b")
+
+    assert [req.path for req in requests_mock.request_history] == ["/api/v2/schema/b"]
+
+
+def test_clients_sharing_agent_register_cache_once():
+    agent = Agent()
+    cache = ResponseCache()
+
+    Client("https://example.com", agent, cache=cache)
+    Client("https://example.com", agent, cache=cache)
+
+    assert agent.observers == [cache]
+
+
+def test_agent_without_observers(requests_mock):
+    class LegacyAgent:
+        def get(self, *args, **kwargs):
+            return requests.get(*args, **kwargs)
+
+    requests_mock.get(MODEL_URL, json={"model": {"id": "test_id"}})
+    client = Client("https://example.com", LegacyAgent(), cache=ResponseCache())  # type: ignore[reportArgumentType]
+
+    assert client.get_model("test_id") == {"model": {"id": "test_id"}}
+    assert client.get_model("test_id") == {"model": {"id": "test_id"}}
+    assert requests_mock.call_count == 1
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# isort: split
+
+from bailo import Client
+from bailo.core.single_flight import SingleFlight
+
+
+def test_concurrent_identical_gets_coalesced(requests_mock):
+    def slow_model(request, context):
+        time.sleep(0.2)
+        return {"model": {"id": "test_id"}}
+
+    requests_mock.get("https://example.com/api/v2/model/test_id", json=slow_model)
+    client = Client("https://example.com")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_model("test_id"), range(8)))
+
+    assert requests_mock.call_count == 1
+    assert all(result == {"model": {"id": "test_id"}} for result in results)
+    # every caller gets its own copy
+    assert len({id(result) for result in results}) == 8
+
+
+def test_coalescing_disabled(requests_mock):
+    requests_mock.get("https://example.com/api/v2/schema/test_id", json={"schema": {}})
+    client = Client("https://example.com", coalesce=False)
+
+    client.get_schema("test_id")
+    client.get_schema("test_id")
+
+    assert requests_mock.call_count == 2
+
+
+def test_error_shared_with_waiters():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", fail)
+        started.wait()
+        waiter = executor.submit(single_flight.do, "key", fail)
+        time.sleep(0.05)
+        release.set()
+
+        for future in (leader, waiter):
+            with pytest.raises(ValueError):
+                future.result()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import zipfile
+from io import BytesIO
+
+import requests
+
+# isort: split
+
+from bailo.core.streaming import ProgressReader, ThrottledProgress, iter_response, iter_zip
+
+
+def test_iter_response_reuses_buffer(requests_mock):
+    requests_mock.get("https://example.com/file", content=b"x" * 10_000)
+    res = requests.get("https://example.com/file", stream=True)
+
+    chunks = [(chunk.obj, bytes(chunk)) for chunk in iter_response(res, buffer_size=4096)]
+
+    assert b"".join(data for _, data in chunks) == b"x" * 10_000
+    assert [len(data) for _, data in chunks] == [4096, 4096, 1808]
+    assert len({id(buffer) for buffer, _ in chunks}) == 1
+
+
+def test_iter_response_decodes_compressed_body(requests_mock):
+    requests_mock.get("https://example.com/file", content=b"data", headers={"Content-Encoding": "gzip"})
+    res = requests.get("https://example.com/file", stream=True)
+    res.iter_content = lambda chunk_size: iter([b"decoded"])
+
+    assert [bytes(chunk) for chunk in iter_response(res)] == [b"decoded"]
+
+
+def test_throttled_progress_batches_updates():
+    updates = []
+    progress = ThrottledProgress(updates.append, interval=60)
+
+    for _ in range(100):
+        progress(10)
+    progress.flush()
+
+    assert updates == [1000]
+
+
+def test_progress_reader_widens_reads():
+    updates = []
+    reader = ProgressReader(BytesIO(b"x" * 100), updates.append, buffer_size=64)
+
+    assert len(reader.read(16)) == 64
+    assert len(reader.read(16)) == 36
+    assert reader.read(16) == b""
+    assert sum(updates) == 100
+    # other attributes pass through, so the body length can be found
+    assert reader.tell() == 100
+
+
+def test_iter_zip_round_trip(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"a" * 5000)
+    (tmp_path / "b.bin").write_bytes(b"b" * 5000)
+    read = []
+
+    archive = zipfile.ZipFile(BytesIO(b"".join(iter_zip(str(tmp_path), ["*.bin"], 1024, read.append))))
+
+    assert archive.testzip() is None
+    assert archive.read("a.txt") == b"a" * 5000
+    assert archive.getinfo("a.txt").compress_type == zipfile.ZIP_DEFLATED
+    assert archive.getinfo("b.bin").compress_type == zipfile.ZIP_STORED
+    assert sum(read) == 10_000